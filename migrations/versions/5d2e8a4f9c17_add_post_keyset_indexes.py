@@ -0,0 +1,45 @@
+"""add post keyset indexes
+
+Revision ID: 5d2e8a4f9c17
+Revises: ea782146f115
+Create Date: 2026-10-17 14:21:07.418362
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2e8a4f9c17"
+down_revision: Union[str, Sequence[str], None] = "ea782146f115"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Cursor pagination on the recent and active listings compares
+    # (timestamp, id) row values and orders by both; these indexes let
+    # Postgres seek to the cursor and read one page instead of scanning
+    # every skipped row. idx_posts_recent supersedes idx_posts_created_at
+    op.execute("""
+        CREATE INDEX idx_posts_recent
+        ON posts(created_at DESC, id DESC)
+    """)
+    op.execute("""
+        CREATE INDEX idx_posts_active
+        ON posts(comments_updated_at DESC, id DESC)
+    """)
+    op.execute("DROP INDEX IF EXISTS idx_posts_created_at")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("""
+        CREATE INDEX idx_posts_created_at
+        ON posts(created_at DESC)
+    """)
+    op.execute("DROP INDEX IF EXISTS idx_posts_active")
+    op.execute("DROP INDEX IF EXISTS idx_posts_recent")
@@ -0,0 +1,51 @@
+"""add generate_unique_slug function
+
+Revision ID: ea782146f115
+Revises: 22508ec55b22
+Create Date: 2026-10-17 10:12:44.318207
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "ea782146f115"
+down_revision: Union[str, Sequence[str], None] = "22508ec55b22"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Resolve slug collisions inside the database so post creation needs a single
+    # round-trip however many suffixes are taken. Mirrors the suffix rules used by
+    # PostService: truncate the base so base + "-N" fits in max_len, and never
+    # leave a hyphen before the suffix (posts_slug_format_check forbids "--").
+    # Checks ALL posts (including deleted) because slugs are globally unique.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION generate_unique_slug(base TEXT, max_len INT)
+        RETURNS TEXT AS $$
+        DECLARE
+            candidate TEXT := base;
+            counter INT := 1;
+        BEGIN
+            WHILE EXISTS (SELECT 1 FROM posts WHERE posts.slug = candidate) LOOP
+                candidate := rtrim(
+                    substring(base from 1 for max_len - length('-' || counter::text)),
+                    '-'
+                ) || '-' || counter;
+                counter := counter + 1;
+            END LOOP;
+
+            RETURN candidate;
+        END;
+        $$ LANGUAGE plpgsql STABLE
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP FUNCTION IF EXISTS generate_unique_slug(TEXT, INT)")
@@ -6,7 +6,7 @@ from uuid import UUID
 from pydantic import BaseModel
 
 from talk.domain.service import CommentService, JWTService, VoteService
-from talk.domain.value import PostId, UserId
+from talk.domain.value import CommentId, PostId, UserId
 from talk.domain.value.types import Handle
 
 
@@ -83,7 +83,7 @@ class GetCommentsUseCase:
         )
 
         # Check which comments the user has voted on (if authenticated)
-        user_votes: dict[str, bool] = {}
+        voted_comment_ids: set[CommentId] = set()
         if request.auth_token and comments:
             try:
                 # Verify token to get user ID
@@ -92,14 +92,10 @@ class GetCommentsUseCase:
 
                 # Batch query for all votes
                 comment_ids = [comment.id for comment in comments]
-                votes_map = await self.vote_service.get_user_votes_for_comments(
+                voted_comment_ids = await self.vote_service.get_user_votes_for_comments(
                     user_id=user_id,
                     comment_ids=comment_ids,
                 )
-                # Convert CommentId keys to string keys for easy lookup
-                user_votes = {
-                    str(cid): has_voted for cid, has_voted in votes_map.items()
-                }
             except Exception:
                 # Invalid or expired token - treat as unauthenticated
                 pass
@@ -118,7 +114,7 @@ class GetCommentsUseCase:
                 points=comment.points,
                 created_at=comment.created_at,
                 content_updated_at=comment.content_updated_at,
-                has_voted=user_votes.get(str(comment.id), False),
+                has_voted=comment.id in voted_comment_ids,
             )
             for comment in comments
         ]
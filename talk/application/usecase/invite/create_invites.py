@@ -155,13 +155,10 @@ class CreateInvitesUseCase(BaseUseCase):
                         invitee.provider, invitee.handle
                     )
 
-                    # Check if identity already exists
-                    existing_identity = (
-                        await self.user_identity_service.get_identity_by_provider(
-                            invitee.provider, provider_user_id
-                        )
-                    )
-                    if existing_identity:
+                    # Check if identity already exists (EXISTS query, no row fetch)
+                    if await self.user_identity_service.identity_exists(
+                        invitee.provider, provider_user_id
+                    ):
                         failed_invitees.append(
                             f"{invitee.provider.value}:{invitee.handle}"
                         )
@@ -1,5 +1,7 @@
 """List posts use case."""
 
+import base64
+import binascii
 import logfire
 from datetime import datetime
 from uuid import UUID
@@ -8,7 +10,7 @@ from pydantic import BaseModel, Field
 
 from talk.domain.repository import VoteRepository
 from talk.domain.repository.post import PostRepository, PostSortOrder
-from talk.domain.value import TagName, UserId, VotableType
+from talk.domain.value import PostId, TagName, UserId, VotableType
 from talk.domain.value.types import Handle
 
 
@@ -36,7 +38,8 @@ class ListPostsRequest(BaseModel):
     sort: PostSortOrder = PostSortOrder.RECENT
     tag: str | None = None  # Filter by tag name
     limit: int = Field(default=30, ge=1, le=100)
-    offset: int = Field(default=0, ge=0)
+    offset: int = Field(default=0, ge=0)  # Deprecated, use cursor
+    cursor: str | None = None  # next_cursor from the previous page
     user_id: str | None = None  # Current user ID (if authenticated)
 
 
@@ -47,6 +50,31 @@ class ListPostsResponse(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: str | None = None  # None on the last page and for hot sort
+
+
+# Sort orders with a stable (timestamp, id) key, i.e. cursor support
+_KEYSET_SORTS = frozenset({PostSortOrder.RECENT, PostSortOrder.ACTIVE})
+
+
+def _encode_cursor(sort_key: datetime, post_id: PostId) -> str:
+    """Encode a keyset position as an opaque URL-safe cursor."""
+    raw = f"{sort_key.isoformat()},{post_id}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, PostId]:
+    """Decode a cursor produced by _encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        sort_key, post_id = raw.split(",")
+        return datetime.fromisoformat(sort_key), PostId(UUID(post_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid cursor") from None
 
 
 class ListPostsUseCase:
@@ -67,11 +95,19 @@ class ListPostsUseCase:
     async def execute(self, request: ListPostsRequest) -> ListPostsResponse:
         """Execute list posts flow.
 
+        Recent and active listings page by cursor: pass the previous page's
+        next_cursor to continue after its last post. Offset paging still
+        works for every sort but costs a scan of all skipped rows.
+
         Args:
             request: List posts request with filters and pagination
 
         Returns:
             List of posts matching criteria
+
+        Raises:
+            ValueError: If the cursor is malformed, combined with an offset,
+                or used with hot sort
         """
         with logfire.span(
             "list_posts.execute",
@@ -79,7 +115,18 @@ class ListPostsUseCase:
             tag=request.tag,
             limit=request.limit,
             offset=request.offset,
+            cursor=request.cursor is not None,
         ):
+            after = None
+            if request.cursor is not None:
+                if request.sort not in _KEYSET_SORTS:
+                    raise ValueError(
+                        f"Cursor pagination is not supported for {request.sort.value} sort"
+                    )
+                if request.offset:
+                    raise ValueError("Use either cursor or offset, not both")
+                after = _decode_cursor(request.cursor)
+
             # Convert tag string to TagName if provided
             tag_filter = TagName(request.tag) if request.tag else None
 
@@ -96,28 +143,27 @@ class ListPostsUseCase:
                 include_deleted=False,  # Never show deleted posts
                 limit=request.limit,
                 offset=request.offset,
+                after=after,
             )
 
             # Get user's votes for these posts (if authenticated)
             # Use batch query to avoid N+1 problem
-            user_votes = {}
+            voted_post_ids: set[PostId] = set()
             if request.user_id and posts:
                 user_id = UserId(UUID(request.user_id))
                 post_ids = [post.id for post in posts]
-                votes = await self.vote_repository.find_by_user_and_votables(
+                voted_ids = await self.vote_repository.find_voted_ids(
                     user_id=user_id,
                     votable_type=VotableType.POST,
                     votable_ids=post_ids,
                 )
-                # Create a set of post IDs that the user has voted on
-                voted_post_ids = {str(vote.votable_id) for vote in votes}
-                user_votes = {
-                    str(post.id): str(post.id) in voted_post_ids for post in posts
-                }
+                # Set of post IDs that the user has voted on
+                voted_post_ids = {PostId(voted_id) for voted_id in voted_ids}
 
-            # Convert to response items
+            # Convert to response items; fields come straight from validated
+            # Post models, so skip re-validating up to limit items
             post_items = [
-                PostListItem(
+                PostListItem.model_construct(
                     post_id=str(post.id),
                     slug=str(post.slug),
                     title=post.title,
@@ -130,11 +176,22 @@ class ListPostsUseCase:
                     created_at=post.created_at,
                     comments_updated_at=post.comments_updated_at,
                     content_updated_at=post.content_updated_at,
-                    has_voted=user_votes.get(str(post.id), False),
+                    has_voted=post.id in voted_post_ids,
                 )
                 for post in posts
             ]
 
+            # A full page may have more after it; hand out its last position
+            next_cursor = None
+            if request.sort in _KEYSET_SORTS and len(posts) == request.limit:
+                last = posts[-1]
+                next_cursor = _encode_cursor(
+                    last.created_at
+                    if request.sort == PostSortOrder.RECENT
+                    else last.comments_updated_at,
+                    last.id,
+                )
+
             logfire.info("Posts listed", count=len(post_items), total=total)
 
             return ListPostsResponse(
@@ -142,4 +199,5 @@ class ListPostsUseCase:
                 total=total,
                 limit=request.limit,
                 offset=request.offset,
+                next_cursor=next_cursor,
             )
@@ -62,9 +62,10 @@ class ListTagsUseCase:
                 order_by=request.order_by,
             )
 
-            # Convert to response items
+            # Convert to response items; fields come straight from validated
+            # Tag models, so skip re-validating each item
             tag_items = [
-                TagItem(
+                TagItem.model_construct(
                     name=tag.name.root,
                     description=tag.description,
                     type=tag.type,
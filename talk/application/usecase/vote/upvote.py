@@ -23,7 +23,7 @@ class UpvoteResponse(BaseModel):
     vote_id: str
     votable_type: VotableType
     votable_id: str
-    created_at: datetime
+    created_at: datetime | None
 
 
 class UpvoteUseCase:
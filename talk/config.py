@@ -1,5 +1,6 @@
 """Application configuration."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 from pydantic import BaseModel, computed_field, model_validator
@@ -13,6 +14,11 @@ class DatabaseSettings(BaseModel):
     pool_size: int = 5
     max_overflow: int = 10
 
+    # Per-connection asyncpg prepared statement cache; repositories build their
+    # SQL from static constructs so repeated queries hit the cache
+    # Can be set via DATABASE__STATEMENT_CACHE_SIZE env var
+    statement_cache_size: int = 100
+
 
 class BlueskyOAuthSettings(BaseModel):
     """Bluesky/AT Protocol OAuth configuration."""
@@ -117,6 +123,10 @@ class ObservabilitySettings(BaseModel):
     # If None, will auto-determine: sends if token is present, otherwise console-only
     send_to_logfire: bool | None = None
 
+    # Whether domain services open their own spans (request/SQL spans are unaffected)
+    # Can be set via OBSERVABILITY__SERVICE_SPANS env var
+    service_spans: bool = True
+
 
 class RankingSettings(BaseModel):
     """Content ranking configuration."""
@@ -231,3 +241,16 @@ class Settings(BaseSettings):
     def database_url(self) -> str:
         """Backwards compatibility for database_url."""
         return self.database.url
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings from the environment once per process.
+
+    Shared by app startup and the DI container so the environment and .env
+    file are parsed a single time.
+
+    Returns:
+        Application settings
+    """
+    return Settings()
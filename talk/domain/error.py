@@ -23,6 +23,7 @@ class NotAuthorizedError(DomainError):
     """Raised when a user attempts to edit content they don't own."""
 
     def __init__(self, resource: str, resource_id: str, user_id: str):
+        self.resource = resource
         super().__init__(
             f"User {user_id} is not authorized to edit {resource} {resource_id}"
         )
@@ -32,6 +33,7 @@ class ContentDeletedException(DomainError):
     """Raised when attempting to edit deleted content."""
 
     def __init__(self, resource: str, resource_id: str):
+        self.resource = resource
         super().__init__(f"Cannot edit deleted {resource} {resource_id}")
 
 
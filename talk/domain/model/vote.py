@@ -7,8 +7,6 @@ Each user can cast one vote per item (post or comment).
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import Field
-
 from talk.domain.model.common import DomainModel
 from talk.domain.value import UserId, VotableType, VoteId, VoteType
 
@@ -21,6 +19,8 @@ class Vote(DomainModel):
     - One vote per user per item (enforced by database unique constraint)
     - Only upvotes (no downvotes) to encourage positive engagement
     - Polymorphic reference to votable (post or comment)
+
+    created_at is assigned by the database when the vote is inserted.
     """
 
     id: VoteId
@@ -28,4 +28,4 @@ class Vote(DomainModel):
     votable_type: VotableType
     votable_id: UUID  # PostId or CommentId (both are UUIDs)
     vote_type: VoteType = VoteType.UP
-    created_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime | None = None  # Set by the database on insert
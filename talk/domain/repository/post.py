@@ -1,6 +1,7 @@
 """Post repository interface."""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
@@ -36,6 +37,18 @@ class PostRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def find_by_ids(self, post_ids: List[PostId]) -> dict[PostId, Post]:
+        """Find several posts by ID in a single query.
+
+        Args:
+            post_ids: Post IDs to load
+
+        Returns:
+            Dict mapping post ID to post; IDs that don't exist are omitted
+        """
+        pass
+
     @abstractmethod
     async def find_by_slug(self, slug: Slug) -> Optional[Post]:
         """Find a post by slug.
@@ -49,14 +62,19 @@ class PostRepository(ABC):
         pass
 
     @abstractmethod
-    async def slug_exists(self, slug: Slug) -> bool:
-        """Check if a slug is already in use by a non-deleted post.
+    async def generate_unique_slug(self, base: str, max_len: int = 100) -> str:
+        """Find the first free slug for a base slug, in a single round-trip.
+
+        Returns base if it is free, otherwise base-1, base-2, ... with base
+        truncated (and trailing hyphens dropped) so the result fits max_len.
+        Checks all posts, including deleted ones.
 
         Args:
-            slug: The slug to check
+            base: Slugified title
+            max_len: Maximum slug length
 
         Returns:
-            True if slug exists, False otherwise
+            Unused slug string
         """
         pass
 
@@ -68,15 +86,25 @@ class PostRepository(ABC):
         include_deleted: bool = False,
         limit: int = 30,
         offset: int = 0,
+        after: Optional[tuple[datetime, PostId]] = None,
     ) -> List[Post]:
         """Find posts with filtering and pagination.
 
+        RECENT and ACTIVE order by their timestamp, then ID, both descending,
+        so (timestamp, ID) of the last post on a page is a stable keyset
+        position for the next page.
+
         Args:
             sort: Sort order (recent or active)
             tag: Filter by tag name (None for all tags)
             include_deleted: Whether to include soft-deleted posts
             limit: Maximum number of posts to return
             offset: Number of posts to skip
+            after: Keyset position; only posts sorting after this
+                (sort timestamp, ID) pair are returned. Not supported for HOT
+
+        Raises:
+            ValueError: If after is given for HOT sort
 
         Returns:
             List of posts matching the criteria
@@ -168,6 +196,21 @@ class PostRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def increment_comment_count(self, post_id: PostId) -> bool:
+        """Atomically increment comment count and touch comments_updated_at.
+
+        Uses a single SQL-level UPDATE ... RETURNING to avoid a read-modify-write
+        race between concurrent comments. The post is not read back.
+
+        Args:
+            post_id: The post ID
+
+        Returns:
+            True if the post was updated, False if it does not exist
+        """
+        pass
+
     @abstractmethod
     async def update_text(self, post_id: PostId, text: str | None) -> Optional[Post]:
         """Update the text content of a post.
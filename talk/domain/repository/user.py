@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 from typing import Optional
 
+from talk.domain.error import NotFoundError
 from talk.domain.model.user import User
 from talk.domain.value import AuthProvider, UserId
 from talk.domain.value.types import Handle
@@ -27,6 +28,38 @@ class UserRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def tree_version(self) -> tuple[int, int]:
+        """Get a cheap fingerprint of the invitation tree's shape.
+
+        Changes whenever a user joins or an invite is accepted, so a cached
+        tree can be reused while it stays the same. Karma is not covered.
+
+        Returns:
+            Tuple of (user count, accepted invite count)
+        """
+        pass
+
+    async def find_by_id_or_raise(self, user_id: UserId) -> User:
+        """Find a user by ID, raising if missing.
+
+        Issues the same query as find_by_id; for callers that treat a missing
+        user as an error (e.g. the author of an authenticated request).
+
+        Args:
+            user_id: The user's unique identifier
+
+        Returns:
+            The user
+
+        Raises:
+            NotFoundError: If no user has this ID
+        """
+        user = await self.find_by_id(user_id)
+        if user is None:
+            raise NotFoundError("User", str(user_id))
+        return user
+
     @abstractmethod
     async def find_by_handle(self, handle: Handle) -> Optional[User]:
         """Find a user by their handle.
@@ -115,3 +148,21 @@ class UserRepository(ABC):
             If include_karma=False, karma will be None for all users.
         """
         pass
+
+    @abstractmethod
+    async def find_all_for_tree_with_parents(
+        self, include_karma: bool = True
+    ) -> list[tuple[UserId, Handle, int | None, UserId | None]]:
+        """Find all users with their inviter in a single query.
+
+        Like find_all_for_tree, but joins each user to the accepted invite
+        that brought them in, so the invitation tree needs one round-trip.
+
+        Args:
+            include_karma: Whether to include karma in results (default: True).
+
+        Returns:
+            List of (user_id, handle, karma, parent_id) tuples.
+            parent_id is None for root users (no accepted invite).
+        """
+        pass
@@ -92,6 +92,9 @@ class UserIdentityRepository(ABC):
     ) -> bool:
         """Check if an identity exists for the given provider and ID.
 
+        Implementations must answer with a boolean-only query (e.g.
+        SELECT EXISTS(...)) rather than loading the identity row.
+
         Args:
             provider: The authentication provider
             provider_user_id: The user's ID on that provider
@@ -2,6 +2,7 @@
 
 from abc import ABC, abstractmethod
 from typing import List, Optional, Sequence, Union
+from uuid import UUID
 
 from talk.domain.model.vote import Vote
 from talk.domain.value import CommentId, PostId, UserId, VotableType, VoteId
@@ -12,6 +13,11 @@ class VoteRepository(ABC):
 
     Defines the contract for vote persistence operations.
     Implementations live in the infrastructure layer.
+
+    The write methods may relax durability for the whole surrounding
+    transaction (the PostgreSQL implementation commits asynchronously), so
+    call them only from units of work whose other writes can be lost on a
+    crash as well.
     """
 
     @abstractmethod
@@ -68,13 +74,34 @@ class VoteRepository(ABC):
             vote: The vote to save
 
         Returns:
-            The saved vote
+            The saved vote with its database-assigned created_at
 
         Raises:
             IntegrityError: If vote already exists (duplicate)
         """
         pass
 
+    @abstractmethod
+    async def save_and_bump(self, vote: Vote) -> Vote | None:
+        """Save a vote and bump the item's points and its author's karma.
+
+        The existence check, the insert, the points increment and the karma
+        increment run as a single statement, so none can be applied without
+        the others. A duplicate vote is not an error: nothing is written and
+        None is returned.
+
+        Args:
+            vote: The vote to save
+
+        Returns:
+            The saved vote with its database-assigned created_at, or None if
+            the user already voted on the item
+
+        Raises:
+            NotFoundError: If the voted post or comment does not exist
+        """
+        pass
+
     @abstractmethod
     async def delete(self, vote_id: VoteId) -> None:
         """Delete a vote.
@@ -105,6 +132,27 @@ class VoteRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def delete_and_decrement(
+        self,
+        user_id: UserId,
+        votable_type: VotableType,
+        votable_id: Union[PostId, CommentId],
+    ) -> bool:
+        """Delete a vote and undo its points and author karma in one statement.
+
+        Points never drop below 1 and karma never below 0.
+
+        Args:
+            user_id: The user's ID
+            votable_type: Type of item (post or comment)
+            votable_id: ID of the item
+
+        Returns:
+            True if a vote was deleted, False if no vote existed
+        """
+        pass
+
     @abstractmethod
     async def find_by_user_and_votables(
         self,
@@ -123,3 +171,25 @@ class VoteRepository(ABC):
             List of votes by the user on the specified items
         """
         pass
+
+    @abstractmethod
+    async def find_voted_ids(
+        self,
+        user_id: UserId,
+        votable_type: VotableType,
+        votable_ids: Sequence[Union[PostId, CommentId]],
+    ) -> set[UUID]:
+        """Find which of several items a user has voted on (batch query).
+
+        Cheaper than find_by_user_and_votables when only vote state is
+        needed: just the IDs are fetched and no Vote models are built.
+
+        Args:
+            user_id: The user's ID
+            votable_type: Type of items (post or comment)
+            votable_ids: List of item IDs to check
+
+        Returns:
+            IDs of the given items the user has voted on
+        """
+        pass
@@ -4,24 +4,28 @@ from .auth_service import AuthService, OAuthClient
 from .base import Service
 from .comment_service import CommentService
 from .invite_service import InviteService
-from .jwt_service import JWTService
-from .post_service import PostService
-from .tag_service import TagService
+from .jwt_service import JWTService, VerifiedTokenCache
+from .post_service import PostCache, PostService
+from .tag_service import TagListCache, TagService
 from .user_identity_service import UserIdentityService
-from .user_service import UserService, UserTreeNode
+from .user_service import InvitationTreeCache, UserService, UserTreeNode
 from .vote_service import VoteService
 
 __all__ = [
     "AuthService",
     "CommentService",
+    "InvitationTreeCache",
     "InviteService",
     "JWTService",
     "OAuthClient",
+    "PostCache",
     "PostService",
     "Service",
+    "TagListCache",
     "TagService",
     "UserIdentityService",
     "UserService",
     "UserTreeNode",
+    "VerifiedTokenCache",
     "VoteService",
 ]
@@ -6,6 +6,9 @@ class Service:
 
     Domain services contain business logic that doesn't naturally belong
     to a single entity or spans multiple entities/aggregates.
+
+    Declares empty __slots__ so subclasses can opt out of a per-instance
+    __dict__ by declaring their own.
     """
 
-    pass
+    __slots__ = ()
@@ -148,34 +148,6 @@ class CommentService(Service):
                 logfire.warn("Comment not found", comment_id=str(comment_id))
             return comment
 
-    async def increment_points(self, comment_id: CommentId) -> None:
-        """Atomically increment comment points.
-
-        Uses SQL-level increment to avoid race conditions.
-
-        Args:
-            comment_id: Comment ID
-        """
-        with logfire.span(
-            "comment_service.increment_points", comment_id=str(comment_id)
-        ):
-            await self.comment_repository.increment_points(comment_id)
-            logfire.info("Comment points incremented", comment_id=str(comment_id))
-
-    async def decrement_points(self, comment_id: CommentId) -> None:
-        """Atomically decrement comment points (minimum 1).
-
-        Uses SQL-level decrement to avoid race conditions.
-
-        Args:
-            comment_id: Comment ID
-        """
-        with logfire.span(
-            "comment_service.decrement_points", comment_id=str(comment_id)
-        ):
-            await self.comment_repository.decrement_points(comment_id)
-            logfire.info("Comment points decremented", comment_id=str(comment_id))
-
     async def update_text(self, comment_id: CommentId, text: str) -> Comment | None:
         """Update the text content of a comment.
 
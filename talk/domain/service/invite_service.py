@@ -1,18 +1,23 @@
 """Invite domain service."""
 
 import logfire
-from datetime import datetime
 from uuid import uuid4
 
 from talk.domain.model.invite import Invite
 from talk.domain.repository import InviteRepository
 from talk.domain.value import AuthProvider, InviteId, InviteStatus, InviteToken, UserId
+from talk.util.time import request_now
 
 from .base import Service
 
 
 class InviteService(Service):
-    """Domain service for multi-provider invite operations."""
+    """Domain service for multi-provider invite operations.
+
+    The service is request-scoped, so it keeps a small cache of invites it has
+    already loaded. This lets the login flow (check -> find -> accept) reuse
+    the invite it looked up instead of fetching the same row again.
+    """
 
     def __init__(self, invite_repository: InviteRepository) -> None:
         """Initialize invite service.
@@ -21,6 +26,17 @@ class InviteService(Service):
             invite_repository: Invite repository
         """
         self.invite_repository = invite_repository
+        self._invites_by_id: dict[InviteId, Invite] = {}
+        self._pending_by_identity: dict[tuple[AuthProvider, str], Invite | None] = {}
+
+    def _remember(self, invite: Invite) -> None:
+        """Cache an invite loaded or written during this request."""
+        self._invites_by_id[invite.id] = invite
+        key = (invite.provider, invite.invitee_provider_id)
+        if invite.status == InviteStatus.PENDING:
+            self._pending_by_identity[key] = invite
+        elif key in self._pending_by_identity:
+            self._pending_by_identity[key] = None
 
     async def create_invite(
         self,
@@ -47,10 +63,11 @@ class InviteService(Service):
         Raises:
             ValueError: If pending invite already exists
         """
+        provider_name = provider.value
         with logfire.span(
             "invite_service.create_invite",
-            inviter_id=str(inviter_id),
-            provider=provider.value,
+            inviter_id=inviter_id,
+            provider=provider_name,
             invitee_handle=invitee_handle,
         ):
             # Check if pending invite already exists
@@ -62,7 +79,7 @@ class InviteService(Service):
             if existing:
                 logfire.warn(
                     "Invite already exists",
-                    provider=provider.value,
+                    provider=provider_name,
                     invitee_provider_id=invitee_provider_id,
                 )
                 raise ValueError(
@@ -78,14 +95,15 @@ class InviteService(Service):
                 invitee_name=invitee_name,
                 invite_token=invite_token,
                 status=InviteStatus.PENDING,
-                created_at=datetime.now(),
+                created_at=request_now(),
             )
 
             saved = await self.invite_repository.save(invite)
+            self._remember(saved)
             logfire.info(
                 "Invite created",
-                invite_id=str(saved.id),
-                inviter_id=str(inviter_id),
+                invite_id=saved.id,
+                inviter_id=inviter_id,
                 invitee_handle=invitee_handle,
             )
             return saved
@@ -99,18 +117,17 @@ class InviteService(Service):
         Returns:
             Invite if found, None otherwise
         """
-        with logfire.span(
-            "invite_service.get_invite_by_token", token=token.root[:8] + "..."
-        ):
+        with logfire.span("invite_service.get_invite_by_token", token=token.short):
             invite = await self.invite_repository.find_by_token(token)
             if invite:
+                self._remember(invite)
                 logfire.info(
                     "Invite found",
-                    invite_id=str(invite.id),
+                    invite_id=invite.id,
                     status=invite.status.value,
                 )
             else:
-                logfire.warn("Invite not found", token=token.root[:8] + "...")
+                logfire.warn("Invite not found", token=token.short)
             return invite
 
     async def accept_invite(self, invite_id: InviteId, new_user_id: UserId) -> Invite:
@@ -128,29 +145,30 @@ class InviteService(Service):
         """
         with logfire.span(
             "invite_service.accept_invite",
-            invite_id=str(invite_id),
-            new_user_id=str(new_user_id),
+            invite_id=invite_id,
+            new_user_id=new_user_id,
         ):
-            invite = await self.invite_repository.find_by_id(invite_id)
+            invite = self._invites_by_id.get(invite_id)
+            if invite is None:
+                invite = await self.invite_repository.find_by_id(invite_id)
             if not invite:
-                logfire.error(
-                    "Invite not found for acceptance", invite_id=str(invite_id)
-                )
+                logfire.error("Invite not found for acceptance", invite_id=invite_id)
                 raise ValueError(f"Invite {invite_id} not found")
 
             accepted_invite = invite.model_copy(
                 update={
                     "status": InviteStatus.ACCEPTED,
-                    "accepted_at": datetime.now(),
+                    "accepted_at": request_now(),
                     "accepted_by_user_id": new_user_id,
                 }
             )
 
             saved = await self.invite_repository.save(accepted_invite)
+            self._remember(saved)
             logfire.info(
                 "Invite accepted",
-                invite_id=str(invite_id),
-                new_user_id=str(new_user_id),
+                invite_id=invite_id,
+                new_user_id=new_user_id,
             )
             return saved
 
@@ -168,17 +186,24 @@ class InviteService(Service):
         Returns:
             True if pending invite exists, False otherwise
         """
+        provider_name = provider.value
         with logfire.span(
             "invite_service.check_invite_exists",
-            provider=provider.value,
+            provider=provider_name,
             provider_user_id=provider_user_id,
         ):
-            exists = await self.invite_repository.exists_pending_for_provider_identity(
-                provider, provider_user_id
-            )
+            key = (provider, provider_user_id)
+            if key in self._pending_by_identity:
+                exists = self._pending_by_identity[key] is not None
+            else:
+                exists = (
+                    await self.invite_repository.exists_pending_for_provider_identity(
+                        provider, provider_user_id
+                    )
+                )
             logfire.info(
                 "Invite existence check",
-                provider=provider.value,
+                provider=provider_name,
                 provider_user_id=provider_user_id,
                 exists=exists,
             )
@@ -195,15 +220,13 @@ class InviteService(Service):
         Returns:
             Number of pending invites
         """
-        with logfire.span(
-            "invite_service.get_pending_count", inviter_id=str(inviter_id)
-        ):
+        with logfire.span("invite_service.get_pending_count", inviter_id=inviter_id):
             count = await self.invite_repository.count_by_inviter(
                 inviter_id, InviteStatus.PENDING
             )
             logfire.info(
                 "Pending invite count retrieved",
-                inviter_id=str(inviter_id),
+                inviter_id=inviter_id,
                 count=count,
             )
             return count
@@ -228,7 +251,7 @@ class InviteService(Service):
         """
         with logfire.span(
             "invite_service.list_invites",
-            inviter_id=str(inviter_id),
+            inviter_id=inviter_id,
             status=status.value if status else None,
             limit=limit,
             offset=offset,
@@ -238,7 +261,7 @@ class InviteService(Service):
             )
             logfire.info(
                 "Invites listed",
-                inviter_id=str(inviter_id),
+                inviter_id=inviter_id,
                 count=len(invites),
             )
             return invites
@@ -259,7 +282,7 @@ class InviteService(Service):
         with logfire.span(
             "invite_service.get_available_quota",
             user_quota=user_quota,
-            inviter_id=str(inviter_id),
+            inviter_id=inviter_id,
         ):
             # Count all invites (both pending and accepted)
             total_invites = await self.invite_repository.count_by_inviter(
@@ -268,7 +291,7 @@ class InviteService(Service):
             available = max(0, user_quota - total_invites)
             logfire.info(
                 "Available quota calculated",
-                inviter_id=str(inviter_id),
+                inviter_id=inviter_id,
                 user_quota=user_quota,
                 total_invites=total_invites,
                 available=available,
@@ -287,25 +310,33 @@ class InviteService(Service):
         Returns:
             Pending invite if found, None otherwise
         """
+        provider_name = provider.value
         with logfire.span(
             "invite_service.find_pending_by_provider_identity",
-            provider=provider.value,
+            provider=provider_name,
             provider_user_id=provider_user_id,
         ):
-            invite = await self.invite_repository.find_pending_by_provider_identity(
-                provider, provider_user_id
-            )
+            key = (provider, provider_user_id)
+            if key in self._pending_by_identity:
+                invite = self._pending_by_identity[key]
+            else:
+                invite = await self.invite_repository.find_pending_by_provider_identity(
+                    provider, provider_user_id
+                )
+                self._pending_by_identity[key] = invite
+                if invite:
+                    self._invites_by_id[invite.id] = invite
             if invite:
                 logfire.info(
                     "Pending invite found",
-                    provider=provider.value,
+                    provider=provider_name,
                     provider_user_id=provider_user_id,
-                    invite_id=str(invite.id),
+                    invite_id=invite.id,
                 )
             else:
                 logfire.warn(
                     "Pending invite not found",
-                    provider=provider.value,
+                    provider=provider_name,
                     provider_user_id=provider_user_id,
                 )
             return invite
@@ -1,23 +1,52 @@
 """JWT token domain service."""
 
+import hashlib
+import time
+
 import logfire
 
 from talk.config import AuthSettings
+from talk.util.cache import TTLCache
 from talk.util.jwt import create_token, verify_token, TokenPayload
+from talk.util.tracing import debug_enabled
 
 from .base import Service
 
 
+class VerifiedTokenCache(TTLCache[bytes, TokenPayload]):
+    """Process-wide cache of verified token payloads.
+
+    Keyed by the SHA-256 digest of the token, so raw tokens are never kept.
+    Only successfully verified tokens are stored, and a cached payload is
+    ignored once its own expiry has passed.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 30.0) -> None:
+        """Initialize verified token cache.
+
+        Args:
+            maxsize: Maximum number of tokens to keep
+            ttl: Seconds a verification result stays valid
+        """
+        super().__init__(maxsize=maxsize, ttl=ttl)
+
+
 class JWTService(Service):
     """Domain service for JWT token operations."""
 
-    def __init__(self, auth_settings: AuthSettings) -> None:
+    def __init__(
+        self,
+        auth_settings: AuthSettings,
+        token_cache: VerifiedTokenCache | None = None,
+    ) -> None:
         """Initialize JWT service.
 
         Args:
             auth_settings: Authentication settings
+            token_cache: Shared verified token cache (caching is disabled if None)
         """
         self.auth_settings = auth_settings
+        self.token_cache = token_cache
 
     def create_token(self, user_id: str, did: str, handle: str) -> str:
         """Create JWT token for user.
@@ -47,17 +76,28 @@ class JWTService(Service):
         Raises:
             JWTError: If token is invalid or expired
         """
+        cache_key = None
+        if self.token_cache is not None:
+            # Repeat requests with the same cookie skip signature verification
+            cache_key = hashlib.sha256(token.encode()).digest()
+            cached = self.token_cache.get(cache_key)
+            if cached is not None and cached.exp.timestamp() > time.time():
+                return cached
+
         with logfire.span("jwt_service.verify_token"):
             try:
                 payload = verify_token(token, self.auth_settings)
                 logfire.info(
                     "JWT token verified", user_id=payload.user_id, handle=payload.handle
                 )
-                return payload
             except Exception as e:
                 logfire.error("JWT token verification failed", error=str(e))
                 raise
 
+        if self.token_cache is not None and cache_key is not None:
+            self.token_cache.set(cache_key, payload)
+        return payload
+
     def get_user_id_from_token(self, token: str | None) -> str | None:
         """Extract user ID from JWT token without raising exceptions.
 
@@ -78,7 +118,9 @@ class JWTService(Service):
             return payload.user_id
         except Exception as e:
             # Invalid or expired token, treat as unauthenticated
-            logfire.debug(
-                "JWT verification failed, treating as unauthenticated", error=str(e)
-            )
+            if debug_enabled():
+                logfire.debug(
+                    "JWT verification failed, treating as unauthenticated",
+                    error=str(e),
+                )
             return None
@@ -3,25 +3,77 @@
 import re
 
 import logfire
-from datetime import datetime
 
 from talk.domain.model.post import Post
 from talk.domain.repository import PostRepository
 from talk.domain.value import PostId, Slug
+from talk.util.cache import TTLCache
+from talk.util.tracing import info_sampled, span
 
 from .base import Service
 
+# Runs of characters that are not allowed in a slug
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+# Byte table mapping every character that is not allowed in a slug to a hyphen
+_SLUG_TRANSLATE = bytes(
+    c if ord("a") <= c <= ord("z") or ord("0") <= c <= ord("9") else ord("-")
+    for c in range(256)
+)
+
+# Fraction of routine success events logged on hot read/vote paths
+_SUCCESS_LOG_SAMPLE_RATE = 0.01
+
+
+class PostCache:
+    """Short-lived, process-wide cache of posts by ID and slug.
+
+    Shared across requests (APP scope). Entries are dropped when this process
+    mutates the post; other workers may serve a post up to ttl seconds stale.
+
+    Entries are dropped before the request's transaction commits (the session
+    commits when the request scope closes). A concurrent read in between can
+    cache the pre-change row again, which then stays stale for at most ttl
+    seconds. That is the same bound already accepted for other workers, so
+    eviction is not deferred until after the commit.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 5.0) -> None:
+        """Initialize post cache.
+
+        Args:
+            maxsize: Maximum number of posts (and slugs) to keep
+            ttl: Seconds an entry stays valid
+        """
+        self.by_id: TTLCache[PostId, Post] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.id_by_slug: TTLCache[str, PostId] = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def put(self, post: Post) -> None:
+        """Cache a post under its ID and slug."""
+        self.by_id.set(post.id, post)
+        self.id_by_slug.set(post.slug.root, post.id)
+
+    def invalidate(self, post_id: PostId) -> None:
+        """Drop a post from the cache."""
+        self.by_id.pop(post_id)
+
 
 class PostService(Service):
     """Domain service for post operations."""
 
-    def __init__(self, post_repository: PostRepository) -> None:
+    __slots__ = ("post_cache", "post_repository")
+
+    def __init__(
+        self, post_repository: PostRepository, post_cache: PostCache | None = None
+    ) -> None:
         """Initialize post service.
 
         Args:
             post_repository: Post repository
+            post_cache: Shared post cache (caching is disabled if None)
         """
         self.post_repository = post_repository
+        self.post_cache = post_cache
 
     async def save_post(self, post: Post) -> Post:
         """Save a post.
@@ -32,12 +84,11 @@ class PostService(Service):
         Returns:
             Saved post
         """
-        with logfire.span(
-            "post_service.save_post", post_id=str(post.id), title=post.title
-        ):
-            saved = await self.post_repository.save(post)
-            logfire.info("Post saved", post_id=str(saved.id))
-            return saved
+        saved = await self.post_repository.save(post)
+        if self.post_cache is not None:
+            self.post_cache.invalidate(saved.id)
+        logfire.info("Post saved", post_id=saved.id)
+        return saved
 
     async def get_post_by_id(self, post_id: PostId) -> Post | None:
         """Get a post by ID.
@@ -48,100 +99,126 @@ class PostService(Service):
         Returns:
             Post if found, None otherwise
         """
-        with logfire.span("post_service.get_post_by_id", post_id=str(post_id)):
-            post = await self.post_repository.find_by_id(post_id)
+        if self.post_cache is not None:
+            cached = self.post_cache.by_id.get(post_id)
+            if cached:
+                return cached
+
+        post = await self.post_repository.find_by_id(post_id)
+
+        if post:
+            if self.post_cache is not None:
+                self.post_cache.put(post)
+            info_sampled(
+                _SUCCESS_LOG_SAMPLE_RATE,
+                "Post found",
+                post_id=post_id,
+                title=post.title,
+            )
+        else:
+            logfire.warn("Post not found", post_id=post_id)
 
-            if post:
-                logfire.info("Post found", post_id=str(post_id), title=post.title)
-            else:
-                logfire.warn("Post not found", post_id=str(post_id))
+        return post
 
-            return post
+    async def get_posts_by_ids(self, post_ids: list[PostId]) -> dict[PostId, Post]:
+        """Get several posts by ID with one repository call.
 
-    async def get_post_by_slug(self, slug: Slug) -> Post | None:
-        """Get a post by slug.
+        Use this instead of calling get_post_by_id in a loop when rendering
+        lists. Posts already in the shared cache are not re-fetched.
 
         Args:
-            slug: Post slug
+            post_ids: Post IDs
 
         Returns:
-            Post if found, None otherwise
+            Dict mapping post ID to post; missing IDs are omitted
         """
-        with logfire.span("post_service.get_post_by_slug", slug=str(slug)):
-            post = await self.post_repository.find_by_slug(slug)
-
-            if post:
-                logfire.info(
-                    "Post found by slug",
-                    slug=str(slug),
-                    post_id=str(post.id),
-                    title=post.title,
-                )
+        found: dict[PostId, Post] = {}
+        missing: list[PostId] = []
+        for post_id in dict.fromkeys(post_ids):
+            cached = (
+                self.post_cache.by_id.get(post_id)
+                if self.post_cache is not None
+                else None
+            )
+            if cached:
+                found[post_id] = cached
             else:
-                logfire.warn("Post not found by slug", slug=str(slug))
+                missing.append(post_id)
+
+        if missing:
+            loaded = await self.post_repository.find_by_ids(missing)
+            if self.post_cache is not None:
+                for post in loaded.values():
+                    self.post_cache.put(post)
+            found.update(loaded)
 
-            return post
+        return found
 
-    async def increment_comment_count(self, post_id: PostId) -> Post:
-        """Increment a post's comment count.
+    async def get_post_by_slug(self, slug: Slug) -> Post | None:
+        """Get a post by slug.
 
         Args:
-            post_id: Post ID
+            slug: Post slug
 
         Returns:
-            Updated post
-
-        Raises:
-            ValueError: If post not found
+            Post if found, None otherwise
         """
-        with logfire.span("post_service.increment_comment_count", post_id=str(post_id)):
-            post = await self.post_repository.find_by_id(post_id)
-            if not post:
-                logfire.error(
-                    "Post not found for comment count increment", post_id=str(post_id)
-                )
-                raise ValueError("Post not found")
-
-            # Update comment count and last comment timestamp (domain models are immutable)
-            now = datetime.now()
-            updated_post = post.model_copy(
-                update={
-                    "comment_count": post.comment_count + 1,
-                    "comments_updated_at": now,
-                }
+        if self.post_cache is not None:
+            cached_id = self.post_cache.id_by_slug.get(slug.root)
+            cached = self.post_cache.by_id.get(cached_id) if cached_id else None
+            if cached:
+                return cached
+
+        post = await self.post_repository.find_by_slug(slug)
+
+        if post:
+            if self.post_cache is not None:
+                self.post_cache.put(post)
+            info_sampled(
+                _SUCCESS_LOG_SAMPLE_RATE,
+                "Post found by slug",
+                slug=slug.root,
+                post_id=post.id,
+                title=post.title,
             )
+        else:
+            logfire.warn("Post not found by slug", slug=slug.root)
 
-            saved = await self.post_repository.save(updated_post)
-            logfire.info(
-                "Comment count incremented",
-                post_id=str(post_id),
-                new_count=saved.comment_count,
-            )
-            return saved
+        return post
 
-    async def increment_points(self, post_id: PostId) -> None:
-        """Atomically increment post points.
+    def evict_cached(self, post_id: PostId) -> None:
+        """Drop a post from the shared cache after it was changed elsewhere.
 
-        Uses SQL-level increment to avoid race conditions.
+        Runs before the change commits; see PostCache for the accepted
+        staleness window.
 
         Args:
             post_id: Post ID
         """
-        with logfire.span("post_service.increment_points", post_id=str(post_id)):
-            await self.post_repository.increment_points(post_id)
-            logfire.info("Post points incremented", post_id=str(post_id))
+        if self.post_cache is not None:
+            self.post_cache.invalidate(post_id)
 
-    async def decrement_points(self, post_id: PostId) -> None:
-        """Atomically decrement post points (minimum 1).
+    async def increment_comment_count(self, post_id: PostId) -> None:
+        """Atomically increment a post's comment count.
 
-        Uses SQL-level decrement to avoid race conditions.
+        Uses SQL-level increment to avoid race conditions.
 
         Args:
             post_id: Post ID
+
+        Raises:
+            ValueError: If post not found
         """
-        with logfire.span("post_service.decrement_points", post_id=str(post_id)):
-            await self.post_repository.decrement_points(post_id)
-            logfire.info("Post points decremented", post_id=str(post_id))
+        updated = await self.post_repository.increment_comment_count(post_id)
+        if self.post_cache is not None:
+            self.post_cache.invalidate(post_id)
+        if not updated:
+            logfire.error("Post not found for comment count increment", post_id=post_id)
+            raise ValueError("Post not found")
+
+        info_sampled(
+            _SUCCESS_LOG_SAMPLE_RATE, "Comment count incremented", post_id=post_id
+        )
 
     async def update_text(self, post_id: PostId, text: str | None) -> Post | None:
         """Update the text content of a post.
@@ -153,27 +230,21 @@ class PostService(Service):
         Returns:
             Updated post if found and updated, None if post doesn't exist or is deleted
         """
-        with logfire.span(
-            "post_service.update_text",
-            post_id=str(post_id),
-            text_length=len(text) if text else 0,
-            clearing_text=text is None,
-        ):
-            updated = await self.post_repository.update_text(post_id, text)
+        updated = await self.post_repository.update_text(post_id, text)
+        if self.post_cache is not None:
+            self.post_cache.invalidate(post_id)
 
-            if updated:
-                logfire.info(
-                    "Post text updated",
-                    post_id=str(post_id),
-                    title=updated.title,
-                    text_length=len(updated.text) if updated.text else 0,
-                )
-            else:
-                logfire.warn(
-                    "Post not found or deleted for text update", post_id=str(post_id)
-                )
+        if updated:
+            logfire.info(
+                "Post text updated",
+                post_id=post_id,
+                title=updated.title,
+                text_length=len(updated.text) if updated.text else 0,
+            )
+        else:
+            logfire.warn("Post not found or deleted for text update", post_id=post_id)
 
-            return updated
+        return updated
 
     async def generate_unique_slug(self, title: str, post_id: PostId) -> Slug:
         """Generate a unique slug from a title.
@@ -187,9 +258,9 @@ class PostService(Service):
         Returns:
             Unique slug for the post
         """
-        with logfire.span(
+        with span(
             "post_service.generate_unique_slug",
-            post_id=str(post_id),
+            post_id=post_id,
             title=title,
         ):
             base_slug_str = self._slugify(title)
@@ -199,32 +270,22 @@ class PostService(Service):
                 fallback = f"post-{post_id.hex[:8]}"
                 logfire.info(
                     "Using fallback slug for empty title",
-                    post_id=str(post_id),
+                    post_id=post_id,
                     slug=fallback,
                 )
                 return Slug(fallback)
 
-            # Handle collisions with numeric suffix
-            slug_str = base_slug_str
-            counter = 1
-            while await self.post_repository.slug_exists(Slug(slug_str)):
-                suffix = f"-{counter}"
-                # Ensure we don't exceed 100 chars with suffix
-                slug_str = base_slug_str[: 100 - len(suffix)] + suffix
-                counter += 1
-                logfire.debug(
-                    "Slug collision, trying with suffix",
-                    base_slug=base_slug_str,
-                    attempt=slug_str,
-                    counter=counter,
-                )
+            # Collisions are resolved by the repository in a single round-trip
+            slug_str = await self.post_repository.generate_unique_slug(
+                base_slug_str, max_len=100
+            )
 
             slug = Slug(slug_str)
             logfire.info(
                 "Generated unique slug",
-                post_id=str(post_id),
-                slug=str(slug),
-                had_collision=counter > 1,
+                post_id=post_id,
+                slug=slug_str,
+                had_collision=slug_str != base_slug_str,
             )
             return slug
 
@@ -244,9 +305,14 @@ class PostService(Service):
         Returns:
             URL-safe slug string (may be empty if title has no valid chars)
         """
-        # Convert to lowercase and replace non-alphanumeric with hyphens
-        slug = re.sub(r"[^a-z0-9]+", "-", title.lower())
-        # Remove consecutive hyphens
-        slug = re.sub(r"-+", "-", slug)
-        # Strip leading/trailing hyphens and truncate
+        if not title.isascii():
+            # Lowercasing non-ASCII text can yield ASCII letters, so let the
+            # regex handle the general case
+            return _SLUG_RE.sub("-", title.lower()).strip("-")[:100]
+
+        # Fast path for ASCII titles: one bytes.translate pass maps invalid
+        # chars to hyphens, then runs are collapsed (each pass halves them)
+        slug = title.lower().encode("ascii").translate(_SLUG_TRANSLATE).decode("ascii")
+        while "--" in slug:
+            slug = slug.replace("--", "-")
         return slug.strip("-")[:100]
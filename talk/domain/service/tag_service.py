@@ -5,20 +5,46 @@ import logfire
 from talk.domain.model.tag import Tag
 from talk.domain.repository.tag import TagRepository
 from talk.domain.value import TagName
+from talk.util.cache import TTLCache
+from talk.util.tracing import span
 
 from .base import Service
 
 
+class TagListCache(TTLCache[tuple[int, str], tuple[Tag, ...]]):
+    """Process-wide cache of tag listings keyed by (limit, order_by).
+
+    Tags change rarely (only through migrations/admin tooling), so listings
+    are kept for a minute. Call clear() after mutating tags in-process.
+    Listings are stored as tuples, since every request shares them.
+    """
+
+    def __init__(self, maxsize: int = 32, ttl: float = 60.0) -> None:
+        """Initialize tag list cache.
+
+        Args:
+            maxsize: Maximum number of (limit, order_by) combinations to keep
+            ttl: Seconds a listing stays valid
+        """
+        super().__init__(maxsize=maxsize, ttl=ttl)
+
+
 class TagService(Service):
     """Domain service for tag operations."""
 
-    def __init__(self, tag_repository: TagRepository) -> None:
+    __slots__ = ("tag_list_cache", "tag_repository")
+
+    def __init__(
+        self, tag_repository: TagRepository, tag_list_cache: TagListCache | None = None
+    ) -> None:
         """Initialize tag service.
 
         Args:
             tag_repository: Tag repository
+            tag_list_cache: Shared tag listing cache (caching is disabled if None)
         """
         self.tag_repository = tag_repository
+        self.tag_list_cache = tag_list_cache
 
     async def validate_tags_exist(self, tag_names: list[TagName]) -> list[Tag]:
         """Validate that all requested tags exist.
@@ -32,16 +58,13 @@ class TagService(Service):
         Raises:
             ValueError: If any tags are not found
         """
-        with logfire.span(
-            "tag_service.validate_tags_exist", tags=[t.root for t in tag_names]
-        ):
-            # Batch fetch tags
-            tags = await self.tag_repository.find_by_names(tag_names)
+        with span("tag_service.validate_tags_exist", tags=[t.root for t in tag_names]):
+            # Batch fetch tags, asking for each distinct name once
+            unique_names = {name.root: name for name in tag_names}
+            tags = await self.tag_repository.find_by_names(list(unique_names.values()))
 
             # Check that all requested tags were found
-            found_names = {tag.name.root for tag in tags}
-            requested_names = {name.root for name in tag_names}
-            missing = requested_names - found_names
+            missing = unique_names.keys() - {tag.name.root for tag in tags}
 
             if missing:
                 raise ValueError(f"Tags not found: {', '.join(sorted(missing))}")
@@ -59,8 +82,16 @@ class TagService(Service):
         Returns:
             List of tags
         """
-        with logfire.span("tag_service.get_all_tags", limit=limit, order_by=order_by):
+        key = (limit, order_by)
+        if self.tag_list_cache is not None:
+            cached = self.tag_list_cache.get(key)
+            if cached is not None:
+                return list(cached)
+
+        with span("tag_service.get_all_tags", limit=limit, order_by=order_by):
             tags = await self.tag_repository.find_all(limit=limit, order_by=order_by)
+            if self.tag_list_cache is not None:
+                self.tag_list_cache.set(key, tuple(tags))
             logfire.info("Tags retrieved", count=len(tags))
             return tags
 
@@ -73,7 +104,7 @@ class TagService(Service):
         Returns:
             Tag if found, None otherwise
         """
-        with logfire.span("tag_service.get_tag_by_name", tag_name=name.root):
+        with span("tag_service.get_tag_by_name", tag_name=name.root):
             tag = await self.tag_repository.find_by_name(name)
             if tag:
                 logfire.info("Tag found", tag_name=name.root)
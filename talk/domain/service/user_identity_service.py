@@ -1,14 +1,29 @@
 """User identity domain service."""
 
+from collections.abc import Iterable
+
 import logfire
 
 from talk.domain.model.user_identity import UserIdentity
 from talk.domain.repository.user_identity import UserIdentityRepository
 from talk.domain.value import AuthProvider, UserId, UserIdentityId
+from talk.util.tracing import span
+
+from .base import Service
+
 
+class UserIdentityService(Service):
+    """Domain service for user identity operations.
 
-class UserIdentityService:
-    """Domain service for user identity operations."""
+    The service is request-scoped; a user's identity list is loaded at most once
+    per request and the primary identity is picked from it in Python.
+    """
+
+    __slots__ = (
+        "_identities_by_user",
+        "_known_identities",
+        "user_identity_repository",
+    )
 
     def __init__(self, user_identity_repository: UserIdentityRepository) -> None:
         """Initialize user identity service.
@@ -17,6 +32,8 @@ class UserIdentityService:
             user_identity_repository: User identity repository
         """
         self.user_identity_repository = user_identity_repository
+        self._identities_by_user: dict[UserId, tuple[UserIdentity, ...]] = {}
+        self._known_identities: set[tuple[AuthProvider, str]] = set()
 
     async def get_identity_by_id(
         self, identity_id: UserIdentityId
@@ -29,18 +46,10 @@ class UserIdentityService:
         Returns:
             Identity if found, None otherwise
         """
-        with logfire.span(
-            "user_identity_service.get_identity_by_id", identity_id=str(identity_id)
-        ):
+        with span("user_identity_service.get_identity_by_id", identity_id=identity_id):
             identity = await self.user_identity_repository.find_by_id(identity_id)
-            if identity:
-                logfire.info(
-                    "Identity found",
-                    identity_id=str(identity_id),
-                    provider=identity.provider.value,
-                )
-            else:
-                logfire.warn("Identity not found", identity_id=str(identity_id))
+            if not identity:
+                logfire.warn("Identity not found", identity_id=identity_id)
             return identity
 
     async def get_identity_by_provider(
@@ -55,25 +64,19 @@ class UserIdentityService:
         Returns:
             Identity if found, None otherwise
         """
-        with logfire.span(
+        provider_name = provider.value
+        with span(
             "user_identity_service.get_identity_by_provider",
-            provider=provider.value,
+            provider=provider_name,
             provider_user_id=provider_user_id,
         ):
             identity = await self.user_identity_repository.find_by_provider(
                 provider, provider_user_id
             )
-            if identity:
-                logfire.info(
-                    "Identity found",
-                    provider=provider.value,
-                    provider_user_id=provider_user_id,
-                    user_id=str(identity.user_id),
-                )
-            else:
+            if not identity:
                 logfire.warn(
                     "Identity not found",
-                    provider=provider.value,
+                    provider=provider_name,
                     provider_user_id=provider_user_id,
                 )
             return identity
@@ -87,17 +90,16 @@ class UserIdentityService:
         Returns:
             List of identities (may be empty)
         """
-        with logfire.span(
-            "user_identity_service.get_all_identities_for_user", user_id=str(user_id)
-        ):
+        with span("user_identity_service.get_all_identities_for_user", user_id=user_id):
+            cached = self._identities_by_user.get(user_id)
+            if cached is not None:
+                # Callers get their own list so they cannot change the cache
+                return list(cached)
+
             identities = await self.user_identity_repository.find_all_by_user_id(
                 user_id
             )
-            logfire.info(
-                "Identities retrieved for user",
-                user_id=str(user_id),
-                count=len(identities),
-            )
+            self._identities_by_user[user_id] = tuple(identities)
             return identities
 
     async def get_primary_identity(self, user_id: UserId) -> UserIdentity | None:
@@ -109,22 +111,23 @@ class UserIdentityService:
         Returns:
             Primary identity if found, None otherwise
         """
-        with logfire.span(
-            "user_identity_service.get_primary_identity", user_id=str(user_id)
-        ):
-            identity = await self.user_identity_repository.find_primary_by_user_id(
-                user_id
-            )
-            if identity:
-                logfire.info(
-                    "Primary identity found",
-                    user_id=str(user_id),
-                    provider=identity.provider.value,
-                )
+        with span("user_identity_service.get_primary_identity", user_id=user_id):
+            cached = self._identities_by_user.get(user_id)
+            if cached is not None:
+                identity = self._pick_primary(cached)
             else:
-                logfire.warn("Primary identity not found", user_id=str(user_id))
+                identity = await self.user_identity_repository.find_primary_by_user_id(
+                    user_id
+                )
+            if not identity:
+                logfire.warn("Primary identity not found", user_id=user_id)
             return identity
 
+    @staticmethod
+    def _pick_primary(identities: Iterable[UserIdentity]) -> UserIdentity | None:
+        """Return the identity flagged as primary, if any."""
+        return next((i for i in identities if i.is_primary), None)
+
     async def identity_exists(
         self, provider: AuthProvider, provider_user_id: str
     ) -> bool:
@@ -137,20 +140,21 @@ class UserIdentityService:
         Returns:
             True if identity exists, False otherwise
         """
-        with logfire.span(
+        with span(
             "user_identity_service.identity_exists",
             provider=provider.value,
             provider_user_id=provider_user_id,
         ):
+            key = (provider, provider_user_id)
+            # Identities are never removed mid-request, so a positive answer holds
+            if key in self._known_identities:
+                return True
+
             exists = await self.user_identity_repository.exists_by_provider(
                 provider, provider_user_id
             )
-            logfire.info(
-                "Identity existence check",
-                provider=provider.value,
-                provider_user_id=provider_user_id,
-                exists=exists,
-            )
+            if exists:
+                self._known_identities.add(key)
             return exists
 
     async def save(self, identity: UserIdentity) -> UserIdentity:
@@ -162,17 +166,20 @@ class UserIdentityService:
         Returns:
             Saved identity
         """
-        with logfire.span(
+        provider_name = identity.provider.value
+        with span(
             "user_identity_service.save",
-            identity_id=str(identity.id),
-            provider=identity.provider.value,
-            user_id=str(identity.user_id),
+            identity_id=identity.id,
+            provider=provider_name,
+            user_id=identity.user_id,
         ):
             saved = await self.user_identity_repository.save(identity)
+            self._identities_by_user.pop(saved.user_id, None)
+            self._known_identities.add((saved.provider, saved.provider_user_id))
             logfire.info(
                 "Identity saved",
-                identity_id=str(saved.id),
-                provider=saved.provider.value,
-                user_id=str(saved.user_id),
+                identity_id=saved.id,
+                provider=provider_name,
+                user_id=saved.user_id,
             )
             return saved
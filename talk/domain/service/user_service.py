@@ -1,46 +1,81 @@
 """User domain service."""
 
-from collections import defaultdict
 from dataclasses import dataclass
 
 import logfire
 
-from talk.domain.error import NotFoundError
 from talk.domain.model import User
-from talk.domain.repository import InviteRepository, UserRepository
+from talk.domain.repository import UserRepository
 from talk.domain.value import AuthProvider, UserId
 from talk.domain.value.types import Handle
+from talk.util.cache import TTLCache
+from talk.util.tracing import span
 
+from .base import Service
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class UserTreeNode:
     """Node in the user invitation tree.
 
     Represents a user and their invited children in the invitation hierarchy.
+    Slotted, since a tree holds one node per user, and immutable, since built
+    trees are cached and shared between requests.
     """
 
     user_id: UserId
     handle: Handle
     karma: int | None
-    children: list["UserTreeNode"]
+    children: tuple["UserTreeNode", ...] = ()
+
+
+def _tree_sort_key(node: UserTreeNode) -> tuple[int, str]:
+    """Sort key for tree siblings: karma, then handle as tiebreaker.
+
+    Users without karma (None) sort to the end when sorting descending.
+    """
+    return (node.karma if node.karma is not None else -1, node.handle.root)
+
+
+class InvitationTreeCache(
+    TTLCache[tuple[bool, tuple[int, int]], tuple[UserTreeNode, ...]]
+):
+    """Process-wide cache of built invitation trees.
+
+    Keyed by (include_karma, tree version), so a new user or accepted invite
+    produces a fresh tree immediately. Karma is not part of the version and
+    may be up to ttl seconds stale. Cached trees are shared between requests;
+    roots are stored as a tuple and the nodes themselves are frozen.
+    """
+
+    def __init__(self, maxsize: int = 8, ttl: float = 30.0) -> None:
+        """Initialize invitation tree cache.
+
+        Args:
+            maxsize: Maximum number of trees to keep
+            ttl: Seconds a tree stays valid
+        """
+        super().__init__(maxsize=maxsize, ttl=ttl)
 
 
-class UserService:
+class UserService(Service):
     """Domain service for user operations."""
 
+    __slots__ = ("tree_cache", "user_repository")
+
     def __init__(
         self,
         user_repository: UserRepository,
-        invite_repository: InviteRepository,
+        tree_cache: InvitationTreeCache | None = None,
     ) -> None:
         """Initialize user service.
 
         Args:
             user_repository: User repository
-            invite_repository: Invite repository
+            tree_cache: Shared invitation tree cache (caching is disabled if None)
         """
         self.user_repository = user_repository
-        self.invite_repository = invite_repository
+        self.tree_cache = tree_cache
 
     async def get_by_id(self, user_id: UserId) -> User:
         """Get user by ID.
@@ -54,13 +89,8 @@ class UserService:
         Raises:
             NotFoundError: If user not found
         """
-        with logfire.span("user_service.get_by_id", user_id=str(user_id)):
-            user = await self.user_repository.find_by_id(user_id)
-            if not user:
-                logfire.warn("User not found", user_id=str(user_id))
-                raise NotFoundError("User", str(user_id))
-            logfire.info("User found", user_id=str(user_id), handle=user.handle.root)
-            return user
+        with span("user_service.get_by_id", user_id=user_id):
+            return await self.user_repository.find_by_id_or_raise(user_id)
 
     async def get_user_by_handle(self, handle: Handle) -> User | None:
         """Get user by handle.
@@ -71,11 +101,9 @@ class UserService:
         Returns:
             User if found, None otherwise
         """
-        with logfire.span("user_service.get_user_by_handle", handle=handle.root):
+        with span("user_service.get_user_by_handle", handle=handle.root):
             user = await self.user_repository.find_by_handle(handle)
-            if user:
-                logfire.info("User found", handle=handle.root, user_id=str(user.id))
-            else:
+            if not user:
                 logfire.warn("User not found", handle=handle.root)
             return user
 
@@ -88,11 +116,9 @@ class UserService:
         Returns:
             User if found, None otherwise
         """
-        with logfire.span("user_service.get_user_by_email", email=email):
+        with span("user_service.get_user_by_email", email=email):
             user = await self.user_repository.find_by_email(email)
-            if user:
-                logfire.info("User found", email=email, user_id=str(user.id))
-            else:
+            if not user:
                 logfire.warn("User not found", email=email)
             return user
 
@@ -108,55 +134,23 @@ class UserService:
         Returns:
             User if found, None otherwise
         """
-        with logfire.span(
+        provider_name = provider.value
+        with span(
             "user_service.get_user_by_provider_identity",
-            provider=provider.value,
+            provider=provider_name,
             provider_user_id=provider_user_id,
         ):
             user = await self.user_repository.find_by_provider_identity(
                 provider, provider_user_id
             )
-            if user:
-                logfire.info(
-                    "User found",
-                    provider=provider.value,
-                    provider_user_id=provider_user_id,
-                    user_id=str(user.id),
-                )
-            else:
+            if not user:
                 logfire.warn(
                     "User not found",
-                    provider=provider.value,
+                    provider=provider_name,
                     provider_user_id=provider_user_id,
                 )
             return user
 
-    async def increment_karma(self, user_id: UserId) -> None:
-        """Atomically increment user's karma by 1.
-
-        Called when someone upvotes the user's post or comment.
-        Uses atomic database operation to avoid race conditions.
-
-        Args:
-            user_id: User ID
-        """
-        with logfire.span("user_service.increment_karma", user_id=str(user_id)):
-            await self.user_repository.increment_karma(user_id)
-            logfire.info("Karma incremented", user_id=str(user_id))
-
-    async def decrement_karma(self, user_id: UserId) -> None:
-        """Atomically decrement user's karma by 1.
-
-        Called when someone removes their upvote from the user's post or comment.
-        Uses atomic database operation to avoid race conditions.
-
-        Args:
-            user_id: User ID
-        """
-        with logfire.span("user_service.decrement_karma", user_id=str(user_id)):
-            await self.user_repository.decrement_karma(user_id)
-            logfire.info("Karma decremented", user_id=str(user_id))
-
     async def save(self, user: User) -> User:
         """Save user (create or update).
 
@@ -166,11 +160,9 @@ class UserService:
         Returns:
             Saved user
         """
-        with logfire.span(
-            "user_service.save", user_id=str(user.id), handle=user.handle.root
-        ):
+        with span("user_service.save", user_id=user.id, handle=user.handle.root):
             saved = await self.user_repository.save(user)
-            logfire.info("User saved", user_id=str(saved.id), handle=saved.handle.root)
+            logfire.info("User saved", user_id=saved.id, handle=saved.handle.root)
             return saved
 
     async def build_invitation_tree(
@@ -182,88 +174,85 @@ class UserService:
         Users without a parent (root users) appear at the top level.
 
         Algorithm:
-        1. Fetch all users (minimal data: id, handle, karma)
-        2. Fetch all accepted invite relationships (parent->child pairs)
-        3. Build adjacency map of parent_id -> [child_ids]
-        4. Identify root users (users with no parent)
-        5. Recursively build tree from each root, sorting children by karma
+        1. Fetch all users with their inviter in one query (id, handle, karma, parent)
+        2. Collect root users (users with no parent) and group user IDs by
+           parent in one pass
+        3. Create nodes children-first, each with its children sorted by karma
 
         Args:
             include_karma: Whether to fetch and include karma (default: True).
                           Can be disabled for better performance if karma not needed.
 
         Returns:
-            List of root UserTreeNode objects with children populated recursively.
+            List of root UserTreeNode objects with children populated.
             Children at each level are sorted by karma (descending).
+            The nodes may be shared with other requests when caching is enabled.
         """
-        with logfire.span("user_service.build_invitation_tree"):
-            # Fetch all users (optimized query with minimal fields)
-            users_data = await self.user_repository.find_all_for_tree(
+        with span("user_service.build_invitation_tree"):
+            cache_key = None
+            if self.tree_cache is not None:
+                version = await self.user_repository.tree_version()
+                cache_key = (include_karma, version)
+                cached = self.tree_cache.get(cache_key)
+                if cached is not None:
+                    logfire.debug("Invitation tree served from cache")
+                    return list(cached)
+
+            # Fetch all users joined to their inviter (single round-trip)
+            rows = await self.user_repository.find_all_for_tree_with_parents(
                 include_karma=include_karma
             )
-            logfire.info("Fetched users for tree", count=len(users_data))
-
-            # Fetch all accepted invite relationships
-            relationships = (
-                await self.invite_repository.find_all_accepted_relationships()
-            )
-            logfire.info("Fetched invite relationships", count=len(relationships))
-
-            # Build user lookup map: user_id -> (handle, karma)
-            user_map: dict[UserId, tuple[Handle, int | None]] = {
-                user_id: (handle, karma) for user_id, handle, karma in users_data
-            }
-
-            # Build adjacency map: parent_id -> [child_ids]
-            adjacency: dict[UserId, list[UserId]] = defaultdict(list)
-            for parent_id, child_id in relationships:
-                adjacency[parent_id].append(child_id)
-
-            # Identify root users (users with no parent in relationships)
-            all_children = {child_id for _, child_id in relationships}
-            roots = [
-                user_id for user_id, _, _ in users_data if user_id not in all_children
-            ]
-
-            logfire.info("Identified root users", count=len(roots))
-
-            # Recursively build tree from each root
-            def build_subtree(user_id: UserId) -> UserTreeNode:
-                """Build tree recursively from a user node."""
-                handle, karma = user_map[user_id]
-
-                # Get children and recursively build their subtrees
-                child_ids = adjacency.get(user_id, [])
-                children = [build_subtree(child_id) for child_id in child_ids]
-
-                # Sort children by karma (descending), handle as tiebreaker
-                # Users without karma (None) sort to the end
-                children.sort(
-                    key=lambda node: (
-                        node.karma if node.karma is not None else -1,
-                        node.handle.root,
+            logfire.debug("Fetched users for tree", count=len(rows))
+
+            # Collect roots and group user IDs by parent in one pass
+            users: dict[UserId, tuple[Handle, int | None]] = {}
+            children_by_parent: dict[UserId, list[UserId]] = {}
+            root_ids: list[UserId] = []
+            for user_id, handle, karma, parent_id in rows:
+                users[user_id] = (handle, karma)
+                if parent_id is None:
+                    root_ids.append(user_id)
+                else:
+                    children_by_parent.setdefault(parent_id, []).append(user_id)
+
+            logfire.debug("Identified root users", count=len(root_ids))
+
+            # Nodes are frozen, so children must exist before their parent.
+            # A depth-first walk from the roots lists every parent before its
+            # children; building in reverse order turns that around. Users
+            # whose inviter is not a user are unreachable and left out
+            order: list[UserId] = []
+            stack = list(root_ids)
+            while stack:
+                user_id = stack.pop()
+                order.append(user_id)
+                stack.extend(children_by_parent.get(user_id, ()))
+
+            nodes: dict[UserId, UserTreeNode] = {}
+            for user_id in reversed(order):
+                handle, karma = users[user_id]
+                children = sorted(
+                    (
+                        nodes[child_id]
+                        for child_id in children_by_parent.get(user_id, ())
                     ),
+                    key=_tree_sort_key,
                     reverse=True,
                 )
-
-                return UserTreeNode(
+                nodes[user_id] = UserTreeNode(
                     user_id=user_id,
                     handle=handle,
                     karma=karma,
-                    children=children,
+                    children=tuple(children),
                 )
-
-            # Build tree from all roots
-            tree_roots = [build_subtree(root_id) for root_id in roots]
-
-            # Sort roots by karma as well
-            tree_roots.sort(
-                key=lambda node: (
-                    node.karma if node.karma is not None else -1,
-                    node.handle.root,
-                ),
+            tree_roots = sorted(
+                (nodes[root_id] for root_id in root_ids),
+                key=_tree_sort_key,
                 reverse=True,
             )
 
+            if self.tree_cache is not None and cache_key is not None:
+                self.tree_cache.set(cache_key, tuple(tree_roots))
+
             logfire.info("Built invitation tree", root_count=len(tree_roots))
             return tree_roots
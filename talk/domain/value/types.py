@@ -6,11 +6,17 @@ They encapsulate validation rules and business logic.
 
 import re
 from enum import Enum
+from functools import cached_property
 
 from pydantic import field_validator
 
 from talk.domain.value.common import RootValueObject, ValueObject
 
+# Validation patterns, compiled once at import rather than looked up in the
+# re module cache on every value object construction
+_TAG_NAME_RE = re.compile(r"[a-z0-9-]{2,30}")
+_SLUG_RE = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+
 
 class VoteType(str, Enum):
     """Type of vote.
@@ -46,7 +52,7 @@ class TagName(RootValueObject[str]):
     @classmethod
     def validate_tag_name(cls, v: str) -> str:
         """Validate tag name format."""
-        if not re.match(r"^[a-z0-9-]{2,30}$", v):
+        if not _TAG_NAME_RE.fullmatch(v):
             raise ValueError(
                 "Tag name must be 2-30 characters, lowercase, alphanumeric with hyphens"
             )
@@ -108,6 +114,11 @@ class InviteToken(RootValueObject[str]):
             raise ValueError("Token must be 1-255 characters")
         return v
 
+    @cached_property
+    def short(self) -> str:
+        """Truncated token for logs, computed once per token."""
+        return self.root[:8] + "..."
+
 
 class Slug(RootValueObject[str]):
     """URL-safe slug for posts.
@@ -120,7 +131,7 @@ class Slug(RootValueObject[str]):
     @classmethod
     def validate_slug_format(cls, v: str) -> str:
         """Validate slug format."""
-        if not re.match(r"^[a-z0-9]+(?:-[a-z0-9]+)*$", v):
+        if not _SLUG_RE.fullmatch(v):
             raise ValueError(
                 "Slug must be lowercase alphanumeric with hyphens, "
                 "no leading/trailing hyphens or consecutive hyphens"
@@ -1,9 +1,10 @@
 """FastAPI application."""
 
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
 
-from talk.config import Settings
+from talk.config import get_settings
+from talk.interface.api.errors import register_exception_handlers
+from talk.interface.api.middleware import CORSMiddleware, RequestTimeMiddleware
 from talk.interface.api.routes import (
     auth,
     comments,
@@ -29,7 +30,7 @@ def create_app() -> FastAPI:
     In production, start_app.py handles this.
     In tests, configure in conftest.py if needed.
     """
-    settings = Settings()
+    settings = get_settings()
 
     # Instrument httpx for outbound HTTP requests
     # (Logfire must be configured before instrumentation)
@@ -44,7 +45,18 @@ def create_app() -> FastAPI:
     # Instrument FastAPI for automatic tracing of HTTP requests
     instrument_fastapi(app_instance)
 
-    # Setup CORS middleware
+    # Pin one timestamp per request for request_now()
+    app_instance.add_middleware(RequestTimeMiddleware)
+
+    # Setup dependency injection
+    # Settings are loaded from environment automatically
+    container = create_container()
+    setup_di(app_instance, container)
+
+    # Setup CORS middleware (plain ASGI, answers preflights itself)
+    # Added last so it wraps the DI and request-time middleware: Starlette
+    # runs middleware in reverse order of registration, so preflights are
+    # answered before a DI scope is opened
     # Safari is stricter with CORS - need explicit configuration
     app_instance.add_middleware(
         CORSMiddleware,
@@ -66,14 +78,9 @@ def create_app() -> FastAPI:
             "X-Requested-With",
         ],
         expose_headers=["Content-Length", "Content-Type"],
-        max_age=600,  # Cache preflight requests for 10 minutes
+        max_age=7200,  # Cache preflights for 2 hours (Chromium's cap)
     )
 
-    # Setup dependency injection
-    # Settings are loaded from environment automatically
-    container = create_container()
-    setup_di(app_instance, container)
-
     # Register routes
     app_instance.include_router(health.router)
     app_instance.include_router(
@@ -87,7 +94,8 @@ def create_app() -> FastAPI:
     app_instance.include_router(users.router)
     app_instance.include_router(tags.router)
 
-    # TODO: Add error handlers
+    # Translate domain errors into HTTP responses
+    register_exception_handlers(app_instance)
 
     return app_instance
 
@@ -0,0 +1,59 @@
+"""Shared FastAPI dependencies for API routes."""
+
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import Cookie, HTTPException, status
+
+from talk.domain.service import JWTService
+
+
+@inject
+async def current_user_id(
+    jwt_service: FromDishka[JWTService],
+    auth_token: str | None = Cookie(default=None),
+) -> str:
+    """Authenticate the request from its auth cookie.
+
+    Use as ``user_id: str = Depends(current_user_id)``. FastAPI caches the
+    result for the rest of the request, so the token is verified once however
+    many dependencies ask for it.
+
+    Args:
+        jwt_service: JWT service from DI
+        auth_token: JWT token from cookie
+
+    Returns:
+        Authenticated user ID
+
+    Raises:
+        HTTPException: 401 if the cookie is missing
+        JWTError: If the token is invalid or expired
+    """
+    if not auth_token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+        )
+
+    # An invalid or expired token raises JWTError, answered with 401 by the
+    # app-wide exception handler
+    return jwt_service.verify_token(auth_token).user_id
+
+
+@inject
+async def optional_user_id(
+    jwt_service: FromDishka[JWTService],
+    auth_token: str | None = Cookie(default=None),
+) -> str | None:
+    """Identify the request's user if it carries a valid auth cookie.
+
+    Use as ``user_id: str | None = Depends(optional_user_id)`` on routes that
+    work for anonymous users but personalize the response (e.g. vote state).
+
+    Args:
+        jwt_service: JWT service from DI
+        auth_token: JWT token from cookie
+
+    Returns:
+        Authenticated user ID, or None if the cookie is missing or invalid
+    """
+    return jwt_service.get_user_id_from_token(auth_token)
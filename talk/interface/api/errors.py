@@ -0,0 +1,84 @@
+"""App-wide translation of domain errors into HTTP responses.
+
+Starlette types every handler as taking Exception. Each handler is
+registered only for its own exception class, so handlers narrow the type
+with cast().
+"""
+
+from typing import cast
+
+import logfire
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+
+from talk.domain.error import (
+    ContentDeletedException,
+    InvalidEditOperationError,
+    NotAuthorizedError,
+    NotFoundError,
+)
+from talk.util.jwt import JWTError
+
+
+async def _jwt_error(request: Request, exc: Exception) -> JSONResponse:
+    """Invalid or expired auth token."""
+    return JSONResponse(
+        status_code=status.HTTP_401_UNAUTHORIZED, content={"detail": str(exc)}
+    )
+
+
+async def _not_authorized(request: Request, exc: Exception) -> JSONResponse:
+    """User tried to edit content they don't own."""
+    exc = cast(NotAuthorizedError, exc)
+    logfire.warn("Unauthorized edit attempt", error=str(exc))
+    return JSONResponse(
+        status_code=status.HTTP_403_FORBIDDEN,
+        content={"detail": f"Not authorized to edit this {exc.resource}"},
+    )
+
+
+async def _content_deleted(request: Request, exc: Exception) -> JSONResponse:
+    """User tried to edit deleted content."""
+    exc = cast(ContentDeletedException, exc)
+    logfire.warn("Attempt to edit deleted content", error=str(exc))
+    return JSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND,
+        content={
+            "detail": f"{exc.resource.capitalize()} not found or has been deleted"
+        },
+    )
+
+
+async def _invalid_edit(request: Request, exc: Exception) -> JSONResponse:
+    """Edit not allowed for this kind of content."""
+    logfire.warn("Invalid edit operation", error=str(exc))
+    return JSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        content={"detail": str(exc)},
+    )
+
+
+async def _not_found(request: Request, exc: Exception) -> JSONResponse:
+    """Requested resource does not exist."""
+    logfire.warn("Resource not found", error=str(exc))
+    return JSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND, content={"detail": str(exc)}
+    )
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """Map domain errors to HTTP responses for every route.
+
+    Only errors with one meaning across the API are mapped here. ValueError
+    stays with the routes: its status differs between them, and pydantic's
+    ValidationError subclasses it, so a global mapping would turn bugs into
+    400s.
+
+    Args:
+        app: FastAPI application
+    """
+    app.add_exception_handler(JWTError, _jwt_error)
+    app.add_exception_handler(NotAuthorizedError, _not_authorized)
+    app.add_exception_handler(ContentDeletedException, _content_deleted)
+    app.add_exception_handler(InvalidEditOperationError, _invalid_edit)
+    app.add_exception_handler(NotFoundError, _not_found)
@@ -0,0 +1,6 @@
+"""ASGI middleware for the API."""
+
+from .cors import CORSMiddleware
+from .request_time import RequestTimeMiddleware
+
+__all__ = ["CORSMiddleware", "RequestTimeMiddleware"]
@@ -0,0 +1,145 @@
+"""Middleware that answers CORS checks without entering the application."""
+
+from collections.abc import Sequence
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Request headers browsers may always send cross-origin (Fetch spec safelist)
+_SAFELISTED_HEADERS = frozenset(
+    {"accept", "accept-language", "content-language", "content-type"}
+)
+
+
+class CORSMiddleware:
+    """Handle CORS preflights and response headers as plain ASGI middleware.
+
+    Replaces Starlette's CORSMiddleware for the fixed configuration this API
+    uses: an explicit origin list, explicit methods and headers, and
+    credentials. Every response header list is built once at startup.
+    Preflights are answered here and never reach the application.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Sequence[str],
+        allow_methods: Sequence[str],
+        allow_headers: Sequence[str],
+        allow_credentials: bool = False,
+        expose_headers: Sequence[str] = (),
+        max_age: int = 600,
+    ) -> None:
+        """Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            allow_origins: Origins allowed to make cross-origin requests
+            allow_methods: Methods allowed in cross-origin requests
+            allow_headers: Request headers allowed in cross-origin requests
+            allow_credentials: Whether cookies may be sent cross-origin
+            expose_headers: Response headers readable by the browser
+            max_age: Seconds browsers may cache a preflight response
+        """
+        self.app = app
+        self.allow_methods = frozenset(allow_methods)
+        self.allow_headers = _SAFELISTED_HEADERS | {h.lower() for h in allow_headers}
+
+        simple_headers: list[tuple[bytes, bytes]] = [(b"vary", b"Origin")]
+        preflight_headers: list[tuple[bytes, bytes]] = [
+            (b"vary", b"Origin"),
+            (b"access-control-allow-methods", ", ".join(allow_methods).encode()),
+            (b"access-control-allow-headers", ", ".join(allow_headers).encode()),
+            (b"access-control-max-age", str(max_age).encode()),
+        ]
+        if allow_credentials:
+            simple_headers.append((b"access-control-allow-credentials", b"true"))
+            preflight_headers.append((b"access-control-allow-credentials", b"true"))
+        if expose_headers:
+            simple_headers.append(
+                (b"access-control-expose-headers", ", ".join(expose_headers).encode())
+            )
+
+        # Complete header lists per allowed origin, keyed by the raw header
+        # value, so requests only do a dict lookup and a list extend
+        self.simple_headers: dict[bytes, list[tuple[bytes, bytes]]] = {}
+        self.preflight_headers: dict[bytes, list[tuple[bytes, bytes]]] = {}
+        for origin in allow_origins:
+            value = origin.encode()
+            allow_origin = (b"access-control-allow-origin", value)
+            self.simple_headers[value] = [allow_origin, *simple_headers]
+            self.preflight_headers[value] = [allow_origin, *preflight_headers]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI connection."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(origin, request_method, request_headers, send)
+            return
+
+        cors_headers = self.simple_headers.get(origin)
+        if cors_headers is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", []).extend(cors_headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight(
+        self,
+        origin: bytes,
+        request_method: bytes,
+        request_headers: bytes | None,
+        send: Send,
+    ) -> None:
+        """Answer a preflight request directly."""
+        cors_headers = self.preflight_headers.get(origin)
+        failures = []
+        if cors_headers is None:
+            failures.append("origin")
+        if request_method.decode("latin-1") not in self.allow_methods:
+            failures.append("method")
+        if request_headers:
+            for header in request_headers.decode("latin-1").lower().split(","):
+                if header.strip() not in self.allow_headers:
+                    failures.append("headers")
+                    break
+
+        if cors_headers is None or failures:
+            body = f"Disallowed CORS {', '.join(failures)}".encode()
+            status = 400
+            headers = [
+                (b"vary", b"Origin"),
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", str(len(body)).encode()),
+            ]
+        else:
+            body = b""
+            status = 204
+            headers = list(cors_headers)
+
+        await send(
+            {"type": "http.response.start", "status": status, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,33 @@
+"""Middleware that pins a single timestamp per request."""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from talk.util.time import reset_request_now, set_request_now
+
+
+class RequestTimeMiddleware:
+    """Capture one timestamp at request entry for request_now().
+
+    Implemented as plain ASGI middleware so the context variable is set in the
+    same context that runs the endpoint.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI connection."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = set_request_now()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            reset_request_now(token)
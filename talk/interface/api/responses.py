@@ -0,0 +1,65 @@
+"""Response classes for API routes."""
+
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+class PydanticJSONResponse(JSONResponse):
+    """JSON response rendered straight from a Pydantic model.
+
+    Routes that return this instead of the bare model skip FastAPI's response
+    handling (re-validation against response_model, jsonable_encoder, then
+    json.dumps); the model is serialized once by pydantic-core. Keep
+    response_model on the route so the OpenAPI schema is unchanged.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serialize content, using pydantic-core for models."""
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode()
+        return super().render(content)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def cacheable_json_response(
+    request: Request, content: BaseModel, max_age: int
+) -> Response:
+    """Render a public, cacheable JSON response with an ETag.
+
+    Only for responses that are the same for every user. Clients revalidating
+    with a matching If-None-Match get an empty 304 instead of the body.
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        content: Response model
+        max_age: Seconds clients and shared caches may reuse the response
+
+    Returns:
+        200 response with the rendered body, or 304 Not Modified
+    """
+    response = PydanticJSONResponse(content)
+    digest = hashlib.blake2b(bytes(response.body), digest_size=8).hexdigest()
+    headers = {
+        "ETag": f'W/"{digest}"',
+        "Cache-Control": f"public, max-age={max_age}",
+    }
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return response
@@ -1,6 +1,11 @@
 """Authentication routes."""
 
 import logging
+import secrets
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Literal
+from urllib.parse import quote_plus
 
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
 from fastapi import APIRouter, Cookie, HTTPException, Response, status
@@ -25,6 +30,59 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/auth", tags=["authentication"], route_class=DishkaRoute)
 
 
+@dataclass(frozen=True, slots=True)
+class _CookieParams:
+    """Auth cookie attributes for one deployment environment."""
+
+    domain: str | None
+    secure: bool
+    samesite: Literal["lax", "none"]
+    max_age: int
+    # Serialized attributes, appended to "auth_token=<jwt>" in Set-Cookie
+    set_cookie_suffix: str
+
+
+@lru_cache(maxsize=4)
+def _cookie_params(environment: str, jwt_expiry_days: int) -> _CookieParams:
+    """Derive auth cookie attributes, once per environment.
+
+    Production (cross-subdomain): talk.amacrin.com → api.talk.amacrin.com
+      - samesite="none" required for cross-site requests
+      - secure=True required when samesite="none"
+      - domain=".amacrin.com" to share across subdomains
+    Development (same-origin): localhost:3000 → localhost:8000
+      - samesite="lax" for same-origin requests
+      - secure=False to allow HTTP
+      - domain=None (default to current host)
+
+    Args:
+        environment: Deployment environment from settings
+        jwt_expiry_days: JWT lifetime in days
+
+    Returns:
+        Cookie attributes
+    """
+    is_production = environment == "production"
+    domain = ".amacrin.com" if is_production else None
+    samesite = "none" if is_production else "lax"
+    max_age = jwt_expiry_days * 24 * 60 * 60
+
+    # Same attribute order and spelling as Starlette's set_cookie
+    suffix = f"; HttpOnly; Max-Age={max_age}; Path=/; SameSite={samesite}"
+    if domain:
+        suffix = f"; Domain={domain}{suffix}"
+    if is_production:
+        suffix += "; Secure"
+
+    return _CookieParams(
+        domain=domain,
+        secure=is_production,
+        samesite=samesite,
+        max_age=max_age,
+        set_cookie_suffix=suffix,
+    )
+
+
 class InitiateLoginRequest(BaseModel):
     """Initiate login request for multi-provider authentication.
 
@@ -110,11 +168,9 @@ async def initiate_login(
         }
     """
     try:
-        logger.info(f"Initiating {request.provider.value} login")
+        logger.info("Initiating %s login", request.provider.value)
 
         # Generate state for CSRF protection (in production, this should be stored securely)
-        import secrets
-
         state = secrets.token_urlsafe(32)
 
         # All providers now use the same initiate_login method
@@ -238,7 +294,10 @@ async def _handle_oauth_callback(
     after provider-specific parameters have been extracted.
     """
     logger.info(
-        f"OAuth callback received: provider={provider.value}, state={state}, iss={iss}"
+        "OAuth callback received: provider=%s, state=%s, iss=%s",
+        provider.value,
+        state,
+        iss,
     )
 
     try:
@@ -253,36 +312,21 @@ async def _handle_oauth_callback(
                 invite_token=invite_token,
             )
         )
-        logger.info(f"Login successful for user: {login_response.handle}")
+        logger.info("Login successful for user: %s", login_response.handle)
 
         # Set HTTP-only cookie with JWT token
-        # Production (cross-subdomain): talk.amacrin.com → api.talk.amacrin.com
-        #   - samesite="none" required for cross-site requests
-        #   - secure=True required when samesite="none"
-        #   - domain=".amacrin.com" to share across subdomains
-        # Development (same-origin): localhost:3000 → localhost:8000
-        #   - samesite="lax" for same-origin requests
-        #   - secure=False to allow HTTP
-        #   - domain=None (default to current host)
-        is_production = settings.environment == "production"
-
-        # Prepare cookie settings
-        cookie_domain = ".amacrin.com" if is_production else None
-        cookie_secure = is_production
-        cookie_samesite = "none" if is_production else "lax"
-        cookie_max_age = settings.auth.jwt_expiry_days * 24 * 60 * 60
-
-        logger.info(
-            f"Setting auth cookie with settings: "
-            f"environment={settings.environment}, "
-            f"is_production={is_production}, "
-            f"domain={cookie_domain}, "
-            f"secure={cookie_secure}, "
-            f"samesite={cookie_samesite}, "
-            f"httponly=True, "
-            f"path=/, "
-            f"max_age={cookie_max_age}"
-        )
+        cookie = _cookie_params(settings.environment, settings.auth.jwt_expiry_days)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Setting auth cookie with settings: environment=%s, domain=%s, "
+                "secure=%s, samesite=%s, httponly=True, path=/, max_age=%s",
+                settings.environment,
+                cookie.domain,
+                cookie.secure,
+                cookie.samesite,
+                cookie.max_age,
+            )
 
         # Create redirect response and set cookie on it
         # IMPORTANT: When returning a Response directly (like RedirectResponse),
@@ -293,42 +337,50 @@ async def _handle_oauth_callback(
             status_code=status.HTTP_302_FOUND,
         )
 
-        redirect_response.set_cookie(
-            key="auth_token",
-            value=login_response.token,
-            httponly=True,
-            secure=cookie_secure,
-            samesite=cookie_samesite,
-            domain=cookie_domain,
-            path="/",
-            max_age=cookie_max_age,
-        )
+        # The JWT is base64url segments joined by dots, so it needs no cookie
+        # quoting; skip set_cookie's SimpleCookie round-trip
+        set_cookie = f"auth_token={login_response.token}{cookie.set_cookie_suffix}"
+        redirect_response.raw_headers.append((b"set-cookie", set_cookie.encode()))
 
-        logger.info(f"Auth cookie set successfully, redirecting to: {redirect_url}")
+        logger.info("Auth cookie set successfully, redirecting to: %s", redirect_url)
 
         return redirect_response
 
     except ValueError as e:
         # Invite-only error
-        logger.error(f"Invite-only error during OAuth callback: {str(e)}")
-        return RedirectResponse(
-            url=f"{settings.api.frontend_url}/auth/error?error=no_invite&message={str(e)}",
-            status_code=status.HTTP_302_FOUND,
-        )
+        logger.error("Invite-only error during OAuth callback: %s", e)
+        return _error_redirect(settings, "no_invite", e)
     except BlueskyAuthError as e:
         # OAuth error
-        logger.error(f"Bluesky OAuth error during callback: {str(e)}")
-        return RedirectResponse(
-            url=f"{settings.api.frontend_url}/auth/error?error=auth_failed&message={str(e)}",
-            status_code=status.HTTP_302_FOUND,
-        )
+        logger.error("Bluesky OAuth error during callback: %s", e)
+        return _error_redirect(settings, "auth_failed", e)
     except Exception as e:
         # Unexpected error
-        logger.exception(f"Unexpected error during OAuth callback: {str(e)}")
-        return RedirectResponse(
-            url=f"{settings.api.frontend_url}/auth/error?error=unexpected&message={str(e)}",
-            status_code=status.HTTP_302_FOUND,
-        )
+        logger.exception("Unexpected error during OAuth callback: %s", e)
+        return _error_redirect(settings, "unexpected", e)
+
+
+def _error_redirect(settings: Settings, error: str, exc: Exception) -> RedirectResponse:
+    """Redirect to the frontend's auth error page.
+
+    The exception message is URL-encoded, so it cannot inject extra query
+    parameters or break the URL.
+
+    Args:
+        settings: Application settings
+        error: Error code for the frontend
+        exc: Exception whose message is shown to the user
+
+    Returns:
+        HTTP 302 redirect to the error page
+    """
+    return RedirectResponse(
+        url=(
+            f"{settings.api.frontend_url}/auth/error"
+            f"?error={error}&message={quote_plus(str(exc))}"
+        ),
+        status_code=status.HTTP_302_FOUND,
+    )
 
 
 @router.post("/logout", response_model=LogoutResponse)
@@ -346,12 +398,8 @@ async def logout(
         Logout success message
     """
     # Delete cookie with same domain/path as when it was created
-    is_production = settings.environment == "production"
-    response.delete_cookie(
-        key="auth_token",
-        domain=".amacrin.com" if is_production else None,
-        path="/",
-    )
+    cookie = _cookie_params(settings.environment, settings.auth.jwt_expiry_days)
+    response.delete_cookie(key="auth_token", domain=cookie.domain, path="/")
     return LogoutResponse(success=True, message="Successfully logged out")
 
 
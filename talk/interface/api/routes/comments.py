@@ -2,7 +2,7 @@
 
 import logfire
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter, Cookie, HTTPException, status
+from fastapi import APIRouter, Cookie, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 
 from talk.application.usecase.comment import (
@@ -16,8 +16,7 @@ from talk.application.usecase.comment import (
     UpdateCommentResponse,
     UpdateCommentUseCase,
 )
-from talk.domain.error import ContentDeletedException, NotAuthorizedError, NotFoundError
-from talk.domain.service import JWTService
+from talk.interface.api.deps import current_user_id
 
 router = APIRouter(prefix="/posts", tags=["comments"], route_class=DishkaRoute)
 
@@ -38,8 +37,7 @@ async def create_comment(
     post_id: str,
     request: CreateCommentAPIRequest,
     create_comment_use_case: FromDishka[CreateCommentUseCase],
-    jwt_service: FromDishka[JWTService],
-    auth_token: str | None = Cookie(default=None),
+    user_id: str = Depends(current_user_id),
 ) -> CreateCommentResponse:
     """Create a comment on a post or reply to another comment.
 
@@ -49,8 +47,7 @@ async def create_comment(
         post_id: Post UUID
         request: Comment creation data
         create_comment_use_case: Create comment use case from DI
-        jwt_service: JWT service for token verification (injected)
-        auth_token: JWT token from cookie
+        user_id: Authenticated user ID
 
     Returns:
         Created comment details
@@ -58,14 +55,6 @@ async def create_comment(
     Raises:
         HTTPException: If not authenticated or validation fails
     """
-    # Verify authentication and get user ID
-    user_id = jwt_service.get_user_id_from_token(auth_token)
-    if not user_id:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authentication required to create comments",
-        )
-
     # Create comment
     try:
         use_case_request = CreateCommentRequest(
@@ -75,12 +64,6 @@ async def create_comment(
             parent_id=request.parent_id,
         )
         return await create_comment_use_case.execute(use_case_request)
-    except NotFoundError as e:
-        logfire.warn("Comment creation failed - user not found", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -100,8 +83,7 @@ async def update_comment(
     comment_id: str,
     request: UpdateCommentAPIRequest,
     update_comment_use_case: FromDishka[UpdateCommentUseCase],
-    jwt_service: FromDishka[JWTService],
-    auth_token: str | None = Cookie(default=None),
+    user_id: str = Depends(current_user_id),
 ) -> UpdateCommentResponse:
     """Update a comment's text content.
 
@@ -112,8 +94,7 @@ async def update_comment(
         comment_id: Comment UUID
         request: Update data (text content)
         update_comment_use_case: Update comment use case from DI
-        jwt_service: JWT service for token verification (injected)
-        auth_token: JWT token from cookie
+        user_id: Authenticated user ID
 
     Returns:
         Updated comment details
@@ -121,14 +102,6 @@ async def update_comment(
     Raises:
         HTTPException: If not authenticated, not authorized, or validation fails
     """
-    # Verify authentication and get user ID
-    user_id = jwt_service.get_user_id_from_token(auth_token)
-    if not user_id:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authentication required to edit comments",
-        )
-
     # Update comment
     try:
         use_case_request = UpdateCommentRequest(
@@ -141,30 +114,12 @@ async def update_comment(
         result = await update_comment_use_case.execute(use_case_request)
         return result
 
-    except NotAuthorizedError as e:
-        logfire.warn("Unauthorized comment update attempt", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to edit this comment",
-        )
-    except ContentDeletedException as e:
-        logfire.warn("Attempt to edit deleted comment", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Comment or post not found or has been deleted",
-        )
     except ValueError as e:
         logfire.warn("Comment update validation error", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
-    except Exception as e:
-        logfire.error("Unexpected error updating comment", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update comment",
-        )
 
 
 @router.get("/{post_id}/comments", response_model=GetCommentsResponse)
@@ -7,10 +7,14 @@ from fastapi import APIRouter, Request
 from pydantic import BaseModel
 
 from talk.config import Settings
+from talk.util.time import request_now
 
 
 router = APIRouter(tags=["health"], route_class=DishkaRoute)
 
+# Local development origins allowed by the CORS middleware in create_app
+_LOCAL_ORIGINS = ("http://localhost:3000", "http://localhost:5173")
+
 
 class HealthResponse(BaseModel):
     """Health check response."""
@@ -39,14 +43,16 @@ async def health_check(settings: FromDishka[Settings]) -> HealthResponse:
     """
     return HealthResponse(
         status="healthy",
-        timestamp=datetime.now(),
+        timestamp=request_now(),
         version="0.1.0",
         git_sha=settings.git_sha,
     )
 
 
 @router.get("/health/cors", response_model=CORSDebugResponse)
-async def cors_debug(request: Request) -> CORSDebugResponse:
+async def cors_debug(
+    request: Request, settings: FromDishka[Settings]
+) -> CORSDebugResponse:
     """Debug CORS configuration.
 
     Useful for troubleshooting CORS issues, especially in Safari.
@@ -54,17 +60,9 @@ async def cors_debug(request: Request) -> CORSDebugResponse:
     Returns:
         CORS configuration details and request headers
     """
-    from talk.config import Settings
-
-    settings = Settings()
-
     return CORSDebugResponse(
         origin=request.headers.get("origin"),
-        allowed_origins=[
-            settings.api.frontend_url,
-            "http://localhost:3000",
-            "http://localhost:5173",
-        ],
+        allowed_origins=[settings.api.frontend_url, *_LOCAL_ORIGINS],
         cors_enabled=True,
         headers=dict(request.headers),
     )
@@ -1,7 +1,7 @@
 """Invite routes."""
 
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter, Cookie, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 
 from talk.application.usecase.invite import (
@@ -22,25 +22,18 @@ from talk.application.usecase.invite.validate_invite import (
     ValidateInviteRequest,
     ValidateInviteResponse,
 )
-from talk.domain.service import JWTService
-from talk.domain.value import AuthProvider, InviteStatus
-from talk.util.jwt import JWTError
+from talk.domain.value import InviteStatus
+from talk.interface.api.deps import current_user_id
 
 router = APIRouter(prefix="/invites", tags=["invites"], route_class=DishkaRoute)
 
 
-class InviteeAPIInfo(BaseModel):
-    """API info for a single invitee."""
-
-    provider: AuthProvider
-    handle: str
-    name: str | None = None
-
-
 class CreateInvitesAPIRequest(BaseModel):
     """API request for creating invites."""
 
-    invitees: list[InviteeAPIInfo]
+    # Parsed straight into the use case's invitee model, so the route
+    # passes the list through without copying each invitee
+    invitees: list[InviteeInfo]
 
 
 @router.post(
@@ -49,16 +42,14 @@ class CreateInvitesAPIRequest(BaseModel):
 async def create_invites(
     request: CreateInvitesAPIRequest,
     create_invites_use_case: FromDishka[CreateInvitesUseCase],
-    jwt_service: FromDishka[JWTService],
-    auth_token: str | None = Cookie(default=None),
+    user_id: str = Depends(current_user_id),
 ) -> CreateInvitesResponse:
     """Create multiple invites.
 
     Args:
         request: Request with list of handles to invite
         create_invites_use_case: Create invites use case from DI
-        jwt_service: JWT service from DI
-        auth_token: JWT token from cookie
+        user_id: Authenticated user ID
 
     Returns:
         Response with created count and failed handles
@@ -66,33 +57,11 @@ async def create_invites(
     Raises:
         HTTPException: If not authenticated or quota exceeded
     """
-    # Authenticate user
-    if not auth_token:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated",
-        )
-
-    try:
-        payload = jwt_service.verify_token(auth_token)
-    except JWTError as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e),
-        )
-
     # Execute use case
     try:
         use_case_request = CreateInvitesRequest(
-            inviter_id=payload.user_id,
-            invitees=[
-                InviteeInfo(
-                    provider=invitee.provider,
-                    handle=invitee.handle,
-                    name=invitee.name,
-                )
-                for invitee in request.invitees
-            ],
+            inviter_id=user_id,
+            invitees=request.invitees,
         )
         response = await create_invites_use_case.execute(use_case_request)
         return response
@@ -107,8 +76,7 @@ async def create_invites(
 @router.get("", response_model=GetInvitesResponse)
 async def get_invites(
     get_invites_use_case: FromDishka[GetInvitesUseCase],
-    jwt_service: FromDishka[JWTService],
-    auth_token: str | None = Cookie(default=None),
+    user_id: str = Depends(current_user_id),
     status_filter: InviteStatus | None = Query(default=None, alias="status"),
     limit: int = Query(default=50, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
@@ -117,8 +85,7 @@ async def get_invites(
 
     Args:
         get_invites_use_case: Get invites use case from DI
-        jwt_service: JWT service from DI
-        auth_token: JWT token from cookie
+        user_id: Authenticated user ID
         status_filter: Optional status filter (pending, accepted)
         limit: Maximum number of results (1-100)
         offset: Number of results to skip
@@ -129,24 +96,9 @@ async def get_invites(
     Raises:
         HTTPException: If not authenticated
     """
-    # Authenticate user
-    if not auth_token:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated",
-        )
-
-    try:
-        payload = jwt_service.verify_token(auth_token)
-    except JWTError as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e),
-        )
-
     # Execute use case
     request = GetInvitesRequest(
-        inviter_id=payload.user_id,
+        inviter_id=user_id,
         status=status_filter,
         limit=limit,
         offset=offset,
@@ -1,13 +1,18 @@
 """OAuth client metadata endpoint for AT Protocol."""
 
+from functools import lru_cache
+
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from pydantic import BaseModel
 
 from talk.config import Settings
 
 router = APIRouter(route_class=DishkaRoute)
 
+# Seconds clients may reuse the metadata document
+_METADATA_MAX_AGE = 3600
+
 
 class OAuthClientMetadata(BaseModel):
     """OAuth client metadata response."""
@@ -25,15 +30,43 @@ class OAuthClientMetadata(BaseModel):
     dpop_bound_access_tokens: bool
 
 
+@lru_cache(maxsize=4)
+def _metadata_body(base_url: str, callback_url: str) -> bytes:
+    """Render the metadata document for a base URL and callback URL.
+
+    Cached because the result only changes with settings.
+    """
+    metadata = OAuthClientMetadata(
+        client_id=f"{base_url}/.well-known/oauth-client-metadata",
+        client_name="Science Talk",
+        client_uri=base_url,
+        logo_uri=f"{base_url}/amacrin.svg",
+        redirect_uris=[callback_url],
+        grant_types=[
+            "authorization_code",
+            "refresh_token",
+        ],  # Required by AT Protocol spec
+        response_types=["code"],
+        scope="atproto",
+        token_endpoint_auth_method="none",  # Public client (no client secret)
+        application_type="web",
+        dpop_bound_access_tokens=True,  # REQUIRED by AT Protocol
+    )
+    return metadata.model_dump_json().encode()
+
+
 @router.get("/.well-known/oauth-client-metadata", response_model=OAuthClientMetadata)
-def get_oauth_client_metadata(settings: FromDishka[Settings]) -> OAuthClientMetadata:
+async def get_oauth_client_metadata(settings: FromDishka[Settings]) -> Response:
     """Serve OAuth client metadata for AT Protocol authentication.
 
     This endpoint provides metadata about this OAuth client, which serves
     as the client_id in AT Protocol OAuth flows. The URL of this endpoint
     is used as the client identifier.
 
-    This must be publicly accessible over HTTPS in production.
+    This must be publicly accessible over HTTPS in production. The document
+    only depends on settings, so it is rendered once per configuration and
+    served from memory. Async, since it does no blocking work and would
+    otherwise be dispatched to the threadpool.
 
     Returns:
         OAuth client metadata JSON per AT Protocol spec
@@ -53,21 +86,10 @@ def get_oauth_client_metadata(settings: FromDishka[Settings]) -> OAuthClientMeta
             "dpop_bound_access_tokens": true
         }
     """
-    base_url = settings.api.base_url
-
-    return OAuthClientMetadata(
-        client_id=f"{base_url}/.well-known/oauth-client-metadata",
-        client_name="Science Talk",
-        client_uri=base_url,
-        logo_uri=f"{base_url}/amacrin.svg",
-        redirect_uris=[settings.auth.bluesky_callback_url],
-        grant_types=[
-            "authorization_code",
-            "refresh_token",
-        ],  # Required by AT Protocol spec
-        response_types=["code"],
-        scope="atproto",
-        token_endpoint_auth_method="none",  # Public client (no client secret)
-        application_type="web",
-        dpop_bound_access_tokens=True,  # REQUIRED by AT Protocol
+    return Response(
+        content=_metadata_body(
+            settings.api.base_url, settings.auth.bluesky_callback_url
+        ),
+        media_type="application/json",
+        headers={"Cache-Control": f"public, max-age={_METADATA_MAX_AGE}"},
     )
@@ -4,7 +4,7 @@ import logfire
 from uuid import UUID
 
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter, Cookie, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
 
 from talk.application.usecase.post import (
@@ -22,14 +22,12 @@ from talk.application.usecase.post import (
     UpdatePostUseCase,
 )
 from talk.domain.error import (
-    ContentDeletedException,
     DomainError,
-    InvalidEditOperationError,
-    NotAuthorizedError,
     NotFoundError,
 )
 from talk.domain.repository.post import PostSortOrder
-from talk.domain.service import JWTService
+from talk.interface.api.deps import current_user_id, optional_user_id
+from talk.interface.api.responses import PydanticJSONResponse
 
 router = APIRouter(prefix="/posts", tags=["posts"], route_class=DishkaRoute)
 
@@ -47,9 +45,8 @@ class CreatePostAPIRequest(BaseModel):
 async def create_post(
     request: CreatePostAPIRequest,
     create_post_use_case: FromDishka[CreatePostUseCase],
-    jwt_service: FromDishka[JWTService],
-    auth_token: str | None = Cookie(default=None),
-) -> CreatePostResponse:
+    user_id: str = Depends(current_user_id),
+) -> PydanticJSONResponse:
     """Create a new post.
 
     Requires authentication.
@@ -57,8 +54,7 @@ async def create_post(
     Args:
         request: Post creation data
         create_post_use_case: Create post use case from DI
-        jwt_service: JWT service for token verification (injected)
-        auth_token: JWT token from cookie
+        user_id: Authenticated user ID
 
     Returns:
         Created post details
@@ -66,14 +62,6 @@ async def create_post(
     Raises:
         HTTPException: If not authenticated or validation fails
     """
-    # Verify authentication and get user ID
-    user_id = jwt_service.get_user_id_from_token(auth_token)
-    if not user_id:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authentication required to create posts",
-        )
-
     # Create post
     try:
         use_case_request = CreatePostRequest(
@@ -85,7 +73,7 @@ async def create_post(
         )
 
         result = await create_post_use_case.execute(use_case_request)
-        return result
+        return PydanticJSONResponse(result, status_code=status.HTTP_201_CREATED)
 
     except NotFoundError as e:
         logfire.warn("Post creation failed - user not found", error=str(e))
@@ -124,9 +112,8 @@ async def update_post(
     post_id: UUID,
     request: UpdatePostAPIRequest,
     update_post_use_case: FromDishka[UpdatePostUseCase],
-    jwt_service: FromDishka[JWTService],
-    auth_token: str | None = Cookie(default=None),
-) -> UpdatePostResponse:
+    user_id: str = Depends(current_user_id),
+) -> PydanticJSONResponse:
     """Update a post's text content.
 
     Only the post author can edit. Only text-based posts (Discussion, Ask) can have text edited.
@@ -135,8 +122,7 @@ async def update_post(
         post_id: Post UUID
         request: Update data (text content)
         update_post_use_case: Update post use case from DI
-        jwt_service: JWT service for token verification (injected)
-        auth_token: JWT token from cookie
+        user_id: Authenticated user ID
 
     Returns:
         Updated post details
@@ -144,14 +130,6 @@ async def update_post(
     Raises:
         HTTPException: If not authenticated, not authorized, or validation fails
     """
-    # Verify authentication and get user ID
-    user_id = jwt_service.get_user_id_from_token(auth_token)
-    if not user_id:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authentication required to edit posts",
-        )
-
     # Update post
     try:
         use_case_request = UpdatePostRequest(
@@ -161,47 +139,22 @@ async def update_post(
         )
 
         result = await update_post_use_case.execute(use_case_request)
-        return result
+        return PydanticJSONResponse(result)
 
-    except NotAuthorizedError as e:
-        logfire.warn("Unauthorized post update attempt", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to edit this post",
-        )
-    except ContentDeletedException as e:
-        logfire.warn("Attempt to edit deleted post", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Post not found or has been deleted",
-        )
-    except InvalidEditOperationError as e:
-        logfire.warn("Invalid edit operation", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(e),
-        )
     except ValueError as e:
         logfire.warn("Post update validation error", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
-    except Exception as e:
-        logfire.error("Unexpected error updating post", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update post",
-        )
 
 
 @router.get("/by-id/{post_id}", response_model=GetPostResponse)
 async def get_post_by_id(
     post_id: UUID,
     get_post_use_case: FromDishka[GetPostUseCase],
-    jwt_service: FromDishka[JWTService],
-    auth_token: str | None = Cookie(default=None),
-) -> GetPostResponse:
+    user_id: str | None = Depends(optional_user_id),
+) -> PydanticJSONResponse:
     """Get a post by UUID.
 
     Legacy endpoint for UUID-based lookups. Useful for API integrations
@@ -210,8 +163,7 @@ async def get_post_by_id(
     Args:
         post_id: Post UUID
         get_post_use_case: Get post use case from DI
-        jwt_service: JWT service for token verification (injected)
-        auth_token: JWT token from cookie (optional)
+        user_id: Authenticated user ID (None if anonymous)
 
     Returns:
         Post details
@@ -219,9 +171,6 @@ async def get_post_by_id(
     Raises:
         HTTPException: If post not found
     """
-    # Get user ID from token without database queries
-    user_id = jwt_service.get_user_id_from_token(auth_token)
-
     try:
         post = await get_post_use_case.execute(
             GetPostRequest(post_id=str(post_id), user_id=user_id)
@@ -234,7 +183,7 @@ async def get_post_by_id(
                 detail="Post not found",
             )
 
-        return post
+        return PydanticJSONResponse(post)
 
     except HTTPException:
         raise
@@ -252,9 +201,8 @@ async def get_post_by_id(
 async def get_post_by_slug(
     slug: str,
     get_post_use_case: FromDishka[GetPostUseCase],
-    jwt_service: FromDishka[JWTService],
-    auth_token: str | None = Cookie(default=None),
-) -> GetPostResponse:
+    user_id: str | None = Depends(optional_user_id),
+) -> PydanticJSONResponse:
     """Get a post by slug.
 
     Primary endpoint for accessing posts via SEO-friendly URLs.
@@ -262,8 +210,7 @@ async def get_post_by_slug(
     Args:
         slug: Post slug (e.g., 'new-crispr-technique-improves-accuracy')
         get_post_use_case: Get post use case from DI
-        jwt_service: JWT service for token verification (injected)
-        auth_token: JWT token from cookie (optional)
+        user_id: Authenticated user ID (None if anonymous)
 
     Returns:
         Post details
@@ -271,9 +218,6 @@ async def get_post_by_slug(
     Raises:
         HTTPException: If post not found
     """
-    # Get user ID from token without database queries
-    user_id = jwt_service.get_user_id_from_token(auth_token)
-
     try:
         post = await get_post_use_case.execute(
             GetPostRequest(slug=slug, user_id=user_id)
@@ -286,7 +230,7 @@ async def get_post_by_slug(
                 detail="Post not found",
             )
 
-        return post
+        return PydanticJSONResponse(post)
 
     except HTTPException:
         raise
@@ -301,30 +245,31 @@ async def get_post_by_slug(
 @router.get("", response_model=ListPostsResponse)
 async def list_posts(
     list_posts_use_case: FromDishka[ListPostsUseCase],
-    jwt_service: FromDishka[JWTService],
     sort: PostSortOrder = PostSortOrder.RECENT,
     tag: str | None = None,
     limit: int = 30,
-    offset: int = 0,
-    auth_token: str | None = Cookie(default=None),
-) -> ListPostsResponse:
+    offset: int = Query(default=0, deprecated=True),
+    cursor: str | None = None,
+    user_id: str | None = Depends(optional_user_id),
+) -> PydanticJSONResponse:
     """List posts with filtering and pagination.
 
+    Recent and active listings return next_cursor; pass it back as cursor to
+    fetch the following page. offset is deprecated and kept for hot sort and
+    existing clients.
+
     Args:
         list_posts_use_case: List posts use case from DI
-        jwt_service: JWT service for token verification (injected)
         sort: Sort order (recent or active)
         tag: Filter by tag name (optional)
         limit: Maximum number of posts to return (1-100)
-        offset: Number of posts to skip
-        auth_token: JWT token from cookie (optional)
+        offset: Number of posts to skip (deprecated, use cursor)
+        cursor: next_cursor from the previous page (recent and active sort)
+        user_id: Authenticated user ID (None if anonymous)
 
     Returns:
         List of posts
     """
-    # Get user ID from token without database queries
-    user_id = jwt_service.get_user_id_from_token(auth_token)
-
     # Validate pagination
     if limit < 1 or limit > 100:
         raise HTTPException(
@@ -342,12 +287,13 @@ async def list_posts(
         tag=tag,
         limit=limit,
         offset=offset,
+        cursor=cursor,
         user_id=user_id,
     )
 
     try:
         result = await list_posts_use_case.execute(request)
-        return result
+        return PydanticJSONResponse(result)
 
     except ValueError as e:
         logfire.warn("List posts validation error", error=str(e))
@@ -2,13 +2,17 @@
 
 import logfire
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 
 from talk.application.usecase.tag import (
     ListTagsRequest,
     ListTagsResponse,
     ListTagsUseCase,
 )
+from talk.interface.api.responses import cacheable_json_response
+
+# Seconds clients may reuse a tag listing (TagListCache ttl)
+_TAGS_MAX_AGE = 60
 
 router = APIRouter(
     prefix="/tags",
@@ -24,13 +28,18 @@ router = APIRouter(
     description="Get a list of all available tags for categorizing posts.",
 )
 async def list_tags(
+    request: Request,
     use_case: FromDishka[ListTagsUseCase],
     limit: int = 100,
     order_by: str = "name",
-) -> ListTagsResponse:
+) -> Response:
     """List all available tags.
 
+    Responses carry an ETag and may be cached for a minute, matching the
+    server-side tag list cache; revalidations that still match get a 304.
+
     Args:
+        request: Incoming request (for If-None-Match)
         use_case: List tags use case (injected)
         limit: Maximum number of tags to return (1-100)
         order_by: Sort order ('name' or 'created_at')
@@ -42,5 +51,5 @@ async def list_tags(
         GET /tags?limit=10&order_by=name
     """
     with logfire.span("api.list_tags", limit=limit, order_by=order_by):
-        request = ListTagsRequest(limit=limit, order_by=order_by)
-        return await use_case.execute(request)
+        result = await use_case.execute(ListTagsRequest(limit=limit, order_by=order_by))
+        return cacheable_json_response(request, result, max_age=_TAGS_MAX_AGE)
@@ -20,7 +20,6 @@ from talk.application.usecase.user.update_user_profile import (
 )
 from talk.domain.service import JWTService
 from talk.domain.value.types import Handle
-from talk.util.jwt import JWTError
 
 router = APIRouter(prefix="/users", tags=["users"], route_class=DishkaRoute)
 
@@ -176,13 +175,7 @@ async def update_my_profile(
             detail="Not authenticated",
         )
 
-    try:
-        payload = jwt_service.verify_token(auth_token)
-    except JWTError as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e),
-        )
+    payload = jwt_service.verify_token(auth_token)
 
     # Execute use case
     try:
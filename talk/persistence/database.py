@@ -25,12 +25,17 @@ def create_engine(settings: Settings) -> AsyncEngine:
     Returns:
         Configured async engine
     """
+    database = settings.database
     return create_async_engine(
-        settings.database_url,
+        database.url,
         echo=settings.debug,  # Log SQL queries in debug mode
         pool_pre_ping=True,  # Verify connections before using
-        pool_size=5,  # Connection pool size
-        max_overflow=10,  # Max connections beyond pool_size
+        pool_size=database.pool_size,  # Connection pool size
+        max_overflow=database.max_overflow,  # Max connections beyond pool_size
+        connect_args={
+            # Reuse prepared statements for repeated repository queries
+            "prepared_statement_cache_size": database.statement_cache_size,
+        },
     )
 
 
@@ -4,6 +4,7 @@ Since we're using Pydantic domain models (immutable), we use manual mapping
 instead of SQLAlchemy's classical imperative mapping.
 """
 
+from functools import lru_cache
 from typing import Any, Dict
 from uuid import UUID
 
@@ -26,6 +27,12 @@ from talk.domain.value import (
 )
 from talk.domain.value.types import Handle
 
+# Tag names and author handles repeat across rows (every post in a listing,
+# every comment in a thread). Value objects are immutable, so rows share one
+# validated instance instead of re-running validation for each occurrence.
+_tag_name = lru_cache(maxsize=1024)(TagName)
+_handle = lru_cache(maxsize=4096)(Handle)
+
 
 def row_to_user(row: Dict[str, Any]) -> User:
     """Convert database row to User domain model.
@@ -111,7 +118,7 @@ def row_to_tag(row: Dict[str, Any]) -> Tag:
 
     return Tag(
         id=TagId(UUID(row["id"]) if isinstance(row["id"], str) else row["id"]),
-        name=TagName(row["name"]),
+        name=_tag_name(row["name"]),
         description=row["description"],
         type=TagType(row["type"]),
         created_at=row["created_at"],
@@ -153,10 +160,10 @@ def row_to_post(row: Dict[str, Any], tag_names: list[str] | None = None) -> Post
             if isinstance(row["author_id"], str)
             else row["author_id"]
         ),
-        author_handle=Handle(row["author_handle"]),
+        author_handle=_handle(row["author_handle"]),
         url=row.get("url"),
         text=row.get("text"),
-        tag_names=[TagName(name) for name in tag_names],
+        tag_names=[_tag_name(name) for name in tag_names],
         points=row["points"],
         comment_count=row["comment_count"],
         created_at=row["created_at"],
@@ -200,7 +207,7 @@ def row_to_comment(row: Dict[str, Any]) -> Comment:
             if isinstance(row["author_id"], str)
             else row["author_id"]
         ),
-        author_handle=Handle(row["author_handle"]),
+        author_handle=_handle(row["author_handle"]),
         text=row["text"],
         parent_id=CommentId(
             UUID(row["parent_id"])
@@ -260,9 +267,13 @@ def vote_to_dict(vote: Vote) -> Dict[str, Any]:
         vote: Vote domain model
 
     Returns:
-        Dict suitable for database insertion/update
+        Dict suitable for database insertion/update. created_at is left out
+        until it is set, so the database default (now()) assigns it.
     """
-    return vote.model_dump()
+    data = vote.model_dump()
+    if data["created_at"] is None:
+        del data["created_at"]
+    return data
 
 
 def row_to_invite(row: Dict[str, Any]) -> Invite:
@@ -19,6 +19,14 @@ class InMemoryPostRepository(PostRepository):
         """Find a post by ID."""
         return self._posts.get(post_id)
 
+    async def find_by_ids(self, post_ids: list[PostId]) -> dict[PostId, Post]:
+        """Find several posts by ID."""
+        return {
+            post_id: self._posts[post_id]
+            for post_id in post_ids
+            if post_id in self._posts
+        }
+
     async def find_by_slug(self, slug: Slug) -> Optional[Post]:
         """Find a post by slug (excludes deleted posts)."""
         for post in self._posts.values():
@@ -26,9 +34,16 @@ class InMemoryPostRepository(PostRepository):
                 return post
         return None
 
-    async def slug_exists(self, slug: Slug) -> bool:
-        """Check if a slug exists (globally - includes deleted posts)."""
-        return any(post.slug == slug for post in self._posts.values())
+    async def generate_unique_slug(self, base: str, max_len: int = 100) -> str:
+        """Find the first free slug for a base slug (includes deleted posts)."""
+        taken = {post.slug.root for post in self._posts.values()}
+        candidate = base
+        counter = 1
+        while candidate in taken:
+            suffix = f"-{counter}"
+            candidate = base[: max_len - len(suffix)].rstrip("-") + suffix
+            counter += 1
+        return candidate
 
     async def find_all(
         self,
@@ -37,8 +52,12 @@ class InMemoryPostRepository(PostRepository):
         include_deleted: bool = False,
         limit: int = 30,
         offset: int = 0,
+        after: Optional[tuple[datetime, PostId]] = None,
     ) -> list[Post]:
         """Find posts with filtering and pagination."""
+        if after is not None and sort == PostSortOrder.HOT:
+            raise ValueError("Cursor pagination is not supported for hot sort")
+
         posts = [p for p in self._posts.values()]
 
         # Filter by tag
@@ -50,10 +69,16 @@ class InMemoryPostRepository(PostRepository):
             posts = [p for p in posts if p.deleted_at is None]
 
         # Sort
-        if sort == PostSortOrder.RECENT:
-            posts.sort(key=lambda p: p.created_at, reverse=True)
-        elif sort == PostSortOrder.ACTIVE:
-            posts.sort(key=lambda p: p.comments_updated_at, reverse=True)
+        if sort in (PostSortOrder.RECENT, PostSortOrder.ACTIVE):
+
+            def sort_key(post: Post) -> tuple[datetime, PostId]:
+                if sort == PostSortOrder.RECENT:
+                    return (post.created_at, post.id)
+                return (post.comments_updated_at, post.id)
+
+            if after is not None:
+                posts = [p for p in posts if sort_key(p) < after]
+            posts.sort(key=sort_key, reverse=True)
         elif sort == PostSortOrder.HOT:
             # Time-decay ranking: points / (age_hours + offset)^gravity
             # No -1 penalty: new posts are visible but don't dominate
@@ -130,47 +155,30 @@ class InMemoryPostRepository(PostRepository):
         """Atomically increment points by 1."""
         post = self._posts.get(post_id)
         if post:
-            # Create updated post (since posts are immutable)
-            # Note: Votes don't update timestamps
-            self._posts[post_id] = Post(
-                id=post.id,
-                slug=post.slug,
-                title=post.title,
-                tag_names=post.tag_names,
-                author_id=post.author_id,
-                author_handle=post.author_handle,
-                url=post.url,
-                text=post.text,
-                points=post.points + 1,
-                comment_count=post.comment_count,
-                created_at=post.created_at,
-                comments_updated_at=post.comments_updated_at,
-                content_updated_at=post.content_updated_at,
-                deleted_at=post.deleted_at,
-            )
+            # Posts are immutable; votes don't update timestamps
+            self._posts[post_id] = post.model_copy(update={"points": post.points + 1})
 
     async def decrement_points(self, post_id: PostId) -> None:
         """Atomically decrement points by 1 (minimum 1)."""
         post = self._posts.get(post_id)
         if post and post.points > 1:
-            # Create updated post (since posts are immutable)
-            # Note: Votes don't update timestamps
-            self._posts[post_id] = Post(
-                id=post.id,
-                slug=post.slug,
-                title=post.title,
-                tag_names=post.tag_names,
-                author_id=post.author_id,
-                author_handle=post.author_handle,
-                url=post.url,
-                text=post.text,
-                points=post.points - 1,
-                comment_count=post.comment_count,
-                created_at=post.created_at,
-                comments_updated_at=post.comments_updated_at,
-                content_updated_at=post.content_updated_at,
-                deleted_at=post.deleted_at,
-            )
+            # Posts are immutable; votes don't update timestamps
+            self._posts[post_id] = post.model_copy(update={"points": post.points - 1})
+
+    async def increment_comment_count(self, post_id: PostId) -> bool:
+        """Atomically increment comment count and touch comments_updated_at."""
+        post = self._posts.get(post_id)
+        if post is None:
+            return False
+
+        updated_post = post.model_copy(
+            update={
+                "comment_count": post.comment_count + 1,
+                "comments_updated_at": datetime.now(),
+            }
+        )
+        self._posts[post_id] = updated_post
+        return True
 
     async def update_text(self, post_id: PostId, text: str | None) -> Post | None:
         """Update the text content of a post."""
@@ -178,22 +186,9 @@ class InMemoryPostRepository(PostRepository):
         if post is None or post.deleted_at is not None:
             return None
 
-        # Create updated post (since posts are immutable)
-        updated_post = Post(
-            id=post.id,
-            slug=post.slug,
-            title=post.title,
-            tag_names=post.tag_names,
-            author_id=post.author_id,
-            author_handle=post.author_handle,
-            url=post.url,
-            text=text,
-            points=post.points,
-            comment_count=post.comment_count,
-            created_at=post.created_at,
-            comments_updated_at=post.comments_updated_at,  # Don't update on text edit
-            content_updated_at=datetime.now(),  # Update content timestamp
-            deleted_at=post.deleted_at,
+        # Posts are immutable; a text edit only touches the content timestamp
+        updated_post = post.model_copy(
+            update={"text": text, "content_updated_at": datetime.now()}
         )
         self._posts[post_id] = updated_post
         return updated_post
@@ -3,6 +3,7 @@
 from typing import Optional
 
 from talk.domain.model.user import User
+from talk.domain.repository.invite import InviteRepository
 from talk.domain.repository.user import UserRepository
 from talk.domain.value import AuthProvider, UserId
 from talk.domain.value.types import Handle
@@ -11,8 +12,10 @@ from talk.domain.value.types import Handle
 class InMemoryUserRepository(UserRepository):
     """In-memory implementation of UserRepository for testing."""
 
-    def __init__(self) -> None:
+    def __init__(self, invite_repository: InviteRepository | None = None) -> None:
         self._users: dict[UserId, User] = {}
+        # Stands in for the users/invites join; without it every user is a root
+        self._invite_repository = invite_repository
 
     async def find_by_id(self, user_id: UserId) -> Optional[User]:
         """Find a user by ID."""
@@ -75,3 +78,32 @@ class InMemoryUserRepository(UserRepository):
             (user.id, user.handle, user.karma if include_karma else None)
             for user in self._users.values()
         ]
+
+    async def tree_version(self) -> tuple[int, int]:
+        """Count users and accepted invites."""
+        relationships = (
+            await self._invite_repository.find_all_accepted_relationships()
+            if self._invite_repository
+            else []
+        )
+        return len(self._users), len(relationships)
+
+    async def find_all_for_tree_with_parents(
+        self, include_karma: bool = True
+    ) -> list[tuple[UserId, Handle, int | None, UserId | None]]:
+        """Find all users with their inviter."""
+        relationships = (
+            await self._invite_repository.find_all_accepted_relationships()
+            if self._invite_repository
+            else []
+        )
+        parent_of = {child_id: parent_id for parent_id, child_id in relationships}
+        return [
+            (
+                user.id,
+                user.handle,
+                user.karma if include_karma else None,
+                parent_of.get(user.id),
+            )
+            for user in self._users.values()
+        ]
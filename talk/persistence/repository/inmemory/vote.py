@@ -1,11 +1,16 @@
 """In-memory vote repository for testing."""
 
+from datetime import datetime
 from typing import Optional, Sequence, Union
 from uuid import UUID
 
 from sqlalchemy.exc import IntegrityError
 
+from talk.domain.error import NotFoundError
 from talk.domain.model.vote import Vote
+from talk.domain.repository.comment import CommentRepository
+from talk.domain.repository.post import PostRepository
+from talk.domain.repository.user import UserRepository
 from talk.domain.repository.vote import VoteRepository
 from talk.domain.value import CommentId, PostId, UserId, VotableType, VoteId
 
@@ -13,8 +18,18 @@ from talk.domain.value import CommentId, PostId, UserId, VotableType, VoteId
 class InMemoryVoteRepository(VoteRepository):
     """In-memory implementation of VoteRepository for testing."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        post_repository: PostRepository | None = None,
+        comment_repository: CommentRepository | None = None,
+        user_repository: UserRepository | None = None,
+    ) -> None:
         self._votes: list[Vote] = []
+        # Stand in for the vote/points/karma CTE; counters are left alone
+        # without them
+        self._post_repository = post_repository
+        self._comment_repository = comment_repository
+        self._user_repository = user_repository
 
     async def find_by_id(self, vote_id: VoteId) -> Optional[Vote]:
         """Find a vote by ID."""
@@ -30,12 +45,11 @@ class InMemoryVoteRepository(VoteRepository):
         votable_id: PostId | CommentId,
     ) -> Optional[Vote]:
         """Find a vote by user and votable item."""
-        votable_uuid = UUID(str(votable_id))
         for vote in self._votes:
             if (
                 vote.user_id == user_id
                 and vote.votable_type == votable_type
-                and vote.votable_id == votable_uuid
+                and vote.votable_id == votable_id
             ):
                 return vote
         return None
@@ -62,9 +76,52 @@ class InMemoryVoteRepository(VoteRepository):
         if existing:
             raise IntegrityError("Duplicate vote", None, Exception())
 
+        # Stand in for the created_at database default
+        if vote.created_at is None:
+            vote = vote.model_copy(update={"created_at": datetime.now()})
         self._votes.append(vote)
         return vote
 
+    async def save_and_bump(self, vote: Vote) -> Vote | None:
+        """Save a vote and bump the item's points and its author's karma.
+
+        Returns None without changing anything if the vote already exists.
+        The item's existence is only checked when its repository is set.
+        """
+        if vote.votable_type == VotableType.POST:
+            if self._post_repository and not await self._post_repository.find_by_id(
+                PostId(vote.votable_id)
+            ):
+                raise NotFoundError("Post", str(vote.votable_id))
+        elif self._comment_repository and not await self._comment_repository.find_by_id(
+            CommentId(vote.votable_id)
+        ):
+            raise NotFoundError("Comment", str(vote.votable_id))
+
+        if any(
+            v.user_id == vote.user_id
+            and v.votable_type == vote.votable_type
+            and v.votable_id == vote.votable_id
+            for v in self._votes
+        ):
+            return None
+        saved = await self.save(vote)
+        author_id = None
+        if vote.votable_type == VotableType.POST:
+            if self._post_repository:
+                post_id = PostId(vote.votable_id)
+                await self._post_repository.increment_points(post_id)
+                post = await self._post_repository.find_by_id(post_id)
+                author_id = post.author_id if post else None
+        elif self._comment_repository:
+            comment_id = CommentId(vote.votable_id)
+            await self._comment_repository.increment_points(comment_id)
+            comment = await self._comment_repository.find_by_id(comment_id)
+            author_id = comment.author_id if comment else None
+        if author_id and self._user_repository:
+            await self._user_repository.increment_karma(author_id)
+        return saved
+
     async def delete(self, vote_id: VoteId) -> None:
         """Delete a vote by ID."""
         self._votes = [v for v in self._votes if v.id != vote_id]
@@ -76,17 +133,41 @@ class InMemoryVoteRepository(VoteRepository):
         votable_id: PostId | CommentId,
     ) -> bool:
         """Delete a vote by user and votable item."""
-        votable_uuid = UUID(str(votable_id))
         for i, vote in enumerate(self._votes):
             if (
                 vote.user_id == user_id
                 and vote.votable_type == votable_type
-                and vote.votable_id == votable_uuid
+                and vote.votable_id == votable_id
             ):
                 self._votes.pop(i)
                 return True
         return False
 
+    async def delete_and_decrement(
+        self,
+        user_id: UserId,
+        votable_type: VotableType,
+        votable_id: PostId | CommentId,
+    ) -> bool:
+        """Delete a vote and decrement the item's points and author karma."""
+        if not await self.delete_by_user_and_votable(user_id, votable_type, votable_id):
+            return False
+        author_id = None
+        if votable_type == VotableType.POST:
+            if self._post_repository:
+                post_id = PostId(votable_id)
+                await self._post_repository.decrement_points(post_id)
+                post = await self._post_repository.find_by_id(post_id)
+                author_id = post.author_id if post else None
+        elif self._comment_repository:
+            comment_id = CommentId(votable_id)
+            await self._comment_repository.decrement_points(comment_id)
+            comment = await self._comment_repository.find_by_id(comment_id)
+            author_id = comment.author_id if comment else None
+        if author_id and self._user_repository:
+            await self._user_repository.decrement_karma(author_id)
+        return True
+
     async def find_by_user_and_votables(
         self,
         user_id: UserId,
@@ -97,7 +178,7 @@ class InMemoryVoteRepository(VoteRepository):
         if not votable_ids:
             return []
 
-        votable_uuids = {UUID(str(vid)) for vid in votable_ids}
+        votable_uuids = set(votable_ids)
         return [
             v
             for v in self._votes
@@ -105,3 +186,13 @@ class InMemoryVoteRepository(VoteRepository):
             and v.votable_type == votable_type
             and v.votable_id in votable_uuids
         ]
+
+    async def find_voted_ids(
+        self,
+        user_id: UserId,
+        votable_type: VotableType,
+        votable_ids: Sequence[Union[PostId, CommentId]],
+    ) -> set[UUID]:
+        """Find which of several items a user has voted on (IDs only)."""
+        votes = await self.find_by_user_and_votables(user_id, votable_type, votable_ids)
+        return {v.votable_id for v in votes}
@@ -2,7 +2,7 @@
 
 from typing import Optional
 
-from sqlalchemy import and_, func, insert, select, update
+from sqlalchemy import and_, bindparam, exists, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from talk.domain.model import Invite
@@ -11,6 +11,31 @@ from talk.domain.value import AuthProvider, InviteId, InviteStatus, InviteToken,
 from talk.persistence.mappers import invite_to_dict, row_to_invite
 from talk.persistence.tables import invites_table
 
+# Statements for the hot lookups are built once at import time. Reusing the
+# same statement objects keeps SQLAlchemy's compiled cache warm and produces
+# identical SQL text, so asyncpg's per-connection prepared statement cache
+# reuses the server-side plan instead of re-parsing on every call.
+_PENDING_IDENTITY = and_(
+    invites_table.c.provider == bindparam("provider"),
+    invites_table.c.invitee_provider_id == bindparam("provider_user_id"),
+    invites_table.c.status == InviteStatus.PENDING.value,
+)
+
+_FIND_BY_ID = select(invites_table).where(invites_table.c.id == bindparam("invite_id"))
+_FIND_BY_TOKEN = select(invites_table).where(
+    invites_table.c.invite_token == bindparam("token")
+)
+_FIND_PENDING_BY_IDENTITY = select(invites_table).where(_PENDING_IDENTITY)
+_EXISTS_PENDING_FOR_IDENTITY = select(exists().where(_PENDING_IDENTITY))
+_COUNT_BY_INVITER = (
+    select(func.count())
+    .select_from(invites_table)
+    .where(invites_table.c.inviter_id == bindparam("inviter_id"))
+)
+_COUNT_BY_INVITER_AND_STATUS = _COUNT_BY_INVITER.where(
+    invites_table.c.status == bindparam("status")
+)
+
 
 class PostgresInviteRepository(InviteRepository):
     """PostgreSQL implementation of InviteRepository."""
@@ -32,8 +57,7 @@ class PostgresInviteRepository(InviteRepository):
         Returns:
             Invite if found, None otherwise
         """
-        stmt = select(invites_table).where(invites_table.c.id == invite_id)
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(_FIND_BY_ID, {"invite_id": invite_id})
         row = result.mappings().first()
         return row_to_invite(dict(row)) if row else None
 
@@ -46,8 +70,7 @@ class PostgresInviteRepository(InviteRepository):
         Returns:
             Invite if found, None otherwise
         """
-        stmt = select(invites_table).where(invites_table.c.invite_token == token.root)
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(_FIND_BY_TOKEN, {"token": token.root})
         row = result.mappings().first()
         return row_to_invite(dict(row)) if row else None
 
@@ -65,14 +88,10 @@ class PostgresInviteRepository(InviteRepository):
         Returns:
             Invite if found, None otherwise
         """
-        stmt = select(invites_table).where(
-            and_(
-                invites_table.c.provider == provider.value,
-                invites_table.c.invitee_provider_id == provider_user_id,
-                invites_table.c.status == InviteStatus.PENDING.value,
-            )
+        result = await self.session.execute(
+            _FIND_PENDING_BY_IDENTITY,
+            {"provider": provider.value, "provider_user_id": provider_user_id},
         )
-        result = await self.session.execute(stmt)
         row = result.mappings().first()
         return row_to_invite(dict(row)) if row else None
 
@@ -81,7 +100,8 @@ class PostgresInviteRepository(InviteRepository):
     ) -> bool:
         """Check if a pending invite exists for provider identity.
 
-        Fast check without loading full invite data.
+        Issues SELECT EXISTS(...) so Postgres stops at the first matching
+        index entry and only a boolean is sent back.
 
         Args:
             provider: Authentication provider
@@ -90,15 +110,11 @@ class PostgresInviteRepository(InviteRepository):
         Returns:
             True if pending invite exists, False otherwise
         """
-        stmt = select(invites_table.c.id).where(
-            and_(
-                invites_table.c.provider == provider.value,
-                invites_table.c.invitee_provider_id == provider_user_id,
-                invites_table.c.status == InviteStatus.PENDING.value,
-            )
+        result = await self.session.execute(
+            _EXISTS_PENDING_FOR_IDENTITY,
+            {"provider": provider.value, "provider_user_id": provider_user_id},
         )
-        result = await self.session.execute(stmt)
-        return result.first() is not None
+        return bool(result.scalar())
 
     async def save(self, invite: Invite) -> Invite:
         """Save an invite (create or update).
@@ -142,16 +158,15 @@ class PostgresInviteRepository(InviteRepository):
         Returns:
             Count of matching invites
         """
-        stmt = (
-            select(func.count())
-            .select_from(invites_table)
-            .where(invites_table.c.inviter_id == inviter_id)
-        )
-
         if status:
-            stmt = stmt.where(invites_table.c.status == status.value)
-
-        result = await self.session.execute(stmt)
+            result = await self.session.execute(
+                _COUNT_BY_INVITER_AND_STATUS,
+                {"inviter_id": inviter_id, "status": status.value},
+            )
+        else:
+            result = await self.session.execute(
+                _COUNT_BY_INVITER, {"inviter_id": inviter_id}
+            )
         return result.scalar() or 0
 
     async def find_by_inviter(
@@ -1,11 +1,24 @@
 """PostgreSQL implementation of Post repository."""
 
 from collections import defaultdict
+from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
 import logfire
-from sqlalchemy import delete, desc, func, insert, select, update
+from sqlalchemy import (
+    any_,
+    cast,
+    delete,
+    desc,
+    func,
+    insert,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from talk.config import Settings
@@ -61,13 +74,13 @@ class PostgresPostRepository(PostRepository):
 
     async def find_by_id(self, post_id: PostId) -> Optional[Post]:
         """Find a post by ID."""
-        with logfire.span("post_repository.find_by_id", post_id=str(post_id)):
+        with logfire.span("post_repository.find_by_id", post_id=post_id):
             stmt = select(posts_table).where(posts_table.c.id == post_id)
             result = await self.session.execute(stmt)
             row = result.fetchone()
 
             if not row:
-                logfire.warn("Post not found", post_id=str(post_id))
+                logfire.warn("Post not found", post_id=post_id)
                 return None
 
             # Fetch tags for this post
@@ -76,12 +89,32 @@ class PostgresPostRepository(PostRepository):
 
             return row_to_post(row._asdict(), tag_names=tag_names)
 
+    async def find_by_ids(self, post_ids: List[PostId]) -> dict[PostId, Post]:
+        """Find several posts by ID, binding the IDs as one array parameter."""
+        if not post_ids:
+            return {}
+
+        with logfire.span("post_repository.find_by_ids", count=len(post_ids)):
+            stmt = select(posts_table).where(
+                posts_table.c.id == any_(cast(list(post_ids), ARRAY(PG_UUID)))
+            )
+            result = await self.session.execute(stmt)
+            rows = result.fetchall()
+
+            post_tag_map = await self._fetch_tags_for_posts([row.id for row in rows])
+            return {
+                PostId(row.id): row_to_post(
+                    row._asdict(), tag_names=post_tag_map.get(row.id, [])
+                )
+                for row in rows
+            }
+
     async def find_by_slug(self, slug: Slug) -> Optional[Post]:
         """Find a post by slug.
 
         Note: Returns None if post is deleted (even though slug is globally unique).
         """
-        with logfire.span("post_repository.find_by_slug", slug=str(slug)):
+        with logfire.span("post_repository.find_by_slug", slug=slug.root):
             stmt = select(posts_table).where(
                 posts_table.c.slug == str(slug),
                 posts_table.c.deleted_at.is_(None),  # Exclude deleted for API access
@@ -90,7 +123,7 @@ class PostgresPostRepository(PostRepository):
             row = result.fetchone()
 
             if not row:
-                logfire.warn("Post not found by slug or is deleted", slug=str(slug))
+                logfire.warn("Post not found by slug or is deleted", slug=slug.root)
                 return None
 
             # Fetch tags for this post
@@ -99,23 +132,16 @@ class PostgresPostRepository(PostRepository):
 
             return row_to_post(row._asdict(), tag_names=tag_names)
 
-    async def slug_exists(self, slug: Slug) -> bool:
-        """Check if a slug exists (globally - includes deleted posts)."""
-        with logfire.span("post_repository.slug_exists", slug=str(slug)):
-            stmt = (
-                select(func.count())
-                .select_from(posts_table)
-                .where(
-                    posts_table.c.slug == str(slug),
-                    # NOTE: Check ALL posts (including deleted) for global uniqueness
-                )
-            )
-            result = await self.session.execute(stmt)
-            count = result.scalar()
-            exists = (count or 0) > 0
+    async def generate_unique_slug(self, base: str, max_len: int = 100) -> str:
+        """Find the first free slug via the generate_unique_slug() SQL function.
 
-            logfire.debug("Slug existence check", slug=str(slug), exists=exists)
-            return exists
+        The collision loop runs inside Postgres (see migration ea782146f115),
+        so this is one round-trip however many suffixes are taken.
+        """
+        with logfire.span("post_repository.generate_unique_slug", base=base):
+            stmt = select(func.generate_unique_slug(base, max_len))
+            result = await self.session.execute(stmt)
+            return result.scalar_one()
 
     async def find_all(
         self,
@@ -124,8 +150,12 @@ class PostgresPostRepository(PostRepository):
         include_deleted: bool = False,
         limit: int = 30,
         offset: int = 0,
+        after: Optional[tuple[datetime, PostId]] = None,
     ) -> List[Post]:
         """Find posts with filtering and pagination."""
+        if after is not None and sort == PostSortOrder.HOT:
+            raise ValueError("Cursor pagination is not supported for hot sort")
+
         with logfire.span(
             "post_repository.find_all",
             sort=sort.value,
@@ -133,6 +163,7 @@ class PostgresPostRepository(PostRepository):
             include_deleted=include_deleted,
             limit=limit,
             offset=offset,
+            keyset=after is not None,
         ):
             stmt = select(posts_table)
 
@@ -151,11 +182,20 @@ class PostgresPostRepository(PostRepository):
             if not include_deleted:
                 stmt = stmt.where(posts_table.c.deleted_at.is_(None))
 
-            # Sort order
-            if sort == PostSortOrder.RECENT:
-                stmt = stmt.order_by(desc(posts_table.c.created_at))
-            elif sort == PostSortOrder.ACTIVE:
-                stmt = stmt.order_by(desc(posts_table.c.comments_updated_at))
+            # Sort order; ID breaks timestamp ties so keyset pages are stable
+            if sort in (PostSortOrder.RECENT, PostSortOrder.ACTIVE):
+                sort_column = (
+                    posts_table.c.created_at
+                    if sort == PostSortOrder.RECENT
+                    else posts_table.c.comments_updated_at
+                )
+                if after is not None:
+                    # Row comparison seeks straight into the (timestamp, id)
+                    # index instead of scanning and discarding offset rows
+                    stmt = stmt.where(
+                        tuple_(sort_column, posts_table.c.id) < tuple_(*after)
+                    )
+                stmt = stmt.order_by(desc(sort_column), desc(posts_table.c.id))
             elif sort == PostSortOrder.HOT:
                 # Time-decay ranking: points / (age_hours + offset)^gravity
                 # No -1 penalty: new posts are visible but don't dominate
@@ -266,7 +306,7 @@ class PostgresPostRepository(PostRepository):
         """Save a post (create or update)."""
         with logfire.span(
             "post_repository.save",
-            post_id=str(post.id),
+            post_id=post.id,
             title=post.title,
             tags=[t.root for t in post.tag_names],
         ):
@@ -276,7 +316,7 @@ class PostgresPostRepository(PostRepository):
 
             if existing:
                 # Update post
-                logfire.info("Updating existing post", post_id=str(post.id))
+                logfire.info("Updating existing post", post_id=post.id)
                 stmt = (
                     posts_table.update()
                     .where(posts_table.c.id == post.id)
@@ -293,7 +333,7 @@ class PostgresPostRepository(PostRepository):
                 # Insert new post
                 logfire.info(
                     "Inserting new post",
-                    post_id=str(post.id),
+                    post_id=post.id,
                     title=post.title,
                     tags=[t.root for t in post.tag_names],
                     author=post.author_handle.root,
@@ -322,7 +362,7 @@ class PostgresPostRepository(PostRepository):
                     await self.session.execute(post_tag_stmt)
 
             await self.session.flush()
-            logfire.info("Post saved successfully", post_id=str(post.id))
+            logfire.info("Post saved successfully", post_id=post.id)
             return post
 
     async def delete(self, post_id: PostId) -> None:
@@ -352,13 +392,24 @@ class PostgresPostRepository(PostRepository):
         await self.session.execute(stmt)
         await self.session.flush()
 
+    async def increment_comment_count(self, post_id: PostId) -> bool:
+        """Atomically increment comment count and touch comments_updated_at."""
+        stmt = (
+            update(posts_table)
+            .where(posts_table.c.id == post_id)
+            .values(
+                comment_count=posts_table.c.comment_count + 1,
+                comments_updated_at=func.now(),
+            )
+            .returning(posts_table.c.id)
+        )
+        result = await self.session.execute(stmt)
+        await self.session.flush()
+        return result.first() is not None
+
     async def update_text(self, post_id: PostId, text: str | None) -> Post | None:
         """Update the text content of a post."""
-        with logfire.span(
-            "post_repository.update_text",
-            post_id=str(post_id),
-            text_length=len(text) if text else 0,
-        ):
+        with logfire.span("post_repository.update_text", post_id=post_id):
             stmt = (
                 update(posts_table)
                 .where(posts_table.c.id == post_id)
@@ -374,7 +425,7 @@ class PostgresPostRepository(PostRepository):
             row = result.fetchone()
 
             if row is None:
-                logfire.warn("Post not found or deleted", post_id=str(post_id))
+                logfire.warn("Post not found or deleted", post_id=post_id)
                 return None
 
             # Fetch tags for this post
@@ -2,7 +2,8 @@
 
 from typing import Optional
 
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import String, any_, cast, delete, insert, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from talk.domain.model.tag import Tag
@@ -59,12 +60,15 @@ class PostgresTagRepository(TagRepository):
         return row_to_tag(row._asdict()) if row else None
 
     async def find_by_names(self, names: list[TagName]) -> list[Tag]:
-        """Find multiple tags by names in a single query."""
+        """Find multiple tags by names in a single query (name = ANY($1))."""
         if not names:
             return []
 
+        # Bind the names as one array parameter so the SQL text (and its
+        # prepared statement) is the same regardless of how many names are passed
         stmt = select(tags_table).where(
-            tags_table.c.name.in_([name.root for name in names])
+            tags_table.c.name
+            == any_(cast([name.root for name in names], ARRAY(String)))
         )
         result = await self.session.execute(stmt)
         rows = result.fetchall()
@@ -2,15 +2,15 @@
 
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import and_, func, null, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from talk.domain.model import User
 from talk.domain.repository import UserRepository
-from talk.domain.value import AuthProvider, UserId
+from talk.domain.value import AuthProvider, InviteStatus, UserId
 from talk.domain.value.types import Handle
 from talk.persistence.mappers import row_to_user, user_to_dict
-from talk.persistence.tables import user_identities_table, users_table
+from talk.persistence.tables import invites_table, user_identities_table, users_table
 
 
 class PostgresUserRepository(UserRepository):
@@ -183,3 +183,66 @@ class PostgresUserRepository(UserRepository):
             return [(UserId(row.id), Handle(row.handle), row.karma) for row in rows]
         else:
             return [(UserId(row.id), Handle(row.handle), None) for row in rows]
+
+    async def tree_version(self) -> tuple[int, int]:
+        """Count users and accepted invites in one query.
+
+        The accepted invite count is answered from the partial index
+        idx_invites_tree_relationships.
+        """
+        stmt = select(
+            select(func.count()).select_from(users_table).scalar_subquery(),
+            select(func.count())
+            .select_from(invites_table)
+            .where(
+                and_(
+                    invites_table.c.status == InviteStatus.ACCEPTED.value,
+                    invites_table.c.accepted_by_user_id.is_not(None),
+                )
+            )
+            .scalar_subquery(),
+        )
+        result = await self.session.execute(stmt)
+        user_count, accepted_count = result.one()
+        return user_count, accepted_count
+
+    async def find_all_for_tree_with_parents(
+        self, include_karma: bool = True
+    ) -> list[tuple[UserId, Handle, int | None, UserId | None]]:
+        """Find all users with their inviter in a single query.
+
+        LEFT JOINs users to accepted invites; the join condition matches the
+        partial index idx_invites_tree_relationships.
+
+        Args:
+            include_karma: Whether to include karma (default: True)
+
+        Returns:
+            List of (user_id, handle, karma, parent_id) tuples
+        """
+        karma_column = users_table.c.karma if include_karma else null()
+        stmt = select(
+            users_table.c.id,
+            users_table.c.handle,
+            karma_column.label("karma"),
+            invites_table.c.inviter_id,
+        ).select_from(
+            users_table.outerjoin(
+                invites_table,
+                and_(
+                    invites_table.c.accepted_by_user_id == users_table.c.id,
+                    invites_table.c.status == InviteStatus.ACCEPTED.value,
+                ),
+            )
+        )
+
+        result = await self.session.execute(stmt)
+        return [
+            (
+                UserId(row.id),
+                Handle(row.handle),
+                row.karma,
+                UserId(row.inviter_id) if row.inviter_id else None,
+            )
+            for row in result
+        ]
@@ -2,7 +2,7 @@
 
 from typing import Optional
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from talk.domain.model.user_identity import UserIdentity
@@ -149,15 +149,16 @@ class PostgresUserIdentityRepository(UserIdentityRepository):
         Returns:
             True if identity exists, False otherwise
         """
-        stmt = select(user_identities_table.c.id).where(
-            and_(
-                user_identities_table.c.provider == provider.value,
-                user_identities_table.c.provider_user_id == provider_user_id,
+        stmt = select(
+            exists().where(
+                and_(
+                    user_identities_table.c.provider == provider.value,
+                    user_identities_table.c.provider_user_id == provider_user_id,
+                )
             )
         )
         result = await self.session.execute(stmt)
-        row = result.first()
-        return row is not None
+        return bool(result.scalar())
 
     async def delete(self, identity_id: UserIdentityId) -> None:
         """Delete user identity.
@@ -1,15 +1,53 @@
 """PostgreSQL implementation of Vote repository."""
 
-from typing import List, Optional, Sequence, Union
+from typing import Any, List, Optional, Sequence, Union
+from uuid import UUID
 
-from sqlalchemy import and_, delete, insert, select
+from sqlalchemy import (
+    ColumnElement,
+    and_,
+    any_,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    true,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from talk.domain.error import NotFoundError
 from talk.domain.model import Vote
 from talk.domain.repository import VoteRepository
 from talk.domain.value import CommentId, PostId, UserId, VotableType, VoteId
 from talk.persistence.mappers import row_to_vote, vote_to_dict
-from talk.persistence.tables import votes_table
+from talk.persistence.tables import (
+    comments_table,
+    posts_table,
+    users_table,
+    votes_table,
+)
+
+
+def _async_commit() -> ColumnElement[str]:
+    """Turn off synchronous_commit for the rest of the current transaction.
+
+    Embedded in the vote write statements so it costs no extra round-trip.
+    The commit then returns before its WAL record is flushed to disk: a
+    crash can lose the last few hundred milliseconds of votes (the user can
+    simply vote again), but never corrupts data or breaks consistency.
+
+    The setting is transaction-local, not statement-local. It covers every
+    write in the request's session, before or after the vote, not just the
+    vote itself. Vote requests write nothing else. Durable writes (invites,
+    auth, content) must not share a transaction with these methods.
+    """
+    return func.set_config("synchronous_commit", "off", True)
 
 
 class PostgresVoteRepository(VoteRepository):
@@ -57,10 +95,72 @@ class PostgresVoteRepository(VoteRepository):
     async def save(self, vote: Vote) -> Vote:
         """Save a vote (create)."""
         vote_dict = vote_to_dict(vote)
-        stmt = insert(votes_table).values(**vote_dict)
-        await self.session.execute(stmt)
+        stmt = (
+            insert(votes_table).values(**vote_dict).returning(votes_table.c.created_at)
+        )
+        result = await self.session.execute(stmt)
+        await self.session.flush()
+        return vote.model_copy(update={"created_at": result.scalar_one()})
+
+    async def save_and_bump(self, vote: Vote) -> Vote | None:
+        """Save a vote and bump points and author karma in one statement.
+
+        The vote is inserted from a SELECT of the voted item, so a missing item
+        inserts nothing and returns no row. created_at comes back from the
+        database default. ON CONFLICT DO NOTHING turns a
+        duplicate vote into an empty insert instead of an error, so the
+        transaction stays usable. Commits asynchronously (see _async_commit).
+        """
+        is_post = vote.votable_type == VotableType.POST
+        target = posts_table if is_post else comments_table
+        found = (
+            select(target.c.id).where(target.c.id == vote.votable_id).cte("voted_item")
+        )
+        # Bind every value with an explicit cast: parameters in an
+        # INSERT ... SELECT list are not typed from the target columns
+        vote_data = vote_to_dict(vote)
+        row_values: list[ColumnElement[Any]] = []
+        for name, value in vote_data.items():
+            column_type = votes_table.c[name].type
+            row_values.append(
+                found.c.id
+                if name == "votable_id"
+                else cast(literal(value, column_type), column_type)
+            )
+        vote_row = select(*row_values)
+        inserted = (
+            pg_insert(votes_table)
+            .from_select(list(vote_data), vote_row)
+            .on_conflict_do_nothing(constraint="unique_vote")
+            .returning(votes_table.c.votable_id, votes_table.c.created_at)
+            .cte("inserted_vote")
+        )
+        bumped = (
+            update(target)
+            .where(target.c.id.in_(select(inserted.c.votable_id)))
+            .values(points=target.c.points + 1)
+            .returning(target.c.author_id)
+            .cte("bumped_points")
+        )
+        karma = (
+            update(users_table)
+            .where(users_table.c.id.in_(select(bumped.c.author_id)))
+            .values(karma=users_table.c.karma + 1)
+            .cte("bumped_karma")
+        )
+        stmt = (
+            select(inserted.c.votable_id, inserted.c.created_at, _async_commit())
+            .select_from(found.outerjoin(inserted, true()))
+            .add_cte(karma)
+        )
+        result = await self.session.execute(stmt)
         await self.session.flush()
-        return vote
+        row = result.first()
+        if row is None:
+            raise NotFoundError("Post" if is_post else "Comment", str(vote.votable_id))
+        if row.votable_id is None:
+            return None
+        return vote.model_copy(update={"created_at": row.created_at})
 
     async def delete(self, vote_id: VoteId) -> None:
         """Delete a vote."""
@@ -74,17 +174,67 @@ class PostgresVoteRepository(VoteRepository):
         votable_type: VotableType,
         votable_id: Union[PostId, CommentId],
     ) -> bool:
-        """Delete a vote by user and votable."""
-        stmt = delete(votes_table).where(
-            and_(
-                votes_table.c.user_id == user_id,
-                votes_table.c.votable_type == votable_type.value,
-                votes_table.c.votable_id == votable_id,
+        """Delete a vote by user and votable.
+
+        Commits asynchronously (see _async_commit).
+        """
+        stmt = (
+            delete(votes_table)
+            .where(
+                and_(
+                    votes_table.c.user_id == user_id,
+                    votes_table.c.votable_type == votable_type.value,
+                    votes_table.c.votable_id == votable_id,
+                )
             )
+            .returning(votes_table.c.id, _async_commit())
         )
         result = await self.session.execute(stmt)
         await self.session.flush()
-        return result.rowcount > 0  # type: ignore[attr-defined]
+        return result.first() is not None
+
+    async def delete_and_decrement(
+        self,
+        user_id: UserId,
+        votable_type: VotableType,
+        votable_id: Union[PostId, CommentId],
+    ) -> bool:
+        """Delete a vote and decrement points and author karma in one statement.
+
+        Points are floored rather than filtered so the points update always
+        returns the author for the karma update. Commits asynchronously (see
+        _async_commit).
+        """
+        target = posts_table if votable_type == VotableType.POST else comments_table
+        deleted = (
+            delete(votes_table)
+            .where(
+                and_(
+                    votes_table.c.user_id == user_id,
+                    votes_table.c.votable_type == votable_type.value,
+                    votes_table.c.votable_id == votable_id,
+                )
+            )
+            .returning(votes_table.c.votable_id)
+            .cte("deleted_vote")
+        )
+        dropped = (
+            update(target)
+            .where(target.c.id.in_(select(deleted.c.votable_id)))
+            .values(points=func.greatest(target.c.points - 1, 1))
+            .returning(target.c.author_id)
+            .cte("dropped_points")
+        )
+        karma = (
+            update(users_table)
+            .where(users_table.c.id.in_(select(dropped.c.author_id)))
+            .values(karma=func.greatest(users_table.c.karma - 1, 0))
+            .cte("dropped_karma")
+        )
+        stmt = select(deleted.c.votable_id, _async_commit()).add_cte(karma)
+        result = await self.session.execute(stmt)
+        await self.session.flush()
+        return result.first() is not None
 
     async def find_by_user_and_votables(
         self,
@@ -92,7 +242,11 @@ class PostgresVoteRepository(VoteRepository):
         votable_type: VotableType,
         votable_ids: Sequence[Union[PostId, CommentId]],
     ) -> List[Vote]:
-        """Find a user's votes on multiple items (batch query)."""
+        """Find a user's votes on multiple items (batch query).
+
+        The IDs are bound as one uuid[] array, so the statement text is the
+        same for any number of items and its prepared plan can be reused.
+        """
         if not votable_ids:
             return []
 
@@ -100,9 +254,34 @@ class PostgresVoteRepository(VoteRepository):
             and_(
                 votes_table.c.user_id == user_id,
                 votes_table.c.votable_type == votable_type.value,
-                votes_table.c.votable_id.in_(votable_ids),
+                votes_table.c.votable_id
+                == any_(cast(list(votable_ids), ARRAY(PG_UUID))),
             )
         )
         result = await self.session.execute(stmt)
         rows = result.fetchall()
         return [row_to_vote(row._asdict()) for row in rows]
+
+    async def find_voted_ids(
+        self,
+        user_id: UserId,
+        votable_type: VotableType,
+        votable_ids: Sequence[Union[PostId, CommentId]],
+    ) -> set[UUID]:
+        """Find which of several items a user has voted on (IDs only).
+
+        Binds the IDs as one uuid[] array, like find_by_user_and_votables.
+        """
+        if not votable_ids:
+            return set()
+
+        stmt = select(votes_table.c.votable_id).where(
+            and_(
+                votes_table.c.user_id == user_id,
+                votes_table.c.votable_type == votable_type.value,
+                votes_table.c.votable_id
+                == any_(cast(list(votable_ids), ARRAY(PG_UUID))),
+            )
+        )
+        result = await self.session.execute(stmt)
+        return set(result.scalars())
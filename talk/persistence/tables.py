@@ -144,7 +144,13 @@ posts_table = Table(
 )
 
 Index("idx_posts_slug", posts_table.c.slug)
-Index("idx_posts_created_at", posts_table.c.created_at.desc())
+# Keyset pagination indexes for the recent and active listings
+Index("idx_posts_recent", posts_table.c.created_at.desc(), posts_table.c.id.desc())
+Index(
+    "idx_posts_active",
+    posts_table.c.comments_updated_at.desc(),
+    posts_table.c.id.desc(),
+)
 Index("idx_posts_author_id", posts_table.c.author_id)
 Index("idx_posts_deleted_at", posts_table.c.deleted_at)
 # Unique index for slugs (globally unique, even for deleted posts)
@@ -2,7 +2,7 @@
 
 from dishka import Scope, provide
 
-from talk.config import AuthSettings, Settings
+from talk.config import AuthSettings, Settings, get_settings
 from talk.util.di.base import ProviderBase
 
 
@@ -15,7 +15,7 @@ class ProdConfigProvider(ProviderBase):
     @provide(scope=Scope.APP)
     def provide_settings(self) -> Settings:
         """Provide application settings from environment."""
-        return Settings()
+        return get_settings()
 
     @provide(scope=Scope.APP)
     def provide_auth_settings(self, settings: Settings) -> AuthSettings:
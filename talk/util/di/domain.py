@@ -15,13 +15,17 @@ from talk.domain.repository.tag import TagRepository
 from talk.domain.service import (
     AuthService,
     CommentService,
+    InvitationTreeCache,
     InviteService,
     JWTService,
     OAuthClient,
+    PostCache,
     PostService,
+    TagListCache,
     TagService,
     UserIdentityService,
     UserService,
+    VerifiedTokenCache,
     VoteService,
 )
 from talk.domain.value import AuthProvider
@@ -51,10 +55,17 @@ class ProdDomainProvider(ProviderBase):
         """
         return AuthService(oauth_clients=oauth_clients)
 
+    @provide(scope=Scope.APP)
+    def get_verified_token_cache(self) -> VerifiedTokenCache:
+        """Provide process-wide verified token cache shared across requests."""
+        return VerifiedTokenCache()
+
     @provide
-    def get_jwt_service(self, auth_settings: AuthSettings) -> JWTService:
+    def get_jwt_service(
+        self, auth_settings: AuthSettings, token_cache: VerifiedTokenCache
+    ) -> JWTService:
         """Provide JWT token domain service."""
-        return JWTService(auth_settings=auth_settings)
+        return JWTService(auth_settings=auth_settings, token_cache=token_cache)
 
     @provide
     def get_comment_service(
@@ -63,40 +74,41 @@ class ProdDomainProvider(ProviderBase):
         """Provide comment domain service."""
         return CommentService(comment_repository=comment_repository)
 
+    @provide(scope=Scope.APP)
+    def get_post_cache(self) -> PostCache:
+        """Provide process-wide post cache shared across requests."""
+        return PostCache()
+
     @provide
-    def get_post_service(self, post_repository: PostRepository) -> PostService:
+    def get_post_service(
+        self, post_repository: PostRepository, post_cache: PostCache
+    ) -> PostService:
         """Provide post domain service."""
-        return PostService(post_repository=post_repository)
+        return PostService(post_repository=post_repository, post_cache=post_cache)
 
     @provide
     def get_vote_service(
-        self,
-        vote_repository: VoteRepository,
-        post_service: PostService,
-        comment_service: CommentService,
-        user_service: UserService,
+        self, vote_repository: VoteRepository, post_service: PostService
     ) -> VoteService:
         """Provide vote domain service."""
-        return VoteService(
-            vote_repository=vote_repository,
-            post_service=post_service,
-            comment_service=comment_service,
-            user_service=user_service,
-        )
+        return VoteService(vote_repository=vote_repository, post_service=post_service)
 
     @provide
     def get_invite_service(self, invite_repository: InviteRepository) -> InviteService:
         """Provide invite domain service."""
         return InviteService(invite_repository=invite_repository)
 
+    @provide(scope=Scope.APP)
+    def get_invitation_tree_cache(self) -> InvitationTreeCache:
+        """Provide process-wide invitation tree cache shared across requests."""
+        return InvitationTreeCache()
+
     @provide
     def get_user_service(
-        self, user_repository: UserRepository, invite_repository: InviteRepository
+        self, user_repository: UserRepository, tree_cache: InvitationTreeCache
     ) -> UserService:
         """Provide user domain service."""
-        return UserService(
-            user_repository=user_repository, invite_repository=invite_repository
-        )
+        return UserService(user_repository=user_repository, tree_cache=tree_cache)
 
     @provide
     def get_user_identity_service(
@@ -105,7 +117,14 @@ class ProdDomainProvider(ProviderBase):
         """Provide user identity domain service."""
         return UserIdentityService(user_identity_repository=user_identity_repository)
 
+    @provide(scope=Scope.APP)
+    def get_tag_list_cache(self) -> TagListCache:
+        """Provide process-wide tag listing cache shared across requests."""
+        return TagListCache()
+
     @provide
-    def get_tag_service(self, tag_repository: TagRepository) -> TagService:
+    def get_tag_service(
+        self, tag_repository: TagRepository, tag_list_cache: TagListCache
+    ) -> TagService:
         """Provide tag domain service."""
-        return TagService(tag_repository=tag_repository)
+        return TagService(tag_repository=tag_repository, tag_list_cache=tag_list_cache)
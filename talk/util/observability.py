@@ -24,6 +24,10 @@ from fastapi import FastAPI
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from talk.config import Settings
+from talk.util.tracing import set_tracing_enabled
+
+# Set once httpx is instrumented; create_app may run more than once per process
+_HTTPX_INSTRUMENTED = False
 
 
 def configure_logfire(settings: Settings, service_name: str = "talk-backend") -> None:
@@ -72,6 +76,7 @@ def configure_logfire(settings: Settings, service_name: str = "talk-backend") ->
 
     # Configure Logfire
     logfire.configure(**config_kwargs)
+    set_tracing_enabled(settings.observability.service_spans)
 
     logfire.info(
         "Observability configured",
@@ -80,6 +85,7 @@ def configure_logfire(settings: Settings, service_name: str = "talk-backend") ->
         send_to_logfire=send_to_logfire,
         has_token=bool(settings.observability.logfire_token),
         git_sha=settings.git_sha,
+        service_spans=settings.observability.service_spans,
     )
 
 
@@ -150,6 +156,12 @@ def instrument_httpx() -> None:
     - Request/response details
     - Errors and retries
     - External service latency
+
+    Only the first call instruments; later calls are no-ops.
     """
+    global _HTTPX_INSTRUMENTED
+    if _HTTPX_INSTRUMENTED:
+        return
+    _HTTPX_INSTRUMENTED = True
     logfire.instrument_httpx()
     logfire.info("httpx instrumented")
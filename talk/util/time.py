@@ -0,0 +1,41 @@
+"""Request-scoped timestamp utilities."""
+
+from contextvars import ContextVar, Token
+from datetime import datetime
+
+_request_now: ContextVar[datetime | None] = ContextVar("request_now", default=None)
+
+
+def request_now() -> datetime:
+    """Get the timestamp for the current request.
+
+    Within a request, every call returns the same timestamp so that records
+    written together (and their log entries) share one consistent time.
+    Outside of a request (scripts, tests) a fresh timestamp is returned.
+
+    Returns:
+        Timestamp captured at request entry, or the current time
+    """
+    now = _request_now.get()
+    return now if now is not None else datetime.now()
+
+
+def set_request_now(now: datetime | None = None) -> Token[datetime | None]:
+    """Pin the timestamp returned by request_now() for the current context.
+
+    Args:
+        now: Timestamp to pin (defaults to the current time)
+
+    Returns:
+        Token to pass to reset_request_now() when the request ends
+    """
+    return _request_now.set(now if now is not None else datetime.now())
+
+
+def reset_request_now(token: Token[datetime | None]) -> None:
+    """Restore the timestamp that was active before set_request_now().
+
+    Args:
+        token: Token returned by set_request_now()
+    """
+    _request_now.reset(token)
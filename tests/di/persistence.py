@@ -32,9 +32,11 @@ class MockPersistenceProvider(PersistenceProvider):
     __is_mock__ = True
 
     @provide(scope=Scope.REQUEST)
-    def get_user_repository(self) -> UserRepository:
+    def get_user_repository(
+        self, invite_repository: InviteRepository
+    ) -> UserRepository:
         """Provide in-memory user repository."""
-        return InMemoryUserRepository()
+        return InMemoryUserRepository(invite_repository=invite_repository)
 
     @provide(scope=Scope.REQUEST)
     def get_user_identity_repository(self) -> UserIdentityRepository:
@@ -52,9 +54,18 @@ class MockPersistenceProvider(PersistenceProvider):
         return InMemoryCommentRepository()
 
     @provide(scope=Scope.REQUEST)
-    def get_vote_repository(self) -> VoteRepository:
+    def get_vote_repository(
+        self,
+        post_repository: PostRepository,
+        comment_repository: CommentRepository,
+        user_repository: UserRepository,
+    ) -> VoteRepository:
         """Provide in-memory vote repository."""
-        return InMemoryVoteRepository()
+        return InMemoryVoteRepository(
+            post_repository=post_repository,
+            comment_repository=comment_repository,
+            user_repository=user_repository,
+        )
 
     @provide(scope=Scope.REQUEST)
     def get_invite_repository(self) -> InviteRepository:
@@ -0,0 +1,40 @@
+"""End-to-end tests for invite endpoints."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from talk.interface.api.app import create_app
+from talk.util.di.container import setup_di
+from tests.di import build_test_container
+
+
+@pytest.fixture
+def client():
+    """Create test client with test container."""
+    app_instance = create_app()
+    test_container = build_test_container()
+    setup_di(app_instance, test_container)
+    return TestClient(app_instance)
+
+
+class TestInviteAuthentication:
+    """End-to-end tests for authentication on invite endpoints."""
+
+    def test_get_invites_without_auth_fails(self, client):
+        """Should return 401 when no auth cookie is sent."""
+        # Act
+        response = client.get("/invites")
+
+        # Assert
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Not authenticated"
+
+    def test_get_invites_with_invalid_token_fails(self, client):
+        """Should return 401 when the auth cookie is not a valid token."""
+        # Act
+        client.cookies.set("auth_token", "not-a-token")
+        response = client.get("/invites")
+
+        # Assert
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Invalid token"
@@ -0,0 +1,59 @@
+"""End-to-end tests for post endpoints."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from talk.interface.api.app import create_app
+from talk.util.di.container import setup_di
+from tests.di import build_test_container
+
+
+@pytest.fixture
+def client():
+    """Create test client with test container."""
+    app_instance = create_app()
+    test_container = build_test_container()
+    setup_di(app_instance, test_container)
+    return TestClient(app_instance)
+
+
+class TestPostAuthentication:
+    """End-to-end tests for authentication on post endpoints."""
+
+    def test_create_post_without_auth_fails(self, client):
+        """Should return 401 when no auth cookie is sent."""
+        # Act
+        response = client.post(
+            "/posts",
+            json={"title": "Title", "tag_names": ["discussion"], "text": "Text"},
+        )
+
+        # Assert
+        assert response.status_code == 401
+        assert response.json() == {"detail": "Not authenticated"}
+
+    def test_update_post_with_invalid_token_fails(self, client):
+        """Should return 401 when the auth cookie is not a valid token."""
+        # Arrange
+        client.cookies.set("auth_token", "not-a-jwt")
+
+        # Act
+        response = client.patch(
+            "/posts/00000000-0000-0000-0000-000000000000", json={"text": "Edited"}
+        )
+
+        # Assert
+        assert response.status_code == 401
+        assert response.json() == {"detail": "Invalid token"}
+
+    def test_list_posts_with_invalid_token_is_anonymous(self, client):
+        """Optional-auth routes should treat an invalid cookie as anonymous."""
+        # Arrange
+        client.cookies.set("auth_token", "not-a-jwt")
+
+        # Act
+        response = client.get("/posts")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["posts"] == []
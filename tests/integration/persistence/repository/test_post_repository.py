@@ -0,0 +1,174 @@
+"""Integration tests for PostgresPostRepository against a real database.
+
+Covers the SQL that the in-memory repository only mirrors, such as the
+generate_unique_slug() plpgsql function and keyset (cursor) pagination.
+"""
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from talk.domain.model import Post, User
+from talk.domain.repository import PostRepository, UserRepository
+from talk.domain.repository.post import PostSortOrder
+from talk.domain.value import PostId, Slug, UserId
+from talk.domain.value.types import Handle, TagName
+from tests.harness import create_env_fixture
+
+# Integration test fixture - real PostgreSQL, mocked external services
+integration_env = create_env_fixture(unmock={"persistence"})
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def clean_database(integration_env):
+    """Clean database before each test."""
+    session = await integration_env.get(AsyncSession)
+    await session.execute(
+        text(
+            "TRUNCATE TABLE comments, votes, posts, invites, user_identities, users CASCADE"
+        )
+    )
+    await session.commit()
+
+    yield
+
+
+async def _save_author(integration_env) -> User:
+    """Save the user that authors every test post."""
+    user_repo = await integration_env.get(UserRepository)
+    return await user_repo.save(
+        User(id=UserId(uuid4()), handle=Handle(root="author.bsky.social"))
+    )
+
+
+async def _save_post(integration_env, author: User, slug: str, **fields) -> Post:
+    """Save a text post with the given slug."""
+    post_repo = await integration_env.get(PostRepository)
+    return await post_repo.save(
+        Post(
+            id=PostId(uuid4()),
+            slug=Slug(slug),
+            tag_names=[TagName("discussion")],
+            author_id=author.id,
+            author_handle=author.handle,
+            title=slug,
+            url=None,
+            text="Test content",
+            **fields,
+        )
+    )
+
+
+class TestGenerateUniqueSlug:
+    """Tests for the generate_unique_slug() SQL function."""
+
+    @pytest.mark.asyncio
+    async def test_free_base_is_returned_unchanged(self, integration_env):
+        """A base slug nobody uses should come back as-is."""
+        # Arrange
+        post_repo = await integration_env.get(PostRepository)
+        author = await _save_author(integration_env)
+        await _save_post(integration_env, author, "other-post")
+
+        # Act
+        slug = await post_repo.generate_unique_slug("new-post")
+
+        # Assert
+        assert slug == "new-post"
+
+    @pytest.mark.asyncio
+    async def test_collisions_get_first_free_suffix(self, integration_env):
+        """Taken slugs should be skipped with -1, -2, ... suffixes."""
+        # Arrange
+        post_repo = await integration_env.get(PostRepository)
+        author = await _save_author(integration_env)
+        await _save_post(integration_env, author, "new-post")
+        await _save_post(integration_env, author, "new-post-1")
+
+        # Act
+        slug = await post_repo.generate_unique_slug("new-post")
+
+        # Assert
+        assert slug == "new-post-2"
+
+    @pytest.mark.asyncio
+    async def test_suffixed_slug_fits_max_len(self, integration_env):
+        """The base should be cut so base + suffix fits in max_len."""
+        # Arrange
+        post_repo = await integration_env.get(PostRepository)
+        author = await _save_author(integration_env)
+        await _save_post(integration_env, author, "abcdef")
+
+        # Act
+        slug = await post_repo.generate_unique_slug("abcdef", max_len=6)
+
+        # Assert
+        assert slug == "abcd-1"
+
+    @pytest.mark.asyncio
+    async def test_truncation_leaves_no_double_hyphen(self, integration_env):
+        """A cut that ends on a hyphen should not produce '--' before the suffix."""
+        # Arrange
+        post_repo = await integration_env.get(PostRepository)
+        author = await _save_author(integration_env)
+        await _save_post(integration_env, author, "abc-de")
+
+        # Act
+        slug = await post_repo.generate_unique_slug("abc-de", max_len=6)
+
+        # Assert
+        assert slug == "abc-1"
+        assert "--" not in slug
+
+
+class TestKeysetPagination:
+    """Tests for find_all(after=...) with the (timestamp, id) row comparison."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sort", [PostSortOrder.RECENT, PostSortOrder.ACTIVE])
+    async def test_pages_across_equal_timestamps(self, integration_env, sort):
+        """Paging through tied timestamps should skip and repeat no post."""
+        # Arrange
+        post_repo = await integration_env.get(PostRepository)
+        author = await _save_author(integration_env)
+        tied = datetime(2024, 1, 1, 12, 0, tzinfo=UTC)
+        saved = []
+        for n in range(7):
+            # Most posts share one timestamp; one older post ends the listing
+            at = tied if n < 6 else tied - timedelta(hours=1)
+            saved.append(
+                await _save_post(
+                    integration_env,
+                    author,
+                    f"post-{n}",
+                    created_at=at,
+                    comments_updated_at=at,
+                )
+            )
+
+        # Act
+        seen = []
+        after = None
+        for _ in range(len(saved) + 1):
+            page = await post_repo.find_all(sort=sort, limit=2, after=after)
+            if not page:
+                break
+            seen.extend(post.id for post in page)
+            last = page[-1]
+            sort_key = (
+                last.created_at
+                if sort == PostSortOrder.RECENT
+                else last.comments_updated_at
+            )
+            after = (sort_key, last.id)
+
+        # Assert
+        assert len(seen) == len(set(seen))
+        assert set(seen) == {post.id for post in saved}
+        assert seen == [
+            post.id for post in await post_repo.find_all(sort=sort, limit=10)
+        ]
@@ -0,0 +1,196 @@
+"""Integration tests for PostgresVoteRepository's single-statement writes.
+
+save_and_bump and delete_and_decrement are written as data-modifying CTEs,
+which the in-memory repository does not exercise, so these run against a
+real PostgreSQL database.
+"""
+
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from talk.domain.error import NotFoundError
+from talk.domain.model import Post, User, Vote
+from talk.domain.repository import PostRepository, UserRepository, VoteRepository
+from talk.domain.value import PostId, UserId, VotableType, VoteId
+from talk.domain.value.types import Handle, TagName
+from tests.conftest import make_slug
+from tests.harness import create_env_fixture
+
+# Integration test fixture - real PostgreSQL, mocked external services
+integration_env = create_env_fixture(unmock={"persistence"})
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def clean_database(integration_env):
+    """Clean database before each test."""
+    session = await integration_env.get(AsyncSession)
+    await session.execute(
+        text(
+            "TRUNCATE TABLE comments, votes, posts, invites, user_identities, users CASCADE"
+        )
+    )
+    await session.commit()
+
+    yield
+
+
+async def _save_user(integration_env, handle: str) -> User:
+    """Save a user with no karma."""
+    user_repo = await integration_env.get(UserRepository)
+    return await user_repo.save(User(id=UserId(uuid4()), handle=Handle(root=handle)))
+
+
+async def _save_post(integration_env, author: User) -> Post:
+    """Save a post at the minimum of 1 point."""
+    post_repo = await integration_env.get(PostRepository)
+    post_id = PostId(uuid4())
+    return await post_repo.save(
+        Post(
+            id=post_id,
+            slug=make_slug("Vote target", post_id),
+            tag_names=[TagName("discussion")],
+            author_id=author.id,
+            author_handle=author.handle,
+            title="Vote target",
+            url=None,
+            text="Test content",
+        )
+    )
+
+
+def _vote(voter: User, votable_id) -> Vote:
+    """Build an upvote on a post."""
+    return Vote(
+        id=VoteId(uuid4()),
+        user_id=voter.id,
+        votable_type=VotableType.POST,
+        votable_id=votable_id,
+    )
+
+
+async def _counters(integration_env, post: Post) -> tuple[int, int]:
+    """Read the post's points and its author's karma from the database."""
+    session = await integration_env.get(AsyncSession)
+    result = await session.execute(
+        text(
+            "SELECT p.points, u.karma FROM posts p "
+            "JOIN users u ON u.id = p.author_id WHERE p.id = :post_id"
+        ),
+        {"post_id": post.id},
+    )
+    row = result.one()
+    return row.points, row.karma
+
+
+class TestSaveAndBump:
+    """Tests for PostgresVoteRepository.save_and_bump."""
+
+    @pytest.mark.asyncio
+    async def test_first_vote_bumps_points_and_karma(self, integration_env):
+        """A first vote should be stored and bump points and author karma."""
+        # Arrange
+        vote_repo = await integration_env.get(VoteRepository)
+        author = await _save_user(integration_env, "author.bsky.social")
+        voter = await _save_user(integration_env, "voter.bsky.social")
+        post = await _save_post(integration_env, author)
+
+        # Act
+        saved = await vote_repo.save_and_bump(_vote(voter, post.id))
+
+        # Assert
+        assert saved is not None
+        assert saved.created_at is not None
+        assert await _counters(integration_env, post) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_duplicate_vote_changes_nothing(self, integration_env):
+        """A second vote by the same user should return None and bump nothing."""
+        # Arrange
+        vote_repo = await integration_env.get(VoteRepository)
+        author = await _save_user(integration_env, "author.bsky.social")
+        voter = await _save_user(integration_env, "voter.bsky.social")
+        post = await _save_post(integration_env, author)
+        await vote_repo.save_and_bump(_vote(voter, post.id))
+
+        # Act
+        duplicate = await vote_repo.save_and_bump(_vote(voter, post.id))
+
+        # Assert
+        assert duplicate is None
+        assert await _counters(integration_env, post) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_missing_target_raises_not_found(self, integration_env):
+        """Voting on a post that does not exist should raise NotFoundError."""
+        # Arrange
+        vote_repo = await integration_env.get(VoteRepository)
+        voter = await _save_user(integration_env, "voter.bsky.social")
+
+        # Act & Assert
+        with pytest.raises(NotFoundError):
+            await vote_repo.save_and_bump(_vote(voter, PostId(uuid4())))
+
+
+class TestDeleteAndDecrement:
+    """Tests for PostgresVoteRepository.delete_and_decrement."""
+
+    @pytest.mark.asyncio
+    async def test_removing_vote_undoes_bump(self, integration_env):
+        """Removing a vote should undo its points and karma."""
+        # Arrange
+        vote_repo = await integration_env.get(VoteRepository)
+        author = await _save_user(integration_env, "author.bsky.social")
+        voter = await _save_user(integration_env, "voter.bsky.social")
+        post = await _save_post(integration_env, author)
+        await vote_repo.save_and_bump(_vote(voter, post.id))
+
+        # Act
+        deleted = await vote_repo.delete_and_decrement(
+            voter.id, VotableType.POST, post.id
+        )
+
+        # Assert
+        assert deleted is True
+        assert await _counters(integration_env, post) == (1, 0)
+
+    @pytest.mark.asyncio
+    async def test_removing_vote_respects_floors(self, integration_env):
+        """Points should not drop below 1 nor karma below 0."""
+        # Arrange
+        vote_repo = await integration_env.get(VoteRepository)
+        author = await _save_user(integration_env, "author.bsky.social")
+        voter = await _save_user(integration_env, "voter.bsky.social")
+        post = await _save_post(integration_env, author)
+        # A plain save stores the vote without bumping the counters
+        await vote_repo.save(_vote(voter, post.id))
+
+        # Act
+        deleted = await vote_repo.delete_and_decrement(
+            voter.id, VotableType.POST, post.id
+        )
+
+        # Assert
+        assert deleted is True
+        assert await _counters(integration_env, post) == (1, 0)
+
+    @pytest.mark.asyncio
+    async def test_removing_missing_vote_returns_false(self, integration_env):
+        """Removing a vote that does not exist should change nothing."""
+        # Arrange
+        vote_repo = await integration_env.get(VoteRepository)
+        author = await _save_user(integration_env, "author.bsky.social")
+        voter = await _save_user(integration_env, "voter.bsky.social")
+        post = await _save_post(integration_env, author)
+
+        # Act
+        deleted = await vote_repo.delete_and_decrement(
+            voter.id, VotableType.POST, post.id
+        )
+
+        # Assert
+        assert deleted is False
+        assert await _counters(integration_env, post) == (1, 0)
@@ -0,0 +1,150 @@
+"""Unit tests for ListPostsUseCase."""
+
+import json
+import warnings
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from talk.application.usecase.post import ListPostsRequest, ListPostsUseCase
+from talk.domain.model.post import Post
+from talk.domain.repository.post import PostSortOrder
+from talk.domain.value import PostId, UserId
+from talk.domain.value.types import Handle, TagName
+from talk.persistence.repository.post import PostRepository
+from tests.conftest import make_slug
+from tests.harness import create_env_fixture
+
+# Unit test fixture
+unit_env = create_env_fixture()
+
+
+async def _save_posts(post_repo, count: int, same_time: bool = False) -> list[Post]:
+    """Save count posts, newest first when ordered by created_at."""
+    start = datetime(2024, 1, 1, 12, 0, 0)
+    posts = []
+    for n in range(count):
+        post_id = PostId(uuid4())
+        created_at = start if same_time else start - timedelta(minutes=n)
+        posts.append(
+            await post_repo.save(
+                Post(
+                    id=post_id,
+                    slug=make_slug(f"Post {n}", post_id),
+                    tag_names=[TagName("discussion")],
+                    author_id=UserId(uuid4()),
+                    author_handle=Handle(root="author.bsky.social"),
+                    title=f"Post {n}",
+                    url=None,
+                    text="Test content",
+                    created_at=created_at,
+                    comments_updated_at=created_at,
+                    content_updated_at=created_at,
+                )
+            )
+        )
+    return posts
+
+
+class TestListPosts:
+    """Tests for the list response."""
+
+    @pytest.mark.asyncio
+    async def test_items_serialize_without_warnings(self, unit_env):
+        """Unvalidated list items should still render clean JSON."""
+        # Arrange
+        use_case = await unit_env.get(ListPostsUseCase)
+        post_repo = await unit_env.get(PostRepository)
+        posts = await _save_posts(post_repo, 2)
+
+        # Act
+        result = await use_case.execute(ListPostsRequest(limit=1))
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            body = json.loads(result.model_dump_json())
+
+        # Assert
+        item = body["posts"][0]
+        assert item["post_id"] == str(posts[0].id)
+        assert item["author_handle"] == "author.bsky.social"
+        assert item["tag_names"] == ["discussion"]
+        assert item["created_at"] == "2024-01-01T12:00:00"
+
+
+class TestCursorPagination:
+    """Tests for cursor (keyset) pagination."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("same_time", [False, True])
+    async def test_cursor_pages_cover_every_post_once(self, unit_env, same_time):
+        """Following next_cursor should visit each post exactly once."""
+        # Arrange
+        use_case = await unit_env.get(ListPostsUseCase)
+        post_repo = await unit_env.get(PostRepository)
+        posts = await _save_posts(post_repo, 5, same_time=same_time)
+
+        # Act
+        seen: list[str] = []
+        cursor = None
+        for _ in range(5):
+            page = await use_case.execute(ListPostsRequest(limit=2, cursor=cursor))
+            seen.extend(item.post_id for item in page.posts)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        # Assert
+        assert sorted(seen) == sorted(str(post.id) for post in posts)
+        assert len(seen) == len(set(seen))
+        assert cursor is None
+
+    @pytest.mark.asyncio
+    async def test_cursor_page_matches_offset_page(self, unit_env):
+        """The second cursor page should equal the second offset page."""
+        # Arrange
+        use_case = await unit_env.get(ListPostsUseCase)
+        post_repo = await unit_env.get(PostRepository)
+        await _save_posts(post_repo, 4)
+        first = await use_case.execute(ListPostsRequest(limit=2))
+
+        # Act
+        by_cursor = await use_case.execute(
+            ListPostsRequest(limit=2, cursor=first.next_cursor)
+        )
+        by_offset = await use_case.execute(ListPostsRequest(limit=2, offset=2))
+
+        # Assert
+        assert by_cursor.posts == by_offset.posts
+
+    @pytest.mark.asyncio
+    async def test_hot_sort_has_no_cursor(self, unit_env):
+        """Hot sort should keep offset paging and reject cursors."""
+        # Arrange
+        use_case = await unit_env.get(ListPostsUseCase)
+        post_repo = await unit_env.get(PostRepository)
+        await _save_posts(post_repo, 3)
+        recent = await use_case.execute(ListPostsRequest(limit=2))
+
+        # Act
+        hot = await use_case.execute(ListPostsRequest(sort=PostSortOrder.HOT, limit=2))
+
+        # Assert
+        assert hot.next_cursor is None
+        with pytest.raises(ValueError, match="not supported for hot sort"):
+            await use_case.execute(
+                ListPostsRequest(
+                    sort=PostSortOrder.HOT, limit=2, cursor=recent.next_cursor
+                )
+            )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "", "bm9wZQ"])
+    async def test_malformed_cursor_is_rejected(self, unit_env, cursor):
+        """Malformed cursors should raise ValueError (400 at the API)."""
+        # Arrange
+        use_case = await unit_env.get(ListPostsUseCase)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            await use_case.execute(ListPostsRequest(cursor=cursor))
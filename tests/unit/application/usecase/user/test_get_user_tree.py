@@ -22,9 +22,9 @@ class TestGetUserTreeUseCase:
     async def test_returns_tree_structure(self):
         """Should return tree structure with roots and total count."""
         # Arrange
-        user_repo = InMemoryUserRepository()
         invite_repo = InMemoryInviteRepository()
-        user_service = UserService(user_repo, invite_repo)
+        user_repo = InMemoryUserRepository(invite_repository=invite_repo)
+        user_service = UserService(user_repo)
         use_case = GetUserTreeUseCase(user_service)
 
         parent = User(id=UserId(uuid4()), handle=Handle("parent"), karma=100)
@@ -60,9 +60,9 @@ class TestGetUserTreeUseCase:
     async def test_converts_domain_model_to_response(self):
         """Should convert domain UserTreeNode to response model."""
         # Arrange
-        user_repo = InMemoryUserRepository()
         invite_repo = InMemoryInviteRepository()
-        user_service = UserService(user_repo, invite_repo)
+        user_repo = InMemoryUserRepository(invite_repository=invite_repo)
+        user_service = UserService(user_repo)
         use_case = GetUserTreeUseCase(user_service)
 
         user = User(id=UserId(uuid4()), handle=Handle("test.user"), karma=42)
@@ -81,9 +81,9 @@ class TestGetUserTreeUseCase:
     async def test_counts_total_users_recursively(self):
         """Should count total users across entire tree."""
         # Arrange
-        user_repo = InMemoryUserRepository()
         invite_repo = InMemoryInviteRepository()
-        user_service = UserService(user_repo, invite_repo)
+        user_repo = InMemoryUserRepository(invite_repository=invite_repo)
+        user_service = UserService(user_repo)
         use_case = GetUserTreeUseCase(user_service)
 
         # Create tree: root -> child -> grandchild
@@ -128,9 +128,9 @@ class TestGetUserTreeUseCase:
     async def test_respects_include_karma_parameter(self):
         """Should pass through include_karma parameter to service."""
         # Arrange
-        user_repo = InMemoryUserRepository()
         invite_repo = InMemoryInviteRepository()
-        user_service = UserService(user_repo, invite_repo)
+        user_repo = InMemoryUserRepository(invite_repository=invite_repo)
+        user_service = UserService(user_repo)
         use_case = GetUserTreeUseCase(user_service)
 
         user = User(id=UserId(uuid4()), handle=Handle("user"), karma=100)
@@ -146,9 +146,9 @@ class TestGetUserTreeUseCase:
     async def test_empty_tree(self):
         """Should handle empty tree gracefully."""
         # Arrange
-        user_repo = InMemoryUserRepository()
         invite_repo = InMemoryInviteRepository()
-        user_service = UserService(user_repo, invite_repo)
+        user_repo = InMemoryUserRepository(invite_repository=invite_repo)
+        user_service = UserService(user_repo)
         use_case = GetUserTreeUseCase(user_service)
 
         # Act
@@ -162,9 +162,9 @@ class TestGetUserTreeUseCase:
     async def test_multiple_roots(self):
         """Should handle multiple root users."""
         # Arrange
-        user_repo = InMemoryUserRepository()
         invite_repo = InMemoryInviteRepository()
-        user_service = UserService(user_repo, invite_repo)
+        user_repo = InMemoryUserRepository(invite_repository=invite_repo)
+        user_service = UserService(user_repo)
         use_case = GetUserTreeUseCase(user_service)
 
         root1 = User(id=UserId(uuid4()), handle=Handle("root1"), karma=100)
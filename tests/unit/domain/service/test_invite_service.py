@@ -8,6 +8,7 @@ import pytest
 from talk.domain.service import InviteService
 from talk.domain.value import AuthProvider, InviteId, InviteStatus, InviteToken, UserId
 from talk.persistence.repository.invite import InviteRepository
+from talk.util.time import reset_request_now, set_request_now
 from tests.harness import create_env_fixture
 
 # Unit test fixture - everything mocked, no docker needed
@@ -201,6 +202,66 @@ class TestAcceptInvite:
         result = await invite_service.accept_invite(invite.id, second_user_id)
         assert result.accepted_by_user_id == second_user_id
 
+    @pytest.mark.asyncio
+    async def test_create_and_accept_share_request_timestamp(self, unit_env):
+        """Invites created and accepted in one request share its timestamp."""
+        # Arrange
+        invite_service = await unit_env.get(InviteService)
+        pinned = datetime(2025, 1, 1, 12, 0, 0)
+        token = set_request_now(pinned)
+
+        try:
+            # Act
+            invite = await invite_service.create_invite(
+                UserId(uuid4()),
+                AuthProvider.BLUESKY,
+                "pinned.bsky.social",
+                "did:plc:pinned123",
+                None,
+                InviteToken(str(uuid4())),
+            )
+            result = await invite_service.accept_invite(invite.id, UserId(uuid4()))
+        finally:
+            reset_request_now(token)
+
+        # Assert
+        assert invite.created_at == pinned
+        assert result.accepted_at == pinned
+
+    @pytest.mark.asyncio
+    async def test_accept_invite_reuses_invite_found_in_request(self, unit_env):
+        """Accepting an invite found earlier in the request skips the reload."""
+        # Arrange
+        invite_service = await unit_env.get(InviteService)
+        invite_repo = await unit_env.get(InviteRepository)
+        invitee_did = "did:plc:cached123"
+
+        await invite_service.create_invite(
+            UserId(uuid4()),
+            AuthProvider.BLUESKY,
+            "cached.bsky.social",
+            invitee_did,
+            None,
+            InviteToken(str(uuid4())),
+        )
+        invite = await invite_service.find_pending_by_provider_identity(
+            AuthProvider.BLUESKY, invitee_did
+        )
+        assert invite is not None
+
+        async def fail_find_by_id(invite_id):
+            raise AssertionError("invite should come from the request cache")
+
+        invite_repo.find_by_id = fail_find_by_id
+
+        # Act
+        await invite_service.accept_invite(invite.id, UserId(uuid4()))
+
+        # Assert - cached pending state is invalidated by the acceptance
+        assert not await invite_service.check_invite_exists(
+            AuthProvider.BLUESKY, invitee_did
+        )
+
 
 class TestCheckInviteExists:
     """Tests for check_invite_exists method."""
@@ -0,0 +1,66 @@
+"""Unit tests for JWTService."""
+
+import pytest
+
+from talk.config import AuthSettings
+from talk.domain.service import JWTService, VerifiedTokenCache
+from talk.domain.service import jwt_service as jwt_service_module
+from talk.util.jwt import JWTError
+
+SETTINGS = AuthSettings(jwt_secret="unit-test-secret-that-is-long-enough")
+
+
+class TestVerifiedTokenCache:
+    """Tests for caching in JWTService.verify_token()."""
+
+    def test_repeat_verification_is_served_from_cache(self, monkeypatch):
+        """Should verify a token's signature only once."""
+        # Arrange
+        service = JWTService(SETTINGS, token_cache=VerifiedTokenCache())
+        token = service.create_token("user-1", "did:plc:abc", "alice.bsky.social")
+        first = service.verify_token(token)
+
+        def fail_verify(token, settings):
+            raise AssertionError("token should come from the cache")
+
+        monkeypatch.setattr(jwt_service_module, "verify_token", fail_verify)
+
+        # Act
+        again = service.verify_token(token)
+
+        # Assert
+        assert again is first
+
+    def test_invalid_token_is_not_cached(self):
+        """Should reject an invalid token on every attempt."""
+        # Arrange
+        cache = VerifiedTokenCache()
+        service = JWTService(SETTINGS, token_cache=cache)
+
+        # Act & Assert
+        for _ in range(2):
+            with pytest.raises(JWTError):
+                service.verify_token("not-a-token")
+        assert len(cache) == 0
+
+    def test_expired_cached_payload_is_verified_again(self, monkeypatch):
+        """Should not serve a cached payload past the token's own expiry."""
+        # Arrange
+        service = JWTService(SETTINGS, token_cache=VerifiedTokenCache())
+        token = service.create_token("user-1", "did:plc:abc", "alice.bsky.social")
+        payload = service.verify_token(token)
+        calls = []
+
+        def counting_verify(token, settings):
+            calls.append(token)
+            return payload
+
+        monkeypatch.setattr(jwt_service_module, "verify_token", counting_verify)
+        after_expiry = payload.exp.timestamp() + 1
+        monkeypatch.setattr(jwt_service_module.time, "time", lambda: after_expiry)
+
+        # Act
+        service.verify_token(token)
+
+        # Assert
+        assert calls == [token]
@@ -1,5 +1,6 @@
 """Unit tests for PostService."""
 
+import asyncio
 from datetime import datetime
 from uuid import uuid4
 
@@ -7,7 +8,7 @@ import pytest
 
 from talk.domain.model.post import Post
 from talk.domain.service import PostService
-from talk.domain.value import PostId, UserId
+from talk.domain.value import PostId, Slug, UserId
 from talk.domain.value.types import Handle, TagName
 from talk.persistence.repository.post import PostRepository
 from tests.conftest import make_slug
@@ -49,13 +50,9 @@ class TestIncrementCommentCount:
         await post_repo.save(post)
 
         # Act
-        result = await post_service.increment_comment_count(post_id)
+        await post_service.increment_comment_count(post_id)
 
         # Assert
-        assert result.comment_count == 6
-        assert result.comments_updated_at > original_time
-
-        # Verify it was saved
         saved_post = await post_repo.find_by_id(post_id)
         assert saved_post.comment_count == 6
         assert saved_post.comments_updated_at > original_time
@@ -73,6 +70,30 @@ class TestIncrementCommentCount:
         with pytest.raises(ValueError, match="Post not found"):
             await post_service.increment_comment_count(post_id)
 
+    @pytest.mark.asyncio
+    async def test_concurrent_increments_are_not_lost(self, unit_env):
+        """Concurrent increments should each be applied without a prior read."""
+        # Arrange
+        post_service = await unit_env.get(PostService)
+        post_repo = await unit_env.get(PostRepository)
+        post = await post_repo.save(_post_with_slug("busy-post"))
+
+        async def fail_find_by_id(post_id):
+            raise AssertionError("increment should not read the post first")
+
+        post_repo.find_by_id = fail_find_by_id
+
+        # Act
+        await asyncio.gather(
+            post_service.increment_comment_count(post.id),
+            post_service.increment_comment_count(post.id),
+        )
+
+        # Assert
+        saved_post = await post_repo.find_by_slug(Slug("busy-post"))
+        assert saved_post is not None
+        assert saved_post.comment_count == post.comment_count + 2
+
 
 class TestUpdateText:
     """Tests for update_text method."""
@@ -165,3 +186,160 @@ class TestUpdateText:
 
         # Assert
         assert result is None
+
+
+def _post_with_slug(slug: str) -> Post:
+    """Build a minimal post occupying the given slug."""
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    return Post(
+        id=PostId(uuid4()),
+        slug=Slug(slug),
+        tag_names=[TagName("discussion")],
+        author_id=UserId(uuid4()),
+        author_handle=Handle(root="author.bsky.social"),
+        title="Taken",
+        url=None,
+        text="Test content",
+        points=1,
+        comment_count=0,
+        created_at=now,
+        comments_updated_at=now,
+        content_updated_at=now,
+        deleted_at=None,
+    )
+
+
+class TestGenerateUniqueSlug:
+    """Tests for generate_unique_slug method."""
+
+    @pytest.mark.asyncio
+    async def test_generate_unique_slug_uses_base_slug_when_free(self, unit_env):
+        """Should return the slugified title when nothing collides."""
+        # Arrange
+        post_service = await unit_env.get(PostService)
+
+        # Act
+        result = await post_service.generate_unique_slug(
+            "Hello, World!", PostId(uuid4())
+        )
+
+        # Assert
+        assert result.root == "hello-world"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("title", "expected"),
+        [
+            (
+                "  CRISPR/Cas9 -- off-target effects?! ",
+                "crispr-cas9-off-target-effects",
+            ),
+            ("Café — Über alles", "caf-ber-alles"),
+        ],
+    )
+    async def test_generate_unique_slug_collapses_invalid_runs(
+        self, unit_env, title, expected
+    ):
+        """ASCII and non-ASCII titles should slugify the same way."""
+        # Arrange
+        post_service = await unit_env.get(PostService)
+
+        # Act
+        result = await post_service.generate_unique_slug(title, PostId(uuid4()))
+
+        # Assert
+        assert result.root == expected
+
+    @pytest.mark.asyncio
+    async def test_generate_unique_slug_picks_first_free_suffix(self, unit_env):
+        """Should skip every taken candidate and use the first free suffix."""
+        # Arrange
+        post_service = await unit_env.get(PostService)
+        post_repo = await unit_env.get(PostRepository)
+        for slug in ["hello-world", "hello-world-1", "hello-world-2"]:
+            await post_repo.save(_post_with_slug(slug))
+
+        # Act
+        result = await post_service.generate_unique_slug("Hello World", PostId(uuid4()))
+
+        # Assert
+        assert result.root == "hello-world-3"
+
+    @pytest.mark.asyncio
+    async def test_generate_unique_slug_handles_long_collision_runs(self, unit_env):
+        """Should keep counting up through a long run of taken suffixes."""
+        # Arrange
+        post_service = await unit_env.get(PostService)
+        post_repo = await unit_env.get(PostRepository)
+        await post_repo.save(_post_with_slug("busy"))
+        for n in range(1, 12):
+            await post_repo.save(_post_with_slug(f"busy-{n}"))
+
+        # Act
+        result = await post_service.generate_unique_slug("Busy", PostId(uuid4()))
+
+        # Assert
+        assert result.root == "busy-12"
+
+
+class TestGetPostsByIds:
+    """Tests for get_posts_by_ids method."""
+
+    @pytest.mark.asyncio
+    async def test_get_posts_by_ids_omits_missing_posts(self, unit_env):
+        """Should return found posts keyed by ID and skip unknown IDs."""
+        # Arrange
+        post_service = await unit_env.get(PostService)
+        post_repo = await unit_env.get(PostRepository)
+        first = await post_repo.save(_post_with_slug("first-post"))
+        second = await post_repo.save(_post_with_slug("second-post"))
+        unknown = PostId(uuid4())
+
+        # Act
+        result = await post_service.get_posts_by_ids([second.id, unknown, first.id])
+
+        # Assert
+        assert result == {first.id: first, second.id: second}
+
+
+class TestPostCache:
+    """Tests for the shared post cache used by PostService."""
+
+    @pytest.mark.asyncio
+    async def test_get_post_by_id_serves_repeat_reads_from_cache(self, unit_env):
+        """A second read should not hit the repository."""
+        # Arrange
+        post_service = await unit_env.get(PostService)
+        post_repo = await unit_env.get(PostRepository)
+        post = await post_repo.save(_post_with_slug("cached-post"))
+        await post_service.get_post_by_id(post.id)
+
+        async def fail_find_by_id(post_id):
+            raise AssertionError("post should come from the cache")
+
+        post_repo.find_by_id = fail_find_by_id
+
+        # Act
+        result = await post_service.get_post_by_id(post.id)
+        by_slug = await post_service.get_post_by_slug(Slug("cached-post"))
+
+        # Assert
+        assert result == post
+        assert by_slug == post
+
+    @pytest.mark.asyncio
+    async def test_update_text_invalidates_cached_post(self, unit_env):
+        """Reads after an update should see the new text."""
+        # Arrange
+        post_service = await unit_env.get(PostService)
+        post_repo = await unit_env.get(PostRepository)
+        post = await post_repo.save(_post_with_slug("edited-post"))
+        await post_service.get_post_by_id(post.id)
+
+        # Act
+        await post_service.update_text(post.id, "Edited content")
+        result = await post_service.get_post_by_id(post.id)
+
+        # Assert
+        assert result is not None
+        assert result.text == "Edited content"
@@ -0,0 +1,90 @@
+"""Unit tests for TagService."""
+
+from uuid import uuid4
+
+import pytest
+
+from talk.domain.model.tag import Tag, TagType
+from talk.domain.service import TagListCache, TagService
+from talk.domain.value.identifiers import TagId
+from talk.domain.value.types import TagName
+from talk.persistence.repository.inmemory.tag import InMemoryTagRepository
+
+
+class _CountingTagRepository(InMemoryTagRepository):
+    """In-memory tag repository that counts listing queries."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.find_all_calls = 0
+
+    async def find_all(self, limit: int = 100, order_by: str = "name") -> list[Tag]:
+        self.find_all_calls += 1
+        return await super().find_all(limit=limit, order_by=order_by)
+
+
+def _tag(name: str) -> Tag:
+    """Build a minimal tag."""
+    return Tag(
+        id=TagId(uuid4()),
+        name=TagName(name),
+        description=f"Posts about {name}",
+        type=TagType.SCIENCE,
+    )
+
+
+class TestTagListCache:
+    """Tests for the shared tag listing cache used by TagService."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_listing_is_served_from_cache(self):
+        """A second identical listing should not reach the repository."""
+        # Arrange
+        repo = _CountingTagRepository()
+        await repo.save(_tag("biology"))
+        service = TagService(repo, tag_list_cache=TagListCache())
+        first = await service.get_all_tags(limit=10, order_by="name")
+
+        # Act
+        second = await service.get_all_tags(limit=10, order_by="name")
+
+        # Assert
+        assert second == first
+        assert repo.find_all_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_clear_forces_reload(self):
+        """Clearing the cache should make the next listing hit the repository."""
+        # Arrange
+        repo = _CountingTagRepository()
+        cache = TagListCache()
+        service = TagService(repo, tag_list_cache=cache)
+        await service.get_all_tags(limit=10, order_by="name")
+        await repo.save(_tag("physics"))
+
+        # Act
+        cache.clear()
+        result = await service.get_all_tags(limit=10, order_by="name")
+
+        # Assert
+        assert [tag.name.root for tag in result] == ["physics"]
+        assert repo.find_all_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_caller_mutation_does_not_reach_cache(self):
+        """Changing a returned listing should not change later listings."""
+        # Arrange
+        repo = _CountingTagRepository()
+        await repo.save(_tag("biology"))
+        service = TagService(repo, tag_list_cache=TagListCache())
+        first = await service.get_all_tags(limit=10, order_by="name")
+
+        # Act
+        first.clear()
+        second = await service.get_all_tags(limit=10, order_by="name")
+        second.append(_tag("physics"))
+        third = await service.get_all_tags(limit=10, order_by="name")
+
+        # Assert
+        assert [tag.name.root for tag in third] == ["biology"]
+        assert repo.find_all_calls == 1
@@ -1,11 +1,13 @@
 """Unit tests for UserService."""
 
+from dataclasses import FrozenInstanceError
 from uuid import uuid4
 
 import pytest
 
+from talk.domain.error import NotFoundError
 from talk.domain.model import Invite, User
-from talk.domain.service import UserService
+from talk.domain.service import InvitationTreeCache, UserService
 from talk.domain.value import AuthProvider, InviteId, InviteStatus, InviteToken, UserId
 from talk.domain.value.types import Handle
 from talk.persistence.repository.inmemory import (
@@ -21,9 +23,9 @@ class TestBuildInvitationTree:
     async def test_build_tree_with_single_root(self):
         """Should build tree with single root user."""
         # Arrange
-        user_repo = InMemoryUserRepository()
         invite_repo = InMemoryInviteRepository()
-        service = UserService(user_repo, invite_repo)
+        user_repo = InMemoryUserRepository(invite_repository=invite_repo)
+        service = UserService(user_repo)
 
         root_user = User(
             id=UserId(uuid4()),
@@ -46,9 +48,9 @@ class TestBuildInvitationTree:
     async def test_build_tree_with_parent_child(self):
         """Should build tree with parent-child relationship."""
         # Arrange
-        user_repo = InMemoryUserRepository()
         invite_repo = InMemoryInviteRepository()
-        service = UserService(user_repo, invite_repo)
+        user_repo = InMemoryUserRepository(invite_repository=invite_repo)
+        service = UserService(user_repo)
 
         parent = User(id=UserId(uuid4()), handle=Handle("parent"), karma=100)
         child = User(id=UserId(uuid4()), handle=Handle("child"), karma=50)
@@ -81,9 +83,9 @@ class TestBuildInvitationTree:
     async def test_build_tree_sorts_children_by_karma(self):
         """Should sort children by karma descending."""
         # Arrange
-        user_repo = InMemoryUserRepository()
         invite_repo = InMemoryInviteRepository()
-        service = UserService(user_repo, invite_repo)
+        user_repo = InMemoryUserRepository(invite_repository=invite_repo)
+        service = UserService(user_repo)
 
         parent = User(id=UserId(uuid4()), handle=Handle("parent"), karma=100)
         child1 = User(id=UserId(uuid4()), handle=Handle("child1"), karma=30)
@@ -123,9 +125,9 @@ class TestBuildInvitationTree:
     async def test_build_tree_with_multiple_roots(self):
         """Should handle multiple root users (no parent)."""
         # Arrange
-        user_repo = InMemoryUserRepository()
         invite_repo = InMemoryInviteRepository()
-        service = UserService(user_repo, invite_repo)
+        user_repo = InMemoryUserRepository(invite_repository=invite_repo)
+        service = UserService(user_repo)
 
         root1 = User(id=UserId(uuid4()), handle=Handle("root1"), karma=100)
         root2 = User(id=UserId(uuid4()), handle=Handle("root2"), karma=150)
@@ -145,9 +147,9 @@ class TestBuildInvitationTree:
     async def test_build_tree_with_deep_hierarchy(self):
         """Should build tree with multiple levels of depth."""
         # Arrange
-        user_repo = InMemoryUserRepository()
         invite_repo = InMemoryInviteRepository()
-        service = UserService(user_repo, invite_repo)
+        user_repo = InMemoryUserRepository(invite_repository=invite_repo)
+        service = UserService(user_repo)
 
         # Create hierarchy: root -> child -> grandchild
         root = User(id=UserId(uuid4()), handle=Handle("root"), karma=100)
@@ -196,9 +198,9 @@ class TestBuildInvitationTree:
     async def test_build_tree_excludes_pending_invites(self):
         """Should only include accepted invites in tree."""
         # Arrange
-        user_repo = InMemoryUserRepository()
         invite_repo = InMemoryInviteRepository()
-        service = UserService(user_repo, invite_repo)
+        user_repo = InMemoryUserRepository(invite_repository=invite_repo)
+        service = UserService(user_repo)
 
         parent = User(id=UserId(uuid4()), handle=Handle("parent"), karma=100)
         child = User(id=UserId(uuid4()), handle=Handle("child"), karma=50)
@@ -228,9 +230,9 @@ class TestBuildInvitationTree:
     async def test_build_tree_without_karma(self):
         """Should build tree without karma when include_karma=False."""
         # Arrange
-        user_repo = InMemoryUserRepository()
         invite_repo = InMemoryInviteRepository()
-        service = UserService(user_repo, invite_repo)
+        user_repo = InMemoryUserRepository(invite_repository=invite_repo)
+        service = UserService(user_repo)
 
         user = User(id=UserId(uuid4()), handle=Handle("user"), karma=100)
         await user_repo.save(user)
@@ -246,12 +248,68 @@ class TestBuildInvitationTree:
     async def test_build_tree_empty_database(self):
         """Should return empty tree for empty database."""
         # Arrange
-        user_repo = InMemoryUserRepository()
         invite_repo = InMemoryInviteRepository()
-        service = UserService(user_repo, invite_repo)
+        user_repo = InMemoryUserRepository(invite_repository=invite_repo)
+        service = UserService(user_repo)
 
         # Act
         tree = await service.build_invitation_tree()
 
         # Assert
         assert tree == []
+
+
+class TestInvitationTreeCache:
+    """Tests for caching in UserService.build_invitation_tree()."""
+
+    @pytest.mark.asyncio
+    async def test_cached_tree_is_reused_until_a_user_joins(self):
+        """Should reuse the cached tree and rebuild once the tree changes."""
+        # Arrange
+        invite_repo = InMemoryInviteRepository()
+        user_repo = InMemoryUserRepository(invite_repository=invite_repo)
+        service = UserService(user_repo, tree_cache=InvitationTreeCache())
+        await user_repo.save(User(id=UserId(uuid4()), handle=Handle("first"), karma=1))
+        first = await service.build_invitation_tree()
+
+        # Act
+        again = await service.build_invitation_tree()
+        await user_repo.save(User(id=UserId(uuid4()), handle=Handle("second"), karma=2))
+        rebuilt = await service.build_invitation_tree()
+
+        # Assert
+        assert again == first
+        assert again[0] is first[0]
+        assert [node.handle.root for node in rebuilt] == ["second", "first"]
+
+    @pytest.mark.asyncio
+    async def test_cached_tree_cannot_be_changed_by_callers(self):
+        """A caller should not be able to alter the tree other requests get."""
+        # Arrange
+        user_repo = InMemoryUserRepository()
+        service = UserService(user_repo, tree_cache=InvitationTreeCache())
+        await user_repo.save(User(id=UserId(uuid4()), handle=Handle("first"), karma=1))
+        tree = await service.build_invitation_tree()
+
+        # Act
+        tree.clear()
+        again = await service.build_invitation_tree()
+
+        # Assert
+        assert [node.handle.root for node in again] == ["first"]
+        with pytest.raises(FrozenInstanceError):
+            again[0].karma = 100  # pyright: ignore[reportAttributeAccessIssue]
+
+
+class TestGetById:
+    """Tests for UserService.get_by_id()."""
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_raises_not_found_for_unknown_user(self):
+        """Should raise NotFoundError when no user has the ID."""
+        # Arrange
+        service = UserService(InMemoryUserRepository())
+
+        # Act & Assert
+        with pytest.raises(NotFoundError, match="User not found"):
+            await service.get_by_id(UserId(uuid4()))
@@ -7,12 +7,14 @@ import pytest
 
 from talk.domain.model.post import Post
 from talk.domain.model.comment import Comment
+from talk.domain.model.user import User
 from talk.domain.service import VoteService
 from talk.domain.value import CommentId, PostId, UserId, VotableType
 from talk.domain.value.types import Handle, TagName
 from talk.persistence.repository.vote import VoteRepository
 from talk.persistence.repository.post import PostRepository
 from talk.persistence.repository.comment import CommentRepository
+from talk.persistence.repository.user import UserRepository
 from tests.conftest import make_slug
 from tests.harness import create_env_fixture
 
@@ -68,6 +70,44 @@ class TestUpvotePost:
         updated_post = await post_repo.find_by_id(post_id)
         assert updated_post.points == 2
 
+    @pytest.mark.asyncio
+    async def test_upvote_post_increments_author_karma(self, unit_env):
+        """Upvoting post should bump the author's karma with the points."""
+        # Arrange
+        vote_service = await unit_env.get(VoteService)
+        post_repo = await unit_env.get(PostRepository)
+        user_repo = await unit_env.get(UserRepository)
+
+        author = await user_repo.save(
+            User(id=UserId(uuid4()), handle=Handle("author.bsky.social"), karma=5)
+        )
+        post_id = PostId(uuid4())
+        post = Post(
+            id=post_id,
+            slug=make_slug("Test Post", post_id),
+            tag_names=[TagName("discussion")],
+            author_id=author.id,
+            author_handle=author.handle,
+            title="Test Post",
+            url=None,
+            text="Test content",
+            points=1,
+            comment_count=0,
+            created_at=datetime.now(),
+            comments_updated_at=datetime.now(),
+            content_updated_at=datetime.now(),
+            deleted_at=None,
+        )
+        await post_repo.save(post)
+
+        # Act
+        await vote_service.upvote_post(post_id, UserId(uuid4()))
+
+        # Assert
+        updated_author = await user_repo.find_by_id(author.id)
+        assert updated_author is not None
+        assert updated_author.karma == 6
+
     @pytest.mark.asyncio
     async def test_upvote_post_with_nonexistent_post_raises_error(self, unit_env):
         """Upvoting non-existent post should raise error."""
@@ -115,6 +155,11 @@ class TestUpvotePost:
         with pytest.raises(ValueError, match="Already voted"):
             await vote_service.upvote_post(post_id, user_id)
 
+        # The duplicate must not count towards the post's points
+        saved_post = await post_repo.find_by_id(post_id)
+        assert saved_post is not None
+        assert saved_post.points == 2
+
 
 class TestUpvoteComment:
     """Tests for upvote_comment method."""
@@ -204,6 +249,46 @@ class TestRemoveVote:
         updated_post = await post_repo.find_by_id(post_id)
         assert updated_post.points == 1
 
+    @pytest.mark.asyncio
+    async def test_remove_vote_from_post_restores_author_karma(self, unit_env):
+        """Removing vote should take back the author's karma."""
+        # Arrange
+        vote_service = await unit_env.get(VoteService)
+        post_repo = await unit_env.get(PostRepository)
+        user_repo = await unit_env.get(UserRepository)
+
+        author = await user_repo.save(
+            User(id=UserId(uuid4()), handle=Handle("author.bsky.social"), karma=5)
+        )
+        post_id = PostId(uuid4())
+        user_id = UserId(uuid4())
+        post = Post(
+            id=post_id,
+            slug=make_slug("Test Post", post_id),
+            tag_names=[TagName("discussion")],
+            author_id=author.id,
+            author_handle=author.handle,
+            title="Test Post",
+            url=None,
+            text="Test content",
+            points=1,
+            comment_count=0,
+            created_at=datetime.now(),
+            comments_updated_at=datetime.now(),
+            content_updated_at=datetime.now(),
+            deleted_at=None,
+        )
+        await post_repo.save(post)
+        await vote_service.upvote_post(post_id, user_id)
+
+        # Act
+        await vote_service.remove_vote_from_post(post_id, user_id)
+
+        # Assert
+        updated_author = await user_repo.find_by_id(author.id)
+        assert updated_author is not None
+        assert updated_author.karma == 5
+
     @pytest.mark.asyncio
     async def test_remove_vote_from_post_returns_false_when_no_vote(self, unit_env):
         """Removing non-existent vote should return False and not decrement."""
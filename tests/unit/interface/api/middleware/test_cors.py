@@ -0,0 +1,153 @@
+"""Unit tests for CORS middleware."""
+
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from talk.interface.api.app import create_app
+from talk.interface.api.middleware import CORSMiddleware
+
+ORIGIN = "https://talk.example.com"
+
+
+def _client(calls: list[str]) -> TestClient:
+    """Build a test client for an app wrapped in the CORS middleware."""
+
+    async def endpoint(request):
+        calls.append(request.method)
+        return PlainTextResponse("ok")
+
+    app = Starlette(routes=[Route("/", endpoint, methods=["GET", "POST", "OPTIONS"])])
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=[ORIGIN],
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "OPTIONS"],
+        allow_headers=["Authorization", "Content-Type"],
+        expose_headers=["Content-Length"],
+        max_age=600,
+    )
+    return TestClient(app)
+
+
+class TestPreflight:
+    """Tests for preflight (OPTIONS) handling."""
+
+    def test_allowed_preflight_is_answered_without_calling_app(self):
+        """Allowed preflights should get CORS headers and skip the app."""
+        # Arrange
+        calls: list[str] = []
+        client = _client(calls)
+
+        # Act
+        response = client.options(
+            "/",
+            headers={
+                "Origin": ORIGIN,
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "authorization, content-type",
+            },
+        )
+
+        # Assert
+        assert response.status_code == 204
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert response.headers["access-control-allow-methods"] == "GET, POST, OPTIONS"
+        assert response.headers["access-control-max-age"] == "600"
+        assert calls == []
+
+    def test_disallowed_origin_is_rejected(self):
+        """Preflights from unknown origins should fail without CORS headers."""
+        # Arrange
+        client = _client([])
+
+        # Act
+        response = client.options(
+            "/",
+            headers={
+                "Origin": "https://evil.example.com",
+                "Access-Control-Request-Method": "POST",
+            },
+        )
+
+        # Assert
+        assert response.status_code == 400
+        assert response.text == "Disallowed CORS origin"
+        assert "access-control-allow-origin" not in response.headers
+
+    def test_disallowed_header_is_rejected(self):
+        """Preflights asking for unlisted headers should fail."""
+        # Arrange
+        client = _client([])
+
+        # Act
+        response = client.options(
+            "/",
+            headers={
+                "Origin": ORIGIN,
+                "Access-Control-Request-Method": "GET",
+                "Access-Control-Request-Headers": "x-custom",
+            },
+        )
+
+        # Assert
+        assert response.status_code == 400
+        assert response.text == "Disallowed CORS headers"
+
+
+class TestSimpleRequest:
+    """Tests for CORS headers on regular requests."""
+
+    def test_allowed_origin_gets_cors_headers(self):
+        """Responses to allowed origins should carry CORS headers."""
+        # Arrange
+        client = _client([])
+
+        # Act
+        response = client.get("/", headers={"Origin": ORIGIN})
+
+        # Assert
+        assert response.text == "ok"
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert response.headers["access-control-expose-headers"] == "Content-Length"
+        assert response.headers["vary"] == "Origin"
+
+    def test_unknown_origin_gets_no_cors_headers(self):
+        """Responses to unknown origins should be left untouched."""
+        # Arrange
+        client = _client([])
+
+        # Act
+        response = client.get("/", headers={"Origin": "https://evil.example.com"})
+
+        # Assert
+        assert response.text == "ok"
+        assert "access-control-allow-origin" not in response.headers
+
+    def test_options_without_preflight_headers_reaches_app(self):
+        """A plain OPTIONS request is not a preflight and goes to the app."""
+        # Arrange
+        calls: list[str] = []
+        client = _client(calls)
+
+        # Act
+        response = client.options("/", headers={"Origin": ORIGIN})
+
+        # Assert
+        assert response.status_code == 200
+        assert calls == ["OPTIONS"]
+
+
+class TestAppWiring:
+    """Tests for where the CORS middleware sits in the app."""
+
+    def test_cors_is_outermost_user_middleware(self):
+        """CORS should wrap DI so preflights never open a container scope."""
+        # Act
+        app = create_app()
+
+        # Assert
+        assert app.user_middleware[0].cls is CORSMiddleware
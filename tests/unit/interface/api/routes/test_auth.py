@@ -0,0 +1,66 @@
+"""Unit tests for authentication route helpers."""
+
+import pytest
+from starlette.responses import Response
+
+from talk.config import Settings
+from talk.interface.api.routes.auth import _cookie_params, _error_redirect
+
+
+class TestCookieParams:
+    """Tests for _cookie_params function."""
+
+    @pytest.mark.parametrize("environment", ["production", "development"])
+    def test_set_cookie_suffix_matches_starlette(self, environment):
+        """Prebuilt Set-Cookie header should equal Starlette's set_cookie output."""
+        # Arrange
+        cookie = _cookie_params(environment, 7)
+        response = Response()
+        response.set_cookie(
+            key="auth_token",
+            value="header.payload.signature",
+            httponly=True,
+            secure=cookie.secure,
+            samesite=cookie.samesite,
+            domain=cookie.domain,
+            path="/",
+            max_age=cookie.max_age,
+        )
+
+        # Act
+        header = f"auth_token=header.payload.signature{cookie.set_cookie_suffix}"
+
+        # Assert
+        assert response.headers["set-cookie"] == header
+
+    def test_production_cookie_is_cross_site(self):
+        """Production cookies should be shared across subdomains over HTTPS."""
+        # Act
+        cookie = _cookie_params("production", 7)
+
+        # Assert
+        assert cookie.domain == ".amacrin.com"
+        assert cookie.secure is True
+        assert cookie.samesite == "none"
+        assert cookie.max_age == 7 * 24 * 60 * 60
+
+
+class TestErrorRedirect:
+    """Tests for _error_redirect function."""
+
+    def test_message_is_url_encoded(self):
+        """Exception messages should not be able to add query parameters."""
+        # Arrange
+        settings = Settings(host="talk.example.com", environment="production")
+
+        # Act
+        response = _error_redirect(
+            settings, "no_invite", ValueError("No invite & admin=1")
+        )
+
+        # Assert
+        location = response.headers["location"]
+        assert location == (
+            f"{settings.api.frontend_url}/auth/error"
+            "?error=no_invite&message=No+invite+%26+admin%3D1"
+        )
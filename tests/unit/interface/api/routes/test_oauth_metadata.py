@@ -1,19 +1,31 @@
 """Unit tests for OAuth metadata endpoint."""
 
+import pytest
+
 from talk.config import Settings
-from talk.interface.api.routes.oauth_metadata import get_oauth_client_metadata
+from talk.interface.api.routes.oauth_metadata import (
+    OAuthClientMetadata,
+    get_oauth_client_metadata,
+)
+
+
+async def _metadata(settings: Settings) -> OAuthClientMetadata:
+    """Call the endpoint and parse the JSON document it serves."""
+    response = await get_oauth_client_metadata(settings)
+    return OAuthClientMetadata.model_validate_json(bytes(response.body))
 
 
 class TestGetOAuthClientMetadata:
     """Tests for get_oauth_client_metadata function."""
 
-    def test_returns_valid_metadata_structure(self):
+    @pytest.mark.asyncio
+    async def test_returns_valid_metadata_structure(self):
         """Should return valid OAuth client metadata."""
         # Arrange
         settings = Settings(host="talk.example.com", environment="production")
 
         # Act
-        metadata = get_oauth_client_metadata(settings)
+        metadata = await _metadata(settings)
 
         # Assert
         assert hasattr(metadata, "client_id")
@@ -28,106 +40,139 @@ class TestGetOAuthClientMetadata:
         assert hasattr(metadata, "application_type")
         assert hasattr(metadata, "dpop_bound_access_tokens")
 
-    def test_client_id_matches_metadata_endpoint(self):
+    @pytest.mark.asyncio
+    async def test_client_id_matches_metadata_endpoint(self):
         """Client ID should be the URL of the metadata endpoint."""
         settings = Settings(host="talk.example.com", environment="production")
 
-        metadata = get_oauth_client_metadata(settings)
+        metadata = await _metadata(settings)
 
         assert (
             metadata.client_id
             == "https://talk.example.com/.well-known/oauth-client-metadata"
         )
 
-    def test_client_name_is_science_talk(self):
+    @pytest.mark.asyncio
+    async def test_client_name_is_science_talk(self):
         """Client name should be Science Talk."""
         settings = Settings()
 
-        metadata = get_oauth_client_metadata(settings)
+        metadata = await _metadata(settings)
 
         assert metadata.client_name == "Science Talk"
 
-    def test_client_uri_matches_base_url(self):
+    @pytest.mark.asyncio
+    async def test_client_uri_matches_base_url(self):
         """Client URI should match base URL."""
         settings = Settings(host="talk.example.com", environment="production")
 
-        metadata = get_oauth_client_metadata(settings)
+        metadata = await _metadata(settings)
 
         assert metadata.client_uri == "https://talk.example.com"
 
-    def test_logo_uri_points_to_amacrin_svg(self):
+    @pytest.mark.asyncio
+    async def test_logo_uri_points_to_amacrin_svg(self):
         """Logo URI should point to amacrin.svg."""
         settings = Settings(host="talk.example.com", environment="production")
 
-        metadata = get_oauth_client_metadata(settings)
+        metadata = await _metadata(settings)
 
         assert metadata.logo_uri == "https://talk.example.com/amacrin.svg"
 
-    def test_redirect_uris_includes_callback(self):
+    @pytest.mark.asyncio
+    async def test_redirect_uris_includes_callback(self):
         """Redirect URIs should include callback endpoint."""
         settings = Settings(host="talk.example.com", environment="production")
 
-        metadata = get_oauth_client_metadata(settings)
+        metadata = await _metadata(settings)
 
         assert metadata.redirect_uris == [
             "https://talk.example.com/auth/callback/bluesky"
         ]
 
-    def test_grant_types_includes_authorization_code(self):
+    @pytest.mark.asyncio
+    async def test_grant_types_includes_authorization_code(self):
         """Grant types should include authorization_code."""
         settings = Settings()
 
-        metadata = get_oauth_client_metadata(settings)
+        metadata = await _metadata(settings)
 
         assert "authorization_code" in metadata.grant_types
 
-    def test_response_types_includes_code(self):
+    @pytest.mark.asyncio
+    async def test_response_types_includes_code(self):
         """Response types should include code."""
         settings = Settings()
 
-        metadata = get_oauth_client_metadata(settings)
+        metadata = await _metadata(settings)
 
         assert "code" in metadata.response_types
 
-    def test_scope_is_atproto(self):
+    @pytest.mark.asyncio
+    async def test_scope_is_atproto(self):
         """Scope should be atproto."""
         settings = Settings()
 
-        metadata = get_oauth_client_metadata(settings)
+        metadata = await _metadata(settings)
 
         assert metadata.scope == "atproto"
 
-    def test_token_endpoint_auth_method_is_none(self):
+    @pytest.mark.asyncio
+    async def test_token_endpoint_auth_method_is_none(self):
         """Token endpoint auth method should be none (public client)."""
         settings = Settings()
 
-        metadata = get_oauth_client_metadata(settings)
+        metadata = await _metadata(settings)
 
         assert metadata.token_endpoint_auth_method == "none"
 
-    def test_application_type_is_web(self):
+    @pytest.mark.asyncio
+    async def test_application_type_is_web(self):
         """Application type should be web."""
         settings = Settings()
 
-        metadata = get_oauth_client_metadata(settings)
+        metadata = await _metadata(settings)
 
         assert metadata.application_type == "web"
 
-    def test_dpop_bound_access_tokens_is_true(self):
+    @pytest.mark.asyncio
+    async def test_dpop_bound_access_tokens_is_true(self):
         """DPoP bound access tokens must be true per AT Protocol spec."""
         settings = Settings()
 
-        metadata = get_oauth_client_metadata(settings)
+        metadata = await _metadata(settings)
 
         assert metadata.dpop_bound_access_tokens is True
 
-    def test_uses_localhost_in_development(self):
+    @pytest.mark.asyncio
+    async def test_uses_localhost_in_development(self):
         """Should use localhost base URL in development."""
         settings = Settings()
         # Default base_url is http://localhost:8000
 
-        metadata = get_oauth_client_metadata(settings)
+        metadata = await _metadata(settings)
 
         assert "localhost" in metadata.client_id
         assert "localhost" in metadata.client_uri
         assert all("localhost" in uri for uri in metadata.redirect_uris)
+
+    @pytest.mark.asyncio
+    async def test_response_is_cacheable_json(self):
+        """The document should be served as cacheable JSON."""
+        settings = Settings(host="talk.example.com", environment="production")
+
+        response = await get_oauth_client_metadata(settings)
+
+        assert response.media_type == "application/json"
+        assert response.headers["cache-control"] == "public, max-age=3600"
+
+    @pytest.mark.asyncio
+    async def test_document_follows_settings(self):
+        """Different settings should never get a cached document."""
+        production = Settings(host="talk.example.com", environment="production")
+
+        first = await _metadata(production)
+        second = await _metadata(Settings())
+
+        assert first.client_uri == "https://talk.example.com"
+        assert "localhost" in second.client_uri
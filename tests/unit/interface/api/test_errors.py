@@ -0,0 +1,75 @@
+"""Unit tests for the app-wide domain error handlers."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from talk.domain.error import (
+    ContentDeletedException,
+    InvalidEditOperationError,
+    NotAuthorizedError,
+    NotFoundError,
+)
+from talk.interface.api.errors import register_exception_handlers
+from talk.util.jwt import JWTError
+
+
+def _client(exc: Exception) -> TestClient:
+    """Build a test client for an app whose only route raises exc."""
+    app = FastAPI()
+    register_exception_handlers(app)
+
+    @app.get("/")
+    async def endpoint():
+        raise exc
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+class TestExceptionHandlers:
+    """Tests for register_exception_handlers."""
+
+    @pytest.mark.parametrize(
+        ("exc", "status_code", "detail"),
+        [
+            (JWTError("Token has expired"), 401, "Token has expired"),
+            (
+                NotAuthorizedError("comment", "c1", "u1"),
+                403,
+                "Not authorized to edit this comment",
+            ),
+            (
+                ContentDeletedException("post", "p1"),
+                404,
+                "Post not found or has been deleted",
+            ),
+            (
+                InvalidEditOperationError("Cannot edit text on URL-based posts"),
+                422,
+                "Cannot edit text on URL-based posts",
+            ),
+            (NotFoundError("User", "u1"), 404, "User not found: u1"),
+        ],
+    )
+    def test_domain_error_maps_to_status(self, exc, status_code, detail):
+        """Domain errors should become JSON error responses."""
+        # Arrange
+        client = _client(exc)
+
+        # Act
+        response = client.get("/")
+
+        # Assert
+        assert response.status_code == status_code
+        assert response.json() == {"detail": detail}
+
+    def test_value_error_is_not_mapped(self):
+        """ValueError should stay a server error unless a route handles it."""
+        # Arrange
+        client = _client(ValueError("boom"))
+
+        # Act
+        response = client.get("/")
+
+        # Assert
+        assert response.status_code == 500
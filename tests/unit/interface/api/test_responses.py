@@ -0,0 +1,119 @@
+"""Unit tests for API response classes."""
+
+import json
+from datetime import UTC, datetime
+from enum import Enum
+from uuid import UUID, uuid4
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+from talk.interface.api.responses import PydanticJSONResponse, cacheable_json_response
+
+
+class _Kind(str, Enum):
+    DISCUSSION = "discussion"
+
+
+class _Item(BaseModel):
+    id: UUID
+    kind: _Kind
+    created_at: datetime
+    text: str | None
+
+
+class _Page(BaseModel):
+    items: list[_Item]
+    total: int
+
+
+class TestPydanticJSONResponse:
+    """Tests for PydanticJSONResponse."""
+
+    def test_model_body_matches_default_encoding(self):
+        """Models should render to the same JSON as FastAPI's default path."""
+        # Arrange
+        page = _Page(
+            items=[
+                _Item(
+                    id=uuid4(),
+                    kind=_Kind.DISCUSSION,
+                    created_at=datetime(2024, 1, 1, 12, 0, tzinfo=UTC),
+                    text=None,
+                )
+            ],
+            total=1,
+        )
+
+        # Act
+        response = PydanticJSONResponse(page, status_code=201)
+
+        # Assert
+        assert response.status_code == 201
+        assert response.headers["content-type"] == "application/json"
+        assert json.loads(bytes(response.body)) == jsonable_encoder(page)
+
+    def test_plain_content_uses_json_rendering(self):
+        """Non-model content should render like JSONResponse."""
+        # Act
+        response = PydanticJSONResponse({"detail": "ok"})
+
+        # Assert
+        assert json.loads(bytes(response.body)) == {"detail": "ok"}
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    """Build a bare GET request, optionally revalidating with an ETag."""
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+class TestCacheableJSONResponse:
+    """Tests for cacheable_json_response."""
+
+    def test_first_request_gets_body_and_cache_headers(self):
+        """A plain request should get the body with ETag and Cache-Control."""
+        # Arrange
+        page = _Page(items=[], total=0)
+
+        # Act
+        response = cacheable_json_response(_request(), page, max_age=60)
+
+        # Assert
+        assert response.status_code == 200
+        assert json.loads(bytes(response.body)) == {"items": [], "total": 0}
+        assert response.headers["cache-control"] == "public, max-age=60"
+        assert response.headers["etag"].startswith('W/"')
+
+    def test_matching_etag_gets_not_modified(self):
+        """Revalidating with the current ETag should get an empty 304."""
+        # Arrange
+        page = _Page(items=[], total=0)
+        etag = cacheable_json_response(_request(), page, max_age=60).headers["etag"]
+
+        # Act
+        response = cacheable_json_response(
+            _request(f'"other", {etag}'), page, max_age=60
+        )
+
+        # Assert
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == etag
+
+    def test_stale_etag_gets_new_body(self):
+        """Revalidating after the content changed should get the new body."""
+        # Arrange
+        old = cacheable_json_response(_request(), _Page(items=[], total=0), max_age=60)
+
+        # Act
+        response = cacheable_json_response(
+            _request(old.headers["etag"]), _Page(items=[], total=1), max_age=60
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["etag"] != old.headers["etag"]